@@ -14,6 +14,10 @@
 #
 #   Map: Implements a map using a dynamic hash table with separate chaining.
 #
+#   hash_codes: Return the hash codes of many Map keys at once.
+#
+#   paused_gc: Context manager disabling the garbage collector.
+#
 #   Queue: Implementation of a queue using a circular dynamic array.
 #
 ###############################################################################
@@ -21,12 +25,14 @@
 
 # %% Imports
 # Standard system imports
-from collections.abc import Hashable
+from contextlib import contextmanager
+import gc
 
 # Related third party imports
 import numpy as np
 
 # Local application/library specific imports
+from interview.robot.instrumentation import COUNTERS
 
 
 # %% Classes
@@ -67,25 +73,39 @@ class Map:
             """Return True if key less than or equal to other key."""
             return self._key <= other._key
 
-    def __init__(self, capacity=11, prime=109345121):
+    __slots__ = ('_hash_table', '_n', '_default_capacity', '_prime',
+                 '_scale', '_shift')
+
+    DEFAULT_PRIME = 109345121
+
+    def __init__(self, capacity=11, prime=DEFAULT_PRIME, scale=None,
+                 shift=None):
         """Initialize an empty hash table of specified capacity.
 
         The default capacity and prime number used for MAD compression are
         optional.  Randomly calculates the scale and shift values for MAD
-        compression.
+        compression, unless they are given.  Drawing them once for many maps
+        is much faster than drawing them for each map.
         """
-        self._hash_table = [[] for _ in range(capacity)]
+        self._hash_table = self._make_table(capacity)
         self._n = 0  # Current length of hash table
         self._default_capacity = capacity
         self._prime = prime  # Large prime used for MAD compression
-        self._scale = np.random.randint(1, self._prime)
-        self._shift = np.random.randint(0, self._prime)
+        if scale is None:
+            scale = np.random.randint(1, self._prime)
+        if shift is None:
+            shift = np.random.randint(0, self._prime)
+        self._scale = scale
+        self._shift = shift
 
     def __getitem__(self, key):
         """Return value associated with requested key.
 
         Raise key error if not found.
         """
+        counters = COUNTERS.get()
+        if counters is not None:        # Counted by instrumentation
+            counters['map_lookups'] += 1
         idx = self._hash_code(key)
         for item in self._hash_table[idx]:
             if key == item._key:
@@ -107,7 +127,10 @@ class Map:
                 item._value = value  # Key exists, overwrite its value
                 return
         self._n += 1  # New key, add new item
-        self._hash_table[idx].append(self._Item(key, value))
+        if self._hash_table[idx]:
+            self._hash_table[idx].append(self._Item(key, value))
+        else:
+            self._hash_table[idx] = [self._Item(key, value)]  # First item
         if self._n > len(self._hash_table) // 2:  # Double capacity of table
             self._resize_table(2 * len(self._hash_table) - 1)
 
@@ -127,6 +150,39 @@ class Map:
                 return
         raise KeyError('Key not found!')
 
+    def reserve(self, count):
+        """Resize the hash table once so that it holds count items.
+
+        Adding up to count items then never resizes the table, which would
+        otherwise be resized repeatedly while it grows.
+        """
+        if count > len(self._hash_table) // 2:
+            self._resize_table(2 * count + 1)
+
+    def insert_new(self, keys, values, codes=None):
+        """Add an item for each of the keys and values, which are iterables.
+
+        The keys must not already be in the map and must be distinct, since
+        the buckets are not searched for them.  The hash codes of all the keys
+        are calculated at once by hash_codes(), unless the list of their codes
+        is given.  The table is resized at most once.
+        """
+        keys = list(keys)
+        if codes is None:
+            codes = hash_codes(keys)
+        with paused_gc():
+            self.reserve(self._n + len(keys))
+            table = self._hash_table
+            p, a, b, N = self._prime, self._scale, self._shift, len(table)
+            for key, value, code in zip(keys, values, codes):
+                # MAD compression of _compression_function(), inlined
+                idx = ((a * code + b) % p) % N
+                if table[idx]:
+                    table[idx].append(self._Item(key, value))
+                else:
+                    table[idx] = [self._Item(key, value)]
+        self._n += len(keys)
+
     def __len__(self):
         """Return length of hash table."""
         return self._n
@@ -142,17 +198,9 @@ class Map:
 
         Raises ValueError if key is not hashable.
         """
-        if not isinstance(key, Hashable):
-            raise TypeError('Invalid key!')
-        if isinstance(key, int):
-            bin_key = bin(key)          # For integer keys
-        elif isinstance(key, str):
-            bin_key = key               # For string keys
-        else:
-            bin_key = bin(hash(key))    # Floats and other hashable types
         mask = (1 << 32) - 1  # All 1s in binary, limit hash code to 32 bits
         hash_code = 0
-        for character in bin_key:
+        for character in _key_string(key):
             hash_code = (hash_code << 5 & mask) | (hash_code >> 27)
             hash_code += ord(character)  # Single-character keys not shifted
         return self._compression_function(hash_code)
@@ -174,8 +222,13 @@ class Map:
             self[key] = value   # Add key-value pairs to resized hash table
 
     def _make_table(self, capacity):
-        """Return a list of empty lists, length equal to requested capacity."""
-        return [[] for _ in range(capacity)]
+        """Return a list of empty buckets, length equal to requested capacity.
+
+        Every empty bucket is the same empty tuple, which is replaced by a
+        list when an item is first added to it, so that the buckets of a
+        sparse table take no memory beyond the table itself.
+        """
+        return [()] * capacity
 
 
 class Queue:
@@ -251,3 +304,64 @@ class Queue:
         for index in range(self._size):
             self._array[index] = old_array[(self._front + index) % old_N]
         self._front = 0  # Copied queue starts at index 0
+
+
+# %% Functions
+def _key_string(key):
+    """Return the string hashed by Map for key.
+
+    Raises TypeError if key is not hashable.
+    """
+    if isinstance(key, int):
+        return bin(key)                 # For integer keys
+    if isinstance(key, str):
+        return key                      # For string keys
+    try:
+        return bin(hash(key))           # Floats and other hashable types
+    except TypeError:
+        raise TypeError('Invalid key!') from None
+
+
+def hash_codes(keys):
+    """Return list of the hash codes of keys before MAD compression.
+
+    The codes are those calculated by Map, but the 5-bit cyclic shift is
+    applied to every key at once with NumPy, one character position at a
+    time.  Used by Map.insert_new() to add many keys without hashing each one
+    in a Python loop.
+    """
+    strings = [_key_string(key) for key in keys]
+    if not strings:
+        return []
+    lengths = np.array([len(string) for string in strings])
+    width = int(lengths.max())
+    if width == 0:
+        return [0] * len(strings)
+    chars = np.array(strings, dtype=f'U{width}').view(np.uint32)
+    chars = chars.reshape(len(strings), width).astype(np.uint64)
+    mask = np.uint64((1 << 32) - 1)
+    codes = np.zeros(len(strings), dtype=np.uint64)
+    for position in range(width):
+        shifted = ((codes << np.uint64(5)) & mask) | (codes >> np.uint64(27))
+        # Strings shorter than position are already hashed
+        codes = np.where(position < lengths, shifted + chars[:, position],
+                         codes)
+    return codes.tolist()
+
+
+@contextmanager
+def paused_gc():
+    """Disable the cyclic garbage collector inside the context.
+
+    Creating millions of objects triggers collections that each scan every
+    object tracked so far, which slows down building a large Map or Graph
+    several times over.  The collector is enabled again on exit if it was
+    enabled.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,101 @@
+"""Batch solver for directories of robot maps.
+
+###############################################################################
+# batch.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Solve many ASCII maps in parallel across a process pool.
+#
+# Contents:
+#
+#   batch_solution: Solve every map in a directory or glob pattern.
+#
+###############################################################################
+
+Each map is solved in a worker process by robot_path.solve_map, which writes
+the _SOLUTION.txt file but does not print to stdout, so the output of the
+workers cannot interleave.  The results are collected into a NumPy structured
+array with one row per map.  A map that cannot be solved, such as a file that
+is unreadable or has no robot or goal, does not stop the batch: its row is
+marked unreachable, with the exception raised recorded in the error column.
+"""
+
+# %% Imports
+# Standard system imports
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+import glob
+import time
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.robot_path import solve_map
+
+
+# %% Summary table
+SUMMARY_DTYPE = np.dtype([('filename', object),     # Path of map file
+                          ('solution', object),     # Path of solution file
+                          ('length', np.float64),   # np.inf if unreachable
+                          ('reachable', np.bool_),  # True if goal reachable
+                          ('seconds', np.float64),  # Wall time of solve
+                          ('error', object)])       # '' unless solve failed
+
+
+# %% Functions
+def batch_solution(source, engine='dijkstra', max_workers=None, legend=None,
+                   diagonal=False):
+    """Solve every map in a directory or glob pattern using a process pool.
+
+    If source is a directory, every .txt file within it is solved.  Otherwise
+    source is treated as a glob pattern.  Existing _SOLUTION.txt files are
+    always skipped.  The max_workers argument sets the number of worker
+    processes; by default it is the number of processors on the machine.
+    The legend and diagonal arguments are passed to solve_map.
+
+    Return a structured array with the filename, solution filename, path
+    length, reachability, wall time in seconds, and error of each map.  The
+    solution filename of a map that could not be solved is None, and its
+    error is the type and message of the exception raised.
+    """
+    filenames = map_files(source)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        rows = list(executor.map(_timed_solve, filenames, repeat(engine),
+                                 repeat(legend), repeat(diagonal)))
+    return np.array(rows, dtype=SUMMARY_DTYPE)
+
+
+def map_files(source):
+    """Return a sorted list of the map files in a directory or glob pattern.
+
+    Solution files ending in _SOLUTION.txt are excluded.
+    """
+    source = Path(source)
+    if source.is_dir():
+        paths = source.glob('*.txt')
+    else:
+        paths = (Path(x) for x in glob.glob(str(source)))
+    return sorted(x for x in paths
+                  if x.is_file() and not x.stem.endswith('_SOLUTION'))
+
+
+def _timed_solve(filename, engine, legend=None, diagonal=False):
+    """Solve a single map in a worker process and return its summary row.
+
+    Exceptions are caught and returned in the row, so that one bad map does
+    not lose the results of the whole batch.
+    """
+    start = time.perf_counter()
+    try:
+        out_fn, length = solve_map(filename, engine, legend, diagonal)
+    except Exception as error:
+        seconds = time.perf_counter() - start
+        return (filename, None, np.inf, False, seconds,
+                f'{type(error).__name__}: {error}')
+    seconds = time.perf_counter() - start
+    return (filename, out_fn, length, length != np.inf, seconds, '')
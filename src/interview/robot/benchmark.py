@@ -0,0 +1,358 @@
+"""Benchmarks comparing the search engines of the robot path solution.
+
+###############################################################################
+# benchmark.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Measure the path length, expansions, and wall time of each
+#               search engine on a set of ASCII maps, how each engine scales
+#               on generated maps of increasing size, and the memory taken by
+#               the graph of a map.
+#
+# Contents:
+#
+#   compare_engines: Run each engine on each map and tabulate the results.
+#
+#   print_results: Print the table returned by compare_engines.
+#
+#   scaling_benchmark: Run each engine on generated maps of each size tier.
+#
+#   save_results: Save the table returned by scaling_benchmark as CSV.
+#
+#   load_results: Load a table saved by save_results.
+#
+#   find_regressions: Compare a scaling table against a saved baseline.
+#
+#   memory_benchmark: Measure the bytes per vertex and per edge of graphs.
+#
+###############################################################################
+
+An expansion is a vertex or cell removed from the priority queue.  For
+Djikstra's algorithm this is the size of the cloud, for the bidirectional
+search the size of both clouds, for A*, ALT, and tiled A* it is every settled
+cell, for Jump Point Search it is every settled jump point, for HPA* it is
+every abstract node settled, and for breadth-first search it is every cell
+reached.  The wall time of each engine includes any preprocessing it needs,
+such as building the graph, the Hierarchy of HPA*, or the LandmarkIndex of
+ALT, which are built in memory rather than cached beside a map file.  Tiled
+A* searches a map file through a memory map, so its wall time also includes
+writing the map to a temporary file.  HPA* finds a near-optimal path, so its
+length may be longer than that of the other engines.
+
+Run this module as a script to compare the engines on the bundled
+"Programming Test A" data files:
+
+$ python -m interview.robot.benchmark
+
+The scaling benchmark generates square maps of each size in SIZE_TIERS and
+each style of map_generator, and records the wall time and peak memory of
+each engine.  Peak memory is measured by tracemalloc in a second run, so that
+tracing does not slow down the timed run, and counts the memory allocated by
+the engine beyond the map itself.  Tracing slows the graph-based engines by an
+order of magnitude, since hashing each Map key allocates many small integers,
+so pass memory=False for a quick comparison of times alone.
+
+Engines are skipped on maps larger than their limit in MAX_CELLS, since the
+graph-based engines would take hours on the largest tiers.  Give a CSV
+filename to run the scaling benchmark as a script and save the results, which
+can later be loaded as a baseline for find_regressions:
+
+$ python -m interview.robot.benchmark scaling results.csv
+
+The memory benchmark builds the graph of an open square map of each size, and
+reports the bytes taken by each vertex and each edge of the Graph, as traced
+by tracemalloc, and of the FrozenGraph it freezes into, as counted from the
+sizes of its arrays.  Run it as a script to print the table:
+
+$ python -m interview.robot.benchmark memory
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar, jump_point_search
+from interview.robot.grid_search import breadth_first_search
+from interview.robot.map_generator import generate_map, MAP_STYLES
+from interview.robot.map_generator import DEFAULT_DENSITY
+from interview.robot.map_io import read_grid, find_cell, OBSTACLE, ROBOT, GOAL
+from interview.robot.map_io import OPEN, write_grid
+from interview.robot.robot_path import grid_to_graph, shortest_path_length
+from interview.robot.robot_path import bidirectional_shortest_path, grid_edges
+from interview.robot.graph_data_structures import Graph
+from interview.robot.hierarchical import build_hierarchy, hpa_search
+from interview.robot.landmarks import build_landmarks, alt_search
+from interview.robot.tiled import MappedGrid, tiled_search
+
+
+# %% Results table
+RESULT_DTYPE = np.dtype([('filename', object),      # Path of map file
+                         ('engine', object),        # Name of search engine
+                         ('length', np.float64),    # np.inf if unreachable
+                         ('expansions', np.int64),  # Vertices or cells settled
+                         ('seconds', np.float64)])  # Wall time of search
+
+SCALING_DTYPE = np.dtype([('size', np.int64),        # Rows, columns of map
+                          ('style', 'U8'),            # Style of map
+                          ('engine', 'U16'),          # Name of search engine
+                          ('length', np.float64),     # np.inf if unreachable
+                          ('expansions', np.int64),   # Vertices or cells
+                          ('seconds', np.float64),    # Wall time of search
+                          ('peak_bytes', np.int64)])  # -1 if not measured
+
+MEMORY_DTYPE = np.dtype([('size', np.int64),         # Rows, columns of map
+                         ('graph', 'U12'),            # Graph or FrozenGraph
+                         ('vertices', np.int64),      # Number of vertices
+                         ('edges', np.int64),         # Number of edges
+                         ('vertex_bytes', np.float64),  # Bytes per vertex
+                         ('edge_bytes', np.float64)])   # Bytes per edge
+
+DATA_PATH = Path(__file__).parent / 'data'  # Bundled robot maps
+SIZE_TIERS = (100, 250, 500, 1000, 2000, 4000)  # Rows and columns of maps
+
+
+# %% Engines
+def _dijkstra(grid, stats):
+    """Run Djikstra's algorithm on a graph of the map and return the length."""
+    graph, start, goal, _ = grid_to_graph(grid, prune_obstacles=True)
+    cloud, _ = shortest_path_length(graph, start, goal)
+    stats['expansions'] = len(cloud)
+    return cloud.get(goal, np.inf)
+
+
+def _bidirectional(grid, stats):
+    """Run bidirectional Djikstra's algorithm and return the length."""
+    graph, start, goal, _ = grid_to_graph(grid, prune_obstacles=True)
+    return bidirectional_shortest_path(graph, start, goal, stats)[0]
+
+
+def _astar(grid, stats):
+    """Run A* search on the character grid and return the length."""
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    return astar(grid != OBSTACLE, start, goal, stats)[0]
+
+
+def _jps(grid, stats):
+    """Run Jump Point Search on the character grid and return the length."""
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    return jump_point_search(grid != OBSTACLE, start, goal, stats)[0]
+
+
+def _bfs(grid, stats):
+    """Run breadth-first search on the character grid and return the length."""
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    return breadth_first_search(grid != OBSTACLE, start, goal, stats)[0]
+
+
+def _hpa(grid, stats):
+    """Build the Hierarchy of the map, run HPA* and return the length."""
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    passable = grid != OBSTACLE
+    hierarchy = build_hierarchy(passable)
+    return hpa_search(hierarchy, passable, start, goal, stats)[0]
+
+
+def _alt(grid, stats):
+    """Build the LandmarkIndex of the map, run ALT and return the length."""
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    index = build_landmarks(grid)
+    return alt_search(index, grid != OBSTACLE, start, goal, stats)[0]
+
+
+def _tiled(grid, stats):
+    """Run tiled A* on a temporary map file and return the length."""
+    with TemporaryDirectory() as directory:
+        filename = Path(directory) / 'map.txt'
+        write_grid(filename, grid, newline='\n')
+        mapped = MappedGrid(filename)
+        start, goal = mapped.find(ROBOT), mapped.find(GOAL)
+        length = tiled_search(mapped, start, goal, stats=stats)[0]
+        del mapped                      # Close memory map before removal
+    return length
+
+
+BENCHMARKS = {'dijkstra': _dijkstra,    # Engines that report expansions
+              'bidirectional': _bidirectional,
+              'astar': _astar,
+              'jps': _jps,
+              'bfs': _bfs,
+              'hpa': _hpa,
+              'alt': _alt,
+              'tiled': _tiled}
+MAX_CELLS = {'dijkstra': 500**2,        # Largest map each engine is run on
+             'bidirectional': 500**2,
+             'astar': 1000**2,
+             'jps': 1000**2,
+             'bfs': 4000**2,
+             'hpa': 1000**2,
+             'alt': 500**2,
+             'tiled': 1000**2}
+
+
+# %% Functions
+def compare_engines(filenames, engines=('dijkstra', 'jps')):
+    """Run every engine on every map and return a table of the results.
+
+    Return a structured array with the filename, engine, path length, number
+    of expansions, and wall time in seconds of each run.
+    """
+    rows = []
+    for filename in filenames:
+        grid = read_grid(filename)
+        for engine in engines:
+            stats = {}
+            start = time.perf_counter()
+            length = BENCHMARKS[engine](grid, stats)
+            seconds = time.perf_counter() - start
+            rows.append((Path(filename), engine, length, stats['expansions'],
+                         seconds))
+    return np.array(rows, dtype=RESULT_DTYPE)
+
+
+def print_results(results):
+    """Print a table of the results returned by compare_engines."""
+    width = max(len(row['filename'].name) for row in results) + 2
+    print(f'{"Map":<{width}}{"Engine":<15}{"Length":>8}{"Expanded":>10}'
+          f'{"Seconds":>10}')
+    for row in results:
+        print(f'{row["filename"].name:<{width}}{row["engine"]:<15}'
+              f'{row["length"]:>8.0f}{row["expansions"]:>10}'
+              f'{row["seconds"]:>10.4f}')
+
+
+def scaling_benchmark(sizes=SIZE_TIERS, styles=MAP_STYLES,
+                      engines=tuple(BENCHMARKS), density=DEFAULT_DENSITY,
+                      seed=0, memory=True):
+    """Run every engine on generated maps of every size and style.
+
+    Each map is a square of the given size generated by
+    map_generator.generate_map with the given density and seed, so the same
+    arguments always benchmark the same maps.  Engines are skipped on maps
+    with more cells than their limit in MAX_CELLS.  If memory is False the
+    peak memory is not measured.
+
+    Return a structured array with the size, style, engine, path length,
+    number of expansions, wall time in seconds, and peak bytes of each run.
+    """
+    rows = []
+    for size in sizes:
+        for style in styles:
+            grid = generate_map(size, size, style, density, seed)
+            for engine in engines:
+                if size * size > MAX_CELLS[engine]:
+                    continue
+                stats = {}
+                start = time.perf_counter()
+                length = BENCHMARKS[engine](grid, stats)
+                seconds = time.perf_counter() - start
+                peak = -1
+                if memory:
+                    tracemalloc.start()
+                    BENCHMARKS[engine](grid, {})
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                rows.append((size, style, engine, length,
+                             stats['expansions'], seconds, peak))
+    return np.array(rows, dtype=SCALING_DTYPE)
+
+
+def save_results(results, filename):
+    """Save the table returned by scaling_benchmark as a CSV file."""
+    np.savetxt(filename, results, delimiter=',', comments='',
+               header=','.join(SCALING_DTYPE.names),
+               fmt=['%d', '%s', '%s', '%.17g', '%d', '%.6g', '%d'])
+
+
+def load_results(filename):
+    """Load a table saved by save_results as a structured array."""
+    return np.atleast_1d(np.genfromtxt(filename, delimiter=',',
+                                       skip_header=1, dtype=SCALING_DTYPE,
+                                       encoding='utf-8'))
+
+
+def find_regressions(baseline, results, factor=1.5):
+    """Return rows of results that regressed from the baseline table.
+
+    A row regressed if the baseline holds a run of the same size, style, and
+    engine that found a different path length, or that took less than 1 /
+    factor of the time.  Rows without a matching baseline run are ignored.
+    """
+    previous = {(int(row['size']), str(row['style']), str(row['engine'])):
+                row for row in baseline}
+    regressed = []
+    for idx, row in enumerate(results):
+        key = (int(row['size']), str(row['style']), str(row['engine']))
+        if key not in previous:
+            continue
+        before = previous[key]
+        if (row['length'] != before['length'] or
+                row['seconds'] > factor * before['seconds']):
+            regressed.append(idx)
+    return results[regressed]
+
+
+def memory_benchmark(sizes=(100, 250), diagonal=False):
+    """Measure the memory taken by the graph of an open map of each size.
+
+    The vertices of the Graph are inserted first, so the bytes traced while
+    inserting them are divided among the vertices, and the bytes traced
+    while inserting the edges among the edges.  The vertex arrays of the
+    FrozenGraph are its elements and indptr arrays, and the rest of its
+    arrays are edge arrays.
+
+    Return a structured array with the size, graph class, number of vertices
+    and edges, and bytes per vertex and per edge of each graph.
+    """
+    rows = []
+    for size in sizes:
+        costs = np.ones((size, size))
+        origins, destinations, weights = grid_edges(costs, diagonal=diagonal)
+        triples = list(zip(origins.tolist(), destinations.tolist(), weights))
+        elements = [chr(OPEN)] * size**2
+        tracemalloc.start()
+        graph = Graph()
+        vertices = graph.insert_vertices(elements)
+        vertex_bytes = tracemalloc.get_traced_memory()[0]
+        graph.insert_edges(triples, vertices)
+        edge_bytes = tracemalloc.get_traced_memory()[0] - vertex_bytes
+        tracemalloc.stop()
+        n, m = graph.vertex_count(), graph.edge_count()
+        rows.append((size, 'Graph', n, m, vertex_bytes / n, edge_bytes / m))
+        frozen = graph.freeze()
+        arrays = {id(array): (name, array)      # Aliases counted once
+                  for name, array in vars(frozen).items()
+                  if isinstance(array, np.ndarray)}
+        total_bytes = sum(array.nbytes for _, array in arrays.values())
+        vertex_bytes = sum(array.nbytes for name, array in arrays.values()
+                           if name in ('elements', 'indptr', 'in_indptr'))
+        rows.append((size, 'FrozenGraph', n, m, vertex_bytes / n,
+                     (total_bytes - vertex_bytes) / m))
+    return np.array(rows, dtype=MEMORY_DTYPE)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == 'scaling':
+        save_results(scaling_benchmark(), sys.argv[2])
+    elif len(sys.argv) == 2 and sys.argv[1] == 'memory':
+        print(f'{"Size":>6}  {"Graph":<12}{"Vertices":>10}{"Edges":>10}'
+              f'{"B/vertex":>10}{"B/edge":>10}')
+        for row in memory_benchmark():
+            print(f'{row["size"]:>6}  {row["graph"]:<12}{row["vertices"]:>10}'
+                  f'{row["edges"]:>10}{row["vertex_bytes"]:>10.1f}'
+                  f'{row["edge_bytes"]:>10.1f}')
+    else:
+        data_files = sorted(
+            x for x in DATA_PATH.glob('Programming Test A*.txt')
+            if not x.stem.endswith('_SOLUTION'))
+        print_results(compare_engines(data_files, tuple(BENCHMARKS)))
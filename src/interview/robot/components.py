@@ -0,0 +1,200 @@
+"""Connected components of a robot map for constant-time reachability.
+
+###############################################################################
+# components.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Answer whether the goal is reachable before running a search,
+#               and confine the search to the region of the robot.
+#
+# Contents:
+#
+#   ComponentIndex: Label of the connected component of each cell.
+#
+#   label_components: Label the connected components of a passable grid.
+#
+#   build_components: Build the ComponentIndex of a map.
+#
+#   load_components: Load a ComponentIndex saved to disk.
+#
+#   cached_components: Load the ComponentIndex cached beside a map, or build
+#                      it.
+#
+###############################################################################
+
+An unreachable goal is the worst case of Djikstra's algorithm, which settles
+every vertex it can reach before concluding that the goal is not among them.
+Once every cell is labelled with its connected component, the goal is
+reachable exactly when the robot and the goal share a label, which is a
+constant-time test.
+
+The labels are found by a union-find over the cells, vectorized with NumPy.
+Each horizontal run of open cells starts out as one set, whose root is its
+first cell.  Every round then hooks the root of each pair of vertically
+adjacent cells in different sets onto the smaller of the two roots, and
+compresses every path to point directly at its root.  Pairs found in the same
+set are dropped, so each round works on fewer pairs, and only a handful of
+rounds are needed even on maps of millions of cells.
+
+Diagonal moves may not cut the corner of an obstacle, so they never join two
+components, and the same labels serve 4-connected and 8-connected movement.
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.map_io import read_grid, grid_digest, terrain_costs
+from interview.robot.map_io import cache_filename, cached_npz, OBSTACLE
+
+
+# %% Constants
+NO_COMPONENT = 0                # Label of obstacle cells
+CACHE_SUFFIX = '_COMPONENTS.npz'  # Name of cached index after map stem
+
+
+# %% Classes
+class ComponentIndex:
+    """Label of the connected component of each cell.
+
+    The labels array has the shape of the map and holds the component of
+    each open cell, numbered from 1 to count in row-major order of the first
+    cell of each component, or NO_COMPONENT for obstacles.
+    """
+
+    def __init__(self, labels, count, digest=''):
+        """Store the labels and the map they were labelled from."""
+        self.labels = labels
+        self.count = int(count)         # Number of components
+        self.digest = digest            # Digest of passable cells of map
+
+    def label(self, cell):
+        """Return the component label of a (row, column) cell."""
+        return int(self.labels[cell])
+
+    def reachable(self, start, goal):
+        """Return True if goal can be reached from start."""
+        label = self.labels[start]
+        return bool(label != NO_COMPONENT and label == self.labels[goal])
+
+    def component(self, cell):
+        """Return boolean array that is True for the component of cell."""
+        return self.labels == self.labels[cell]
+
+    def restrict(self, grid, cell):
+        """Return copy of grid with obstacles outside the component of cell.
+
+        A search from cell on the copy explores nothing beyond the component,
+        so a graph of the copy with obstacles pruned holds only its vertices.
+        """
+        restricted = grid.copy()
+        restricted[~self.component(cell)] = OBSTACLE
+        return restricted
+
+    def save(self, filename):
+        """Save the index to a .npz file."""
+        np.savez(filename, **self._arrays())
+
+    def _arrays(self):
+        """Return dict of the arrays saved to disk."""
+        return {'labels': self.labels, 'count': np.array(self.count),
+                'digest': np.array(self.digest)}
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        """Return an index of the arrays returned by _arrays()."""
+        return cls(arrays['labels'], arrays['count'], str(arrays['digest']))
+
+
+# %% Functions
+def label_components(passable):
+    """Label the 4-connected components of a 2D boolean array.
+
+    Return a tuple of an int32 array of labels, as described for
+    ComponentIndex, and the number of components.
+    """
+    idx = np.arange(passable.size, dtype=np.int32).reshape(passable.shape)
+    # Each horizontal run of open cells starts as a set rooted at its start
+    starts = passable.copy()
+    starts[:, 1:] &= ~passable[:, :-1]
+    parent = np.maximum.accumulate(np.where(starts, idx, 0), axis=1)
+    parent = np.where(passable, parent, idx).ravel()
+    # Vertically adjacent open cells, which may join two sets
+    joined = passable[:-1] & passable[1:]
+    upper, lower = idx[:-1][joined], idx[1:][joined]
+    while len(upper):
+        upper_root, lower_root = parent[upper], parent[lower]
+        split = upper_root != lower_root    # Pairs not yet in the same set
+        upper, lower = upper[split], lower[split]
+        upper_root, lower_root = upper_root[split], lower_root[split]
+        if not len(upper):
+            break
+        # Hook the larger root of each pair onto the smaller
+        np.minimum.at(parent, np.maximum(upper_root, lower_root),
+                      np.minimum(upper_root, lower_root))
+        while True:                     # Point every cell at its root
+            above = parent[parent]
+            if np.array_equal(above, parent):
+                break
+            parent = above
+    roots = passable.ravel() & (parent == idx.ravel())
+    numbers = np.cumsum(roots, dtype=np.int32)  # Label of each root
+    labels = np.where(passable.ravel(), numbers[parent], NO_COMPONENT)
+    return labels.reshape(passable.shape), int(numbers[-1])
+
+
+def _passable(grid, legend=None):
+    """Return boolean array of the cells of a map that can be entered."""
+    if legend is None:
+        return grid != OBSTACLE
+    return terrain_costs(grid, legend) != np.inf
+
+
+def build_components(grid, legend=None, digest=''):
+    """Build the ComponentIndex of a map read in by read_grid.
+
+    Cells are open unless their traversal cost under the legend, as described
+    in map_io, is infinite.  The optional digest identifies the map the index
+    was built from.
+    """
+    labels, count = label_components(_passable(grid, legend))
+    return ComponentIndex(labels, count, digest)
+
+
+def load_components(filename):
+    """Load a ComponentIndex saved to disk by ComponentIndex.save()."""
+    with np.load(filename) as data:
+        return ComponentIndex._from_arrays(data)
+
+
+def component_filename(filename):
+    """Return filename of the ComponentIndex cached beside a map file."""
+    return cache_filename(filename, CACHE_SUFFIX)
+
+
+def cached_components(filename, grid=None, legend=None):
+    """Return the ComponentIndex of a map, labelling it only if necessary.
+
+    An index cached beside the map file is loaded if it was labelled from the
+    same open cells, which depend on the map contents and the legend.
+    Otherwise the index is built and saved beside the map file.  If the grid
+    returned by read_grid is given the map is not read in again.
+    """
+    if grid is None:
+        grid = read_grid(filename)
+    passable = _passable(grid, legend)
+    digest = grid_digest(passable)
+
+    def build():
+        """Return the arrays of the index of the open cells."""
+        labels, count = label_components(passable)
+        return ComponentIndex(labels, count, digest)._arrays()
+
+    arrays = cached_npz(filename, CACHE_SUFFIX, digest, build)
+    return ComponentIndex._from_arrays(arrays)
@@ -14,6 +14,10 @@
 #
 #   Graph: Class to implement a graph using an adjacency map.
 #
+#   FrozenGraph: Immutable graph stored in compressed sparse row arrays.
+#
+#   load_graph: Load a graph saved to disk as a memory-mapped FrozenGraph.
+#
 ###############################################################################
 """
 
@@ -21,9 +25,34 @@
 # Standard system imports
 
 # Related third party imports
+import numpy as np
 
 # Local application/library specific imports
-from interview.robot.array_data_structures import Map
+from interview.robot.array_data_structures import Map, hash_codes, paused_gc
+from interview.robot.instrumentation import COUNTERS
+
+
+# %% Constants
+GRAPH_MAGIC = b'GRPH'                   # First bytes of a saved graph file
+GRAPH_VERSION = 1                       # Version of the saved graph format
+GRAPH_SECTIONS = ('elements',           # Arrays of FrozenGraph saved in file
+                  'origins',
+                  'destinations',
+                  'weights',
+                  'indptr',
+                  'indices',
+                  'edge_ids',
+                  'in_indptr',
+                  'in_indices',
+                  'in_edge_ids')
+GRAPH_HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u4'),
+    ('directed', 'u1'),
+    ('dtypes', 'S8', len(GRAPH_SECTIONS)),     # Empty if section not saved
+    ('offsets', '<i8', len(GRAPH_SECTIONS)),   # Bytes from start of file
+    ('lengths', '<i8', len(GRAPH_SECTIONS))])  # Items in each section
+SECTION_ALIGNMENT = 64                  # Sections start on multiples of this
 
 
 # %% Classes
@@ -60,6 +89,9 @@ class Graph:
 
         def element(self):
             """Return edge's element."""
+            counters = COUNTERS.get()
+            if counters is not None:    # Counted by instrumentation
+                counters['edges_relaxed'] += 1
             return self._element
 
         def endpoints(self):
@@ -94,6 +126,7 @@ class Graph:
         alias to the outgoing map.
         """
         self._directed = directed
+        self._edge_count = 0            # Kept up to date by each mutator
         self._outgoing_map = Map()
         if directed:
             self._incoming_map = Map()
@@ -114,22 +147,24 @@ class Graph:
             yield vertex
 
     def edge_count(self):
-        """Return the number of edges in the graph."""
-        edges = sum(len(self._outgoing_map[v]) for v, _ in self._outgoing_map)
-        if self._directed:
-            return edges
-        return edges // 2  # Divide by two to prevent double-counting edges
+        """Return the number of edges in the graph.
+
+        The count is updated as edges are inserted and removed, rather than
+        counted on each call.
+        """
+        return self._edge_count
 
     def edges(self):
-        """Return a set of all edges in the graph.
+        """Return an iteration of all edges in the graph.
 
-        A set ensures that edges aren't double-counted.
+        Each edge of an undirected graph is stored in the secondary maps of
+        both its endpoints, so it is only yielded from the map of its origin.
+        The graph must not be modified during the iteration.
         """
-        edges = set()
-        for _, edge_map in self._outgoing_map:
+        for vertex, edge_map in self._outgoing_map:
             for _, edge in edge_map:
-                edges.add(edge)
-        return edges
+                if self._directed or edge._origin is vertex:
+                    yield edge
 
     def get_edge(self, u, v):
         """Return the edge from u to v, if it exists; otherwise return None.
@@ -176,10 +211,100 @@ class Graph:
         Edge can optionally store an element.
         """
         edge = self._Edge(u, v, element)
-        self._outgoing_map[u][v] = edge
+        edge_map = self._outgoing_map[u]
+        count = len(edge_map)
+        edge_map[v] = edge
+        self._edge_count += len(edge_map) - count   # Unless edge replaced
         self._incoming_map[v][u] = edge
         return edge
 
+    def insert_vertices(self, elements):
+        """Create a new Vertex storing each element of an iterable.
+
+        Return the list of new vertices, in the order of the elements.  The
+        vertices are hashed all at once and the maps of the graph resized at
+        most once, which is much faster than calling insert_vertex() for each
+        element of a large graph.  The garbage collector is paused meanwhile,
+        as it would otherwise scan the graph over and over as it grows.
+        """
+        with paused_gc():
+            vertices = [self._Vertex(element) for element in elements]
+            codes = hash_codes(vertices)
+            self._outgoing_map.insert_new(vertices,
+                                          self._new_maps(len(vertices)), codes)
+            if self._directed:
+                self._incoming_map.insert_new(
+                    vertices, self._new_maps(len(vertices)), codes)
+        return vertices
+
+    def insert_edges(self, edges, vertices=None):
+        """Create new edges from an iterable of (u, v, element) triples.
+
+        Return the list of new edges, in the order of the triples.  If a
+        sequence of vertices is given, such as the list returned by
+        insert_vertices(), u and v are integer indices into it rather than
+        vertices, so that the triples can come from zip() of NumPy arrays of
+        endpoint indices.
+
+        The secondary maps of each vertex are filled in one step rather than
+        one edge at a time, and are not searched for existing edges, so no
+        edge may already join u to v and each pair of endpoints may appear in
+        only one triple.
+        """
+        new_edges = []
+        # Vertices are grouped by id(), as hashing a _Vertex calls __hash__
+        outgoing = {}                   # id: (vertex, keys, edges) of maps
+        incoming = outgoing if not self._directed else {}
+        with paused_gc():
+            for u, v, element in edges:
+                if vertices is not None:
+                    u, v = vertices[u], vertices[v]
+                edge = self._Edge(u, v, element)
+                new_edges.append(edge)
+                _add_entry(outgoing, u, v, edge)
+                if self._directed or u is not v:    # Self-loop stored once
+                    _add_entry(incoming, v, u, edge)
+            endpoints = [vertex for vertex, _, _ in outgoing.values()]
+            endpoints += [vertex for key, (vertex, _, _) in incoming.items()
+                          if key not in outgoing]
+            codes = dict(zip(map(id, endpoints), hash_codes(endpoints)))
+            self._fill_maps(self._outgoing_map, outgoing, codes)
+            if self._directed:
+                self._fill_maps(self._incoming_map, incoming, codes)
+        self._edge_count += len(new_edges)
+        return new_edges
+
+    @staticmethod
+    def _new_maps(count):
+        """Return list of count empty secondary maps.
+
+        The random MAD parameters of the maps are drawn all at once.
+        """
+        prime = Map.DEFAULT_PRIME
+        scales = np.random.randint(1, prime, size=count).tolist()
+        shifts = np.random.randint(0, prime, size=count).tolist()
+        return [Map(prime=prime, scale=scale, shift=shift)
+                for scale, shift in zip(scales, shifts)]
+
+    @staticmethod
+    def _fill_maps(primary, entries, codes):
+        """Add the entries built by insert_edges() to the secondary maps.
+
+        The entries map id() of each vertex to a tuple of the vertex and the
+        lists of keys and edges to add to its secondary map, and codes maps
+        id() of each key to its hash code.  The primary map is iterated
+        through, rather than hashing each vertex, once many of its secondary
+        maps are needed.
+        """
+        if 8 * len(entries) < len(primary):
+            edge_maps = {key: primary[vertex]
+                         for key, (vertex, _, _) in entries.items()}
+        else:
+            edge_maps = {id(vertex): edge_map for vertex, edge_map in primary}
+        for key, (_, keys, edges) in entries.items():
+            edge_maps[key].insert_new(keys, edges,
+                                      [codes[id(vertex)] for vertex in keys])
+
     def remove_vertex(self, v):
         """Remove vertex v and all its incident edges from the graph.
 
@@ -198,11 +323,15 @@ class Graph:
 
         Return the vertex's element.
         """
-        for destination, _ in self._outgoing_map[v]:
+        edge_map = self._outgoing_map[v]
+        self._edge_count -= len(edge_map)
+        for destination, _ in edge_map:
             del self._incoming_map[destination][v]
         del self._outgoing_map[v]
         if self._directed:
-            for origin, _ in self._incoming_map[v]:
+            edge_map = self._incoming_map[v]    # Self-loop already deleted
+            self._edge_count -= len(edge_map)
+            for origin, _ in edge_map:
                 del self._outgoing_map[origin][v]
             del self._incoming_map[v]
         return v.element()
@@ -216,4 +345,295 @@ class Graph:
         v = edge._destination
         del self._outgoing_map[u][v]
         del self._incoming_map[v][u]
+        self._edge_count -= 1
         return edge.element()
+
+    def save(self, filename):
+        """Save the graph to a binary file, as described for FrozenGraph.
+
+        The graph is loaded back by load_graph() as a FrozenGraph, whose
+        vertex i is the i-th vertex yielded by vertices().
+        """
+        self.freeze().save(filename)
+
+    def freeze(self):
+        """Return an immutable copy of the graph as a FrozenGraph.
+
+        Vertex i of the frozen graph is the i-th vertex yielded by vertices(),
+        which gives the same order as long as the graph is not modified.
+        """
+        vertices = list(self.vertices())
+        ids = {vertex: idx for idx, vertex in enumerate(vertices)}
+        edges = list(self.edges())
+        origins = np.array([ids[edge._origin] for edge in edges],
+                           dtype=np.int64)
+        destinations = np.array([ids[edge._destination] for edge in edges],
+                                dtype=np.int64)
+        weights = np.array([edge.element() for edge in edges])
+        if weights.dtype.kind not in 'biuf':    # Keep elements unchanged
+            weights = np.empty(len(edges), dtype=object)
+            weights[:] = [edge.element() for edge in edges]
+        elements = np.empty(len(vertices), dtype=object)
+        elements[:] = [vertex.element() for vertex in vertices]
+        return FrozenGraph(self._directed, elements, origins, destinations,
+                           weights)
+
+
+class FrozenGraph:
+    """Immutable graph stored in compressed sparse row (CSR) arrays.
+
+    Vertices are the integers 0 to n-1, and edges are the integers 0 to m-1,
+    with the origin, destination, and element of edge e stored at index e of
+    the origins, destinations, and weights arrays.  The edges leaving vertex
+    v are listed in indices[indptr[v]:indptr[v+1]], which holds the opposite
+    vertex of each edge sorted in increasing order, and the matching slice of
+    edge_ids holds the edges themselves.  An undirected graph lists each edge
+    under both of its endpoints.  A directed graph keeps a second set of
+    arrays listing the edges entering each vertex.
+
+    The interface of Graph is kept for reading the graph, so that searches
+    written for Graph run unchanged.  Vertices are compared by equality
+    rather than identity, since equal integers need not be the same object.
+    """
+
+    class _Edge:
+        """Lightweight handle of an edge of a FrozenGraph."""
+
+        __slots__ = '_graph', '_id'
+
+        def __init__(self, graph, edge_id):
+            """Store the graph and the integer ID of the edge."""
+            self._graph = graph
+            self._id = edge_id
+
+        def element(self):
+            """Return edge's element."""
+            counters = COUNTERS.get()
+            if counters is not None:    # Counted by instrumentation
+                counters['edges_relaxed'] += 1
+            return self._graph.weights.item(self._id)
+
+        def endpoints(self):
+            """Return tuple containing endpoints u and v."""
+            return (self._graph.origins.item(self._id),
+                    self._graph.destinations.item(self._id))
+
+        def opposite(self, vertex):
+            """Return endpoint opposite vertex."""
+            origin, destination = self.endpoints()
+            if vertex == origin:
+                return destination
+            if vertex == destination:
+                return origin
+            raise ValueError('Vertex is not an endpoint of edge!')
+
+        def __eq__(self, other):
+            """Return True if both handles refer to the same edge."""
+            return (isinstance(other, type(self)) and
+                    self._graph is other._graph and self._id == other._id)
+
+        def __hash__(self):
+            """Return hash code computed using the edge ID."""
+            return hash(self._id)
+
+    def __init__(self, directed, elements, origins, destinations, weights):
+        """Build the CSR arrays of a graph from its arrays of edges.
+
+        The elements array holds the element of each vertex, and the origins,
+        destinations, and weights arrays the endpoints and element of each
+        edge.
+        """
+        self._directed = directed
+        self.elements = elements
+        self.origins = origins
+        self.destinations = destinations
+        self.weights = weights
+        n = len(elements)
+        edge_ids = np.arange(len(origins))
+        sources, targets = origins, destinations
+        if not directed:                # List each edge under both endpoints
+            loops = origins == destinations  # Self-loops are listed once
+            sources = np.concatenate((origins, destinations[~loops]))
+            targets = np.concatenate((destinations, origins[~loops]))
+            edge_ids = np.concatenate((edge_ids, edge_ids[~loops]))
+        self.indptr, self.indices, self.edge_ids = self._csr(
+            n, sources, targets, edge_ids)
+        if directed:
+            self.in_indptr, self.in_indices, self.in_edge_ids = self._csr(
+                n, targets, sources, edge_ids)
+        else:                           # Incoming arrays alias outgoing
+            self.in_indptr = self.indptr
+            self.in_indices = self.indices
+            self.in_edge_ids = self.edge_ids
+
+    @classmethod
+    def _from_arrays(cls, directed, arrays):
+        """Return a FrozenGraph of CSR arrays already built, such as by save.
+
+        The arrays map each name in GRAPH_SECTIONS to its array, and the
+        incoming arrays may be left out of an undirected graph.
+        """
+        graph = cls.__new__(cls)
+        graph._directed = directed
+        for name, array in arrays.items():
+            setattr(graph, name, array)
+        if not directed:                # Incoming arrays alias outgoing
+            graph.in_indptr = graph.indptr
+            graph.in_indices = graph.indices
+            graph.in_edge_ids = graph.edge_ids
+        return graph
+
+    @staticmethod
+    def _csr(n, sources, targets, edge_ids):
+        """Return indptr, indices, and edge_ids arrays of the edges."""
+        order = np.lexsort((targets, sources))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        return indptr, targets[order], edge_ids[order]
+
+    def is_directed(self):
+        """Return True if graph is directed, False if undirected."""
+        return self._directed
+
+    def vertex_count(self):
+        """Return number of vertices in the graph."""
+        return len(self.elements)
+
+    def vertices(self):
+        """Return an iteration of all vertices in the graph."""
+        return iter(range(len(self.elements)))
+
+    def vertex_element(self, v):
+        """Return element stored by vertex v."""
+        return self.elements.item(v)
+
+    def edge_count(self):
+        """Return the number of edges in the graph."""
+        return len(self.origins)
+
+    def edges(self):
+        """Return an iteration of all edges in the graph."""
+        for edge_id in range(len(self.origins)):
+            yield self._Edge(self, edge_id)
+
+    def get_edge(self, u, v):
+        """Return the edge from u to v, if it exists; otherwise return None.
+
+        The order of u and v do not make a difference for an undirected graph.
+        The sorted neighbors of u are searched by bisection.
+        """
+        start, stop = self.indptr[u], self.indptr[u + 1]
+        idx = start + np.searchsorted(self.indices[start:stop], v)
+        if idx < stop and self.indices[idx] == v:
+            return self._Edge(self, int(self.edge_ids[idx]))
+        return None
+
+    def degree(self, v, out=True):
+        """Return number of edges incident to vertex v for an undirected graph.
+
+        For a directed graph, return number of either incoming or outcoming
+        edges as determined by the optional argument.
+        """
+        indptr = self.indptr if out else self.in_indptr
+        return int(indptr[v + 1] - indptr[v])
+
+    def incident_edges(self, v, out=True):
+        """Return an iteration of edges incident to vertex v.
+
+        For an undirected graph this will be all incident edges, for a directed
+        graph it will be either incoming or outgoing edges as determined by the
+        optional argument.
+        """
+        if out:
+            indptr, edge_ids = self.indptr, self.edge_ids
+        else:
+            indptr, edge_ids = self.in_indptr, self.in_edge_ids
+        for edge_id in edge_ids[indptr[v]:indptr[v + 1]].tolist():
+            yield self._Edge(self, edge_id)
+
+    def save(self, filename):
+        """Save the graph to a binary file to be loaded by load_graph().
+
+        The file starts with a header, a record of GRAPH_HEADER_DTYPE, which
+        holds the dtype, offset, and length of each array in GRAPH_SECTIONS.
+        The arrays follow, each starting on a multiple of SECTION_ALIGNMENT
+        bytes.  The incoming arrays of an undirected graph are not saved.
+
+        Vertex and edge elements are saved as fixed-width arrays, so they must
+        be all numbers or all strings.  Raise ValueError otherwise.
+        """
+        header = np.zeros(1, dtype=GRAPH_HEADER_DTYPE)
+        header['magic'] = GRAPH_MAGIC
+        header['version'] = GRAPH_VERSION
+        header['directed'] = self._directed
+        sections = []                   # (offset, array) of each section
+        offset = _aligned(GRAPH_HEADER_DTYPE.itemsize)
+        for idx, name in enumerate(GRAPH_SECTIONS):
+            if name.startswith('in_') and not self._directed:
+                continue
+            array = _fixed_width(getattr(self, name), name)
+            header['dtypes'][0, idx] = array.dtype.str
+            header['offsets'][0, idx] = offset
+            header['lengths'][0, idx] = len(array)
+            sections.append((offset, array))
+            offset = _aligned(offset + array.nbytes)
+        with open(filename, 'wb') as fout:
+            fout.write(header.tobytes())
+            for offset, array in sections:
+                fout.seek(offset)
+                fout.write(np.ascontiguousarray(array).tobytes())
+
+
+# %% Functions
+def _aligned(offset):
+    """Return offset rounded up to a multiple of SECTION_ALIGNMENT."""
+    return -(-offset // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+
+
+def _fixed_width(array, name):
+    """Return array of elements as an array of numbers or strings.
+
+    Raise ValueError if the elements are not all numbers or all strings.
+    """
+    array = np.asarray(array)
+    if array.dtype.kind == 'O':
+        elements = array.tolist()
+        array = np.array(elements)
+        if array.dtype.kind not in 'biufUS' or array.tolist() != elements:
+            raise ValueError(f'Cannot save {name} of graph, must be all '
+                             'numbers or all strings!')
+    return array
+
+
+def load_graph(filename):
+    """Load a graph saved to disk by Graph.save() or FrozenGraph.save().
+
+    Return a FrozenGraph whose arrays are read-only views of a memory map of
+    the file, so nothing is parsed or copied when the graph is loaded, and
+    processes loading the same file share its pages.  Raise ValueError if the
+    file is not a saved graph.
+    """
+    data = np.memmap(filename, dtype=np.uint8, mode='r')
+    if len(data) < GRAPH_HEADER_DTYPE.itemsize:
+        raise ValueError(f'Not a saved graph: {filename}!')
+    header = data[:GRAPH_HEADER_DTYPE.itemsize].view(GRAPH_HEADER_DTYPE)[0]
+    if header['magic'] != GRAPH_MAGIC or header['version'] != GRAPH_VERSION:
+        raise ValueError(f'Not a saved graph: {filename}!')
+    arrays = {}
+    for name, dtype, offset, length in zip(GRAPH_SECTIONS, header['dtypes'],
+                                           header['offsets'].tolist(),
+                                           header['lengths'].tolist()):
+        if dtype:
+            dtype = np.dtype(dtype.decode())
+            arrays[name] = data[offset:offset +
+                                length * dtype.itemsize].view(dtype)
+    return FrozenGraph._from_arrays(bool(header['directed']), arrays)
+
+
+def _add_entry(entries, vertex, key, edge):
+    """Add key and edge to the entry of vertex built by insert_edges()."""
+    entry = entries.get(id(vertex))
+    if entry is None:
+        entry = entries[id(vertex)] = (vertex, [], [])
+    entry[1].append(key)
+    entry[2].append(edge)
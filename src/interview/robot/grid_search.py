@@ -0,0 +1,401 @@
+"""Search algorithms that operate directly on the ASCII map grid.
+
+###############################################################################
+# grid_search.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Alternate search engines for the robot programming exercise
+#               that skip construction of the Graph entirely.
+#
+# Contents:
+#
+#   astar: A* search over a boolean passability grid, with optional terrain
+#          costs and diagonal moves.
+#
+#   jump_point_search: Jump Point Search over a boolean passability grid.
+#
+#   distance_transform: Breadth-first distance field using NumPy operations.
+#
+#   breadth_first_search: Shortest path recovered from distance_transform.
+#
+###############################################################################
+
+The graph-based solution creates a vertex object for every character in the map
+and up to four edge objects per vertex.  On large maps building the graph costs
+far more than the search itself.  The functions in this module instead index
+the cells of the map by the integer row * ncols + col, and store the search
+state of every cell in flat NumPy arrays.
+
+Every move on the map costs 1, so a priority queue is not strictly necessary:
+breadth-first search settles cells in order of distance.  distance_transform
+expands a whole frontier of cells at a time with NumPy array operations, rather
+than one cell at a time in Python, and records the direction each cell was
+entered from in a uint8 array so that paths can be recovered.
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.map_io import move_cost, SQRT2
+
+
+# %% Cell states
+UNVISITED = 0   # Open cell not yet discovered by the search
+OPEN = 1        # Cell discovered and waiting in the priority queue
+CLOSED = 2      # Cell settled by the search, or an obstacle
+
+
+# %% Parent directions
+NO_PARENT = 0   # Start cell, obstacle, or cell not reached
+FROM_ABOVE = 1  # Cell entered by moving down from the cell above
+FROM_BELOW = 2  # Cell entered by moving up from the cell below
+FROM_LEFT = 3   # Cell entered by moving right from the cell to the left
+FROM_RIGHT = 4  # Cell entered by moving left from the cell to the right
+
+
+# %% Functions
+def astar(passable, start, goal, stats=None, heuristic=None, costs=None,
+          diagonal=False):
+    """Find the shortest path from start to goal using A* search.
+
+    The passable argument is a 2D boolean array that is False for obstacles.
+    The start and goal arguments are (row, column) tuples.  Movement is allowed
+    between 4-connected neighbors with a cost of 1, so the Manhattan distance
+    to the goal is a consistent heuristic and settled cells are never reopened.
+    A different consistent heuristic may be given as a function of the row and
+    column of a cell that returns a lower bound on its distance to the goal.
+
+    If an array of traversal costs is given, as returned by
+    map_io.terrain_costs, each move costs map_io.move_cost of its two cells.
+    If diagonal is True, moves to diagonal neighbors are allowed as long as
+    they do not cut the corner of an obstacle.  The default heuristic is then
+    the Manhattan or octile distance scaled by the smallest traversal cost.
+
+    Return a tuple of the path length and a list of (row, column) tuples along
+    the path, ordered from goal to start and excluding both endpoints.  If the
+    goal is unreachable return (np.inf, []).  If a stats dict is given, the
+    number of cells removed from the queue is stored under 'expansions'.
+    """
+    nrows, ncols = passable.shape
+    goal_row, goal_col = goal
+    expansions = 0
+    source = start[0] * ncols + start[1]        # Integer index of start cell
+    target = goal_row * ncols + goal_col        # Integer index of goal cell
+    open_cells = passable.ravel()
+    state = np.where(open_cells, UNVISITED, CLOSED).astype(np.uint8)
+    dist = np.full(nrows * ncols, np.inf)       # Distance from start
+    parent = np.full(nrows * ncols, -1, dtype=np.intp)  # Preceding cell
+    pqlocator = np.empty(nrows * ncols, dtype=object)  # Cells in queue
+    queue = AdaptablePriorityQueue()    # Priority queue with (f, h) keys
+    if costs is not None:
+        costs = costs.ravel()
+        scale = costs[open_cells].min()         # Smallest traversal cost
+    else:
+        scale = 1
+
+    def manhattan(row, col):
+        """Return Manhattan distance from (row, col) to the goal."""
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    def octile(row, col):
+        """Return scaled octile distance from (row, col) to the goal."""
+        d_row, d_col = abs(row - goal_row), abs(col - goal_col)
+        return scale * (max(d_row, d_col) + (SQRT2 - 1) * min(d_row, d_col))
+
+    def scaled_manhattan(row, col):
+        """Return scaled Manhattan distance from (row, col) to the goal."""
+        return scale * manhattan(row, col)
+
+    if heuristic is None:
+        if diagonal:
+            heuristic = octile
+        elif costs is not None:
+            heuristic = scaled_manhattan
+        else:
+            heuristic = manhattan
+
+    def neighbors(index, row, col):
+        """Generate (index, row, column) tuples of the allowed moves."""
+        yield from _neighbors(index, row, col, nrows, ncols)
+        if diagonal:
+            yield from _diagonal_neighbors(index, row, col, nrows, ncols,
+                                           open_cells)
+
+    dist[source] = 0
+    state[source] = OPEN
+    h = heuristic(*start)
+    pqlocator[source] = queue.enqueue((h, h), source)
+    while not queue.is_empty():
+        _, u = queue.dequeue()
+        state[u] = CLOSED
+        expansions += 1
+        if u == target:
+            break                               # Goal settled, stop search
+        row, col = divmod(u, ncols)
+        for v, v_row, v_col in neighbors(u, row, col):
+            if state[v] == CLOSED:
+                continue                        # Settled cell or obstacle
+            if costs is None:
+                weight = SQRT2 if v_row != row and v_col != col else 1
+            else:
+                weight = move_cost(costs[u], costs[v],
+                                   v_row != row and v_col != col)
+            d = dist[u] + weight
+            if d < dist[v]:
+                dist[v] = d                     # Relaxation step
+                parent[v] = u
+                h = heuristic(v_row, v_col)
+                # Break ties in f toward cells closer to the goal
+                if state[v] == OPEN:
+                    queue.update(pqlocator[v], (d + h, h), v)
+                else:
+                    state[v] = OPEN
+                    pqlocator[v] = queue.enqueue((d + h, h), v)
+    if stats is not None:
+        stats['expansions'] = expansions
+    if dist[target] == np.inf:
+        return np.inf, []
+    length = float(dist[target])
+    if length.is_integer():
+        length = int(length)            # Keep integer lengths of unit costs
+    return length, _trace_path(parent, source, target, ncols)
+
+
+def jump_point_search(passable, start, goal, stats=None):
+    """Find the shortest path from start to goal using Jump Point Search.
+
+    Takes the same arguments and returns the same tuple as astar.  Rather than
+    adding every neighbor to the queue, the search jumps in a straight line
+    until it reaches a jump point: the goal, or a cell where a shortest path
+    may have to turn.  Only jump points are placed in the queue, so long open
+    corridors cost a single expansion.
+
+    Canonical shortest paths on a 4-connected grid move vertically first and
+    then horizontally, turning from horizontal to vertical movement only at
+    a forced neighbor.  A neighbor above (below) the current cell is forced if
+    the cell above (below) the previous cell is an obstacle.  A horizontal
+    jump therefore stops at forced neighbors, while a vertical jump stops at
+    any cell from which a horizontal jump finds a jump point.  The jumped
+    segments are expanded back into per-cell coordinates.
+    """
+    nrows, ncols = passable.shape
+    width = ncols + 2                   # Row length of the padded grid
+    # Pad the grid with obstacles so jumps never need to check bounds
+    open_cells = np.pad(passable, 1, constant_values=False).ravel().tolist()
+    source = (start[0] + 1) * width + start[1] + 1
+    target = (goal[0] + 1) * width + goal[1] + 1
+    state = np.full(len(open_cells), UNVISITED, dtype=np.uint8)
+    dist = np.full(len(open_cells), np.inf)     # Distance from start
+    parent = np.full(len(open_cells), -1, dtype=np.intp)  # Preceding point
+    pqlocator = np.empty(len(open_cells), dtype=object)  # Points in queue
+    queue = AdaptablePriorityQueue()    # Priority queue with (f, h) keys
+    expansions = 0
+
+    def distance(u, v):
+        """Return Manhattan distance between padded cell indices u and v."""
+        u_row, u_col = divmod(u, width)
+        v_row, v_col = divmod(v, width)
+        return abs(u_row - v_row) + abs(u_col - v_col)
+
+    def jump(u, step):
+        """Jump from u in direction step and return the jump point found.
+
+        Return None if the jump runs into an obstacle.
+        """
+        horizontal = abs(step) == 1
+        while True:
+            previous, u = u, u + step
+            if not open_cells[u]:
+                return None                     # Dead end
+            if u == target:
+                return u
+            if horizontal:
+                for vertical in (width, -width):
+                    if open_cells[u + vertical] and \
+                            not open_cells[previous + vertical]:
+                        return u                # Forced neighbor
+            elif jump(u, 1) is not None or jump(u, -1) is not None:
+                return u                        # Horizontal jump succeeded
+
+    def direction(p, u):
+        """Return the unit step from cell p toward cell u along a line."""
+        if p // width == u // width:
+            return 1 if u > p else -1           # Same row, horizontal step
+        return width if u > p else -width       # Same column, vertical step
+
+    def successors(u):
+        """Generate jump points reachable from u given its parent."""
+        if parent[u] < 0:
+            steps = (1, -1, width, -width)      # Start cell, all directions
+        else:
+            step = direction(parent[u], u)
+            if abs(step) == 1:                  # Moving horizontally
+                steps = [step] + [vertical for vertical in (width, -width)
+                                  if open_cells[u + vertical] and
+                                  not open_cells[u - step + vertical]]
+            else:                               # Moving vertically
+                steps = (step, 1, -1)
+        for step in steps:
+            point = jump(u, step)
+            if point is not None:
+                yield point
+
+    dist[source] = 0
+    state[source] = OPEN
+    h = distance(source, target)
+    pqlocator[source] = queue.enqueue((h, h), source)
+    while not queue.is_empty():
+        _, u = queue.dequeue()
+        state[u] = CLOSED
+        expansions += 1
+        if u == target:
+            break                               # Goal settled, stop search
+        for v in successors(u):
+            if state[v] == CLOSED:
+                continue
+            d = dist[u] + distance(u, v)
+            if d < dist[v]:
+                dist[v] = d                     # Relaxation step
+                parent[v] = u
+                h = distance(v, target)
+                if state[v] == OPEN:
+                    queue.update(pqlocator[v], (d + h, h), v)
+                else:
+                    state[v] = OPEN
+                    pqlocator[v] = queue.enqueue((d + h, h), v)
+    if stats is not None:
+        stats['expansions'] = expansions
+    if dist[target] == np.inf:
+        return np.inf, []
+    coords = []                         # Expand jumps into per-cell coords
+    u = target
+    while u != source:
+        p = parent[u]
+        step = direction(p, u)
+        cell = u - step
+        while cell != source:
+            row, col = divmod(int(cell), width)
+            coords.append((row - 1, col - 1))   # Remove padding
+            if cell == p:
+                break
+            cell -= step
+        u = p
+    return int(dist[target]), coords
+
+
+def distance_transform(passable, start, goal=None):
+    """Compute the distance from start to every cell by breadth-first search.
+
+    The passable argument is a 2D boolean array that is False for obstacles,
+    and start is a (row, column) tuple.  The frontier is stored as an array of
+    cell indices into the grid padded with obstacles.  Each step adds the
+    offset of each of the four directions to the frontier, and masks out
+    obstacles and cells already visited, so the cost of each step is
+    proportional to the size of the frontier.  If a goal (row, column) tuple
+    is given the search stops once the goal is reached.
+
+    Return a tuple of two arrays the same shape as passable.  The first holds
+    the int32 distance of each cell from start, or -1 if the cell was not
+    reached.  The second holds the uint8 direction each cell was entered from,
+    one of the FROM_* constants, or NO_PARENT.
+    """
+    nrows, ncols = passable.shape
+    width = ncols + 2                   # Row length of the padded grid
+    # Pad the grid with obstacles so steps never need to check bounds
+    unvisited = np.pad(passable, 1, constant_values=False).ravel()
+    dist = np.full(len(unvisited), -1, dtype=np.int32)
+    parents = np.zeros(len(unvisited), dtype=np.uint8)
+    source = (start[0] + 1) * width + start[1] + 1
+    target = -1 if goal is None else (goal[0] + 1) * width + goal[1] + 1
+    steps = ((width, FROM_ABOVE), (-width, FROM_BELOW),
+             (1, FROM_LEFT), (-1, FROM_RIGHT))
+    frontier = np.array([source])       # Cells at the current distance
+    unvisited[source] = False
+    dist[source] = 0
+    distance = 0
+    while len(frontier) and (target < 0 or dist[target] < 0):
+        distance += 1
+        reached = []
+        for offset, direction in steps:
+            cells = frontier + offset
+            cells = cells[unvisited[cells]]     # Skip obstacles and visited
+            unvisited[cells] = False
+            dist[cells] = distance
+            parents[cells] = direction
+            reached.append(cells)
+        frontier = np.concatenate(reached)
+    shape = (nrows + 2, width)
+    return (dist.reshape(shape)[1:-1, 1:-1],      # Remove padding
+            parents.reshape(shape)[1:-1, 1:-1])
+
+
+def breadth_first_search(passable, start, goal, stats=None):
+    """Find the shortest path from start to goal by breadth-first search.
+
+    Takes the same arguments and returns the same tuple as astar.  The search
+    is performed by distance_transform, and the path is recovered by following
+    the parent directions back from the goal.  If a stats dict is given, the
+    number of cells reached is stored under 'expansions'.
+    """
+    dist, parents = distance_transform(passable, start, goal)
+    if stats is not None:
+        stats['expansions'] = int(np.count_nonzero(dist >= 0))
+    if dist[goal] < 0:
+        return np.inf, []
+    steps = {FROM_ABOVE: (-1, 0), FROM_BELOW: (1, 0),   # Step to parent
+             FROM_LEFT: (0, -1), FROM_RIGHT: (0, 1)}
+    coords = []
+    row, col = goal
+    while True:
+        d_row, d_col = steps[parents[row, col]]
+        row, col = row + d_row, col + d_col
+        if (row, col) == tuple(start):
+            break
+        coords.append((row, col))
+    return int(dist[goal]), coords
+
+
+def _neighbors(index, row, col, nrows, ncols):
+    """Generate (index, row, column) tuples of the 4-connected neighbors."""
+    if row > 0:
+        yield index - ncols, row - 1, col       # Cell above
+    if row < nrows - 1:
+        yield index + ncols, row + 1, col       # Cell below
+    if col > 0:
+        yield index - 1, row, col - 1           # Cell to the left
+    if col < ncols - 1:
+        yield index + 1, row, col + 1           # Cell to the right
+
+
+def _diagonal_neighbors(index, row, col, nrows, ncols, open_cells):
+    """Generate (index, row, column) tuples of the diagonal neighbors.
+
+    A diagonal neighbor is skipped if either cell beside the move is an
+    obstacle, so that paths never cut the corner of an obstacle.
+    """
+    for d_row, d_col in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+        r, c = row + d_row, col + d_col
+        if 0 <= r < nrows and 0 <= c < ncols and \
+                open_cells[row * ncols + c] and open_cells[r * ncols + col]:
+            yield r * ncols + c, r, c
+
+
+def _trace_path(parent, source, target, ncols):
+    """Follow parent indices backwards from target to source.
+
+    Return a list of (row, column) tuples excluding both endpoints.
+    """
+    coords = []
+    index = parent[target]
+    while index != source:
+        coords.append(divmod(int(index), ncols))
+        index = parent[index]
+    return coords
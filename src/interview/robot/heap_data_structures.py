@@ -28,6 +28,7 @@
 
 # Local application/library specific imports
 from interview.robot.array_data_structures import Queue
+from interview.robot.instrumentation import COUNTERS
 
 
 # %% Classes
@@ -314,6 +315,27 @@ class Heap(BinaryTree):
             self._resize_array(self._N // 2)    # Halve size of array
         return element
 
+    def remove_node(self, node):
+        """Remove an arbitrary node from the heap.
+
+        The bottom-right-most position is swapped with the node to be removed,
+        which is then deleted.  The swapped position is bubbled up or down to
+        restore the heap-order property.
+
+        Return element of removed node.
+        """
+        self._validate_node(node)
+        last = self._array[self._size-1]        # Bottom-right-most node
+        if node is last:
+            element = self._delete_node(node)   # No bubbling required
+        else:
+            self._swap(node, last)              # Move last node into place
+            element = self._delete_node(node)
+            self.update_node(last, last.element())  # Bubble up or down
+        if self._size == self._N//4 and self._N > BinaryTree.DEFAULT_CAPACITY:
+            self._resize_array(self._N // 2)    # Halve size of array
+        return element
+
     def _downheap(self, node):
         """Down-heap bubble the node."""
         num_children = self.num_children(node)
@@ -390,6 +412,9 @@ class AdaptablePriorityQueue(Heap):
 
     def enqueue(self, key, value):
         """Add value to queue at location determined by key priority."""
+        counters = COUNTERS.get()
+        if counters is not None:        # Counted by instrumentation
+            counters['enqueue'] += 1
         item = self._Item(key, value)
         node = self.insert_element(item)
         return node
@@ -401,14 +426,35 @@ class AdaptablePriorityQueue(Heap):
         """
         if self.is_empty():
             raise ValueError('Queue is empty!')
+        counters = COUNTERS.get()
+        if counters is not None:        # Counted by instrumentation
+            counters['dequeue'] += 1
         item = self.remove_min()
         return item.key(), item.value()
 
     def update(self, node, key, value):
         """Update node with new key and value."""
+        counters = COUNTERS.get()
+        if counters is not None:        # Counted by instrumentation
+            counters['update'] += 1
         item = self._Item(key, value)
         self.update_node(node, item)
 
+    def remove(self, node):
+        """Remove node from the queue and return its key and value."""
+        item = self.remove_node(node)
+        return item.key(), item.value()
+
+    def min(self):
+        """Return (but do not remove) key and value at front of the queue.
+
+        Raise ValueError if queue is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Queue is empty!')
+        item = self.root().element()
+        return item.key(), item.value()
+
     def first(self):
         """Return (but do not remove) element at the front of the queue.
 
@@ -0,0 +1,457 @@
+"""Hierarchical pathfinding (HPA*) for very large robot maps.
+
+###############################################################################
+# hierarchical.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Answer robot-to-goal queries on a small abstract graph of
+#               cluster entrances rather than on the full grid.
+#
+# Contents:
+#
+#   Hierarchy: Abstract graph of cluster entrances stored as NumPy arrays.
+#
+#   build_hierarchy: Preprocess a passability grid into a Hierarchy.
+#
+#   load_hierarchy: Load a Hierarchy saved to disk.
+#
+#   cached_hierarchy: Load the Hierarchy cached beside a map, or build it.
+#
+#   hpa_search: Find a path using the abstract graph, then refine it.
+#
+#   hpa_solution: Solve a map file using a cached Hierarchy.
+#
+###############################################################################
+
+The map is cut into square clusters of cluster_size cells.  Along the border
+between two clusters, each maximal run of open cell pairs is an entrance.
+Short entrances get a single transition in their middle, while long entrances
+get a transition at each end.  The two cells of a transition become nodes of
+the abstract graph, joined by an edge of weight 1.  Within each cluster the
+distance between every pair of its nodes is found by breadth-first searches
+restricted to the cluster, and stored as an intra-cluster edge.
+
+To answer a query the robot and goal are linked to the nodes of their own
+clusters, the abstract graph is searched with A*, and every abstract edge along
+the result is refined into cells by another search within a single cluster.
+Like HPA*, the paths found are near-optimal: they pass through transitions
+rather than through every possible border crossing.  The abstract graph is
+stored in compressed sparse row (CSR) form, and can be saved beside the map
+file so that repeated queries on the same map skip preprocessing.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.array_data_structures import Queue
+from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.map_io import read_grid, find_cell, grid_digest
+from interview.robot.map_io import cache_filename, cached_npz
+from interview.robot.map_io import OBSTACLE, ROBOT, GOAL
+from interview.robot.robot_path import write_map
+
+
+# %% Constants
+DEFAULT_CLUSTER_SIZE = 16       # Width and height of clusters in cells
+MAX_ENTRANCE_WIDTH = 6          # Wider entrances get two transitions
+CACHE_SUFFIX = '_HIERARCHY.npz'  # Name of cached hierarchy after map stem
+
+
+# %% Classes
+class Hierarchy:
+    """Abstract graph of cluster entrances stored as NumPy arrays.
+
+    Node i of the abstract graph is the cell with flat index nodes[i], where
+    the nodes array is sorted.  The neighbors of node i are the node IDs in
+    indices[indptr[i]:indptr[i+1]], with the edge weights in the same slice of
+    weights.  Every edge is stored once in each direction.
+    """
+
+    def __init__(self, shape, cluster_size, nodes, indptr, indices, weights,
+                 digest=''):
+        """Store the abstract graph and the map it was built from."""
+        self.shape = tuple(int(x) for x in shape)
+        self.cluster_size = int(cluster_size)
+        self.nodes = nodes
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.digest = digest            # Of map grid and cluster size
+        ncols = self.shape[1]
+        k = self.cluster_size
+        clusters_per_row = -(-ncols // k)
+        # Cluster ID of every node, used to link queries to the graph
+        self._node_clusters = (nodes // ncols // k) * clusters_per_row + \
+            (nodes % ncols) // k
+
+    def node_count(self):
+        """Return number of nodes in the abstract graph."""
+        return len(self.nodes)
+
+    def edge_count(self):
+        """Return number of undirected edges in the abstract graph."""
+        return len(self.indices) // 2
+
+    def cluster_bounds(self, cell):
+        """Return (row0, row1, col0, col1) bounds of the cluster of a cell.
+
+        The upper bounds are exclusive.
+        """
+        k = self.cluster_size
+        row0 = cell[0] // k * k
+        col0 = cell[1] // k * k
+        return (row0, min(row0 + k, self.shape[0]),
+                col0, min(col0 + k, self.shape[1]))
+
+    def cluster_nodes(self, cell):
+        """Return array of IDs of the nodes in the cluster of a cell."""
+        k = self.cluster_size
+        clusters_per_row = -(-self.shape[1] // k)
+        cluster = (cell[0] // k) * clusters_per_row + cell[1] // k
+        return np.flatnonzero(self._node_clusters == cluster)
+
+    def save(self, filename):
+        """Save the abstract graph to a .npz file."""
+        np.savez(filename, **self._arrays())
+
+    def _arrays(self):
+        """Return dict of the arrays saved to disk."""
+        return {'shape': np.array(self.shape),
+                'cluster_size': np.array(self.cluster_size),
+                'nodes': self.nodes, 'indptr': self.indptr,
+                'indices': self.indices, 'weights': self.weights,
+                'digest': np.array(self.digest)}
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        """Return a hierarchy of the arrays returned by _arrays()."""
+        return cls(arrays['shape'], arrays['cluster_size'], arrays['nodes'],
+                   arrays['indptr'], arrays['indices'], arrays['weights'],
+                   str(arrays['digest']))
+
+
+# %% Functions
+def build_hierarchy(passable, cluster_size=DEFAULT_CLUSTER_SIZE, digest=''):
+    """Preprocess a 2D boolean passability grid into a Hierarchy.
+
+    The optional digest identifies the map the hierarchy was built from.
+    """
+    nrows, ncols = passable.shape
+    k = cluster_size
+    src, dst = [], []                   # Cells of each transition
+    for col in range(k, ncols, k):      # Borders between cluster columns
+        crossing = passable[:, col-1] & passable[:, col]
+        for row in _transitions(crossing, k):
+            src.append(row * ncols + col - 1)
+            dst.append(row * ncols + col)
+    for row in range(k, nrows, k):      # Borders between cluster rows
+        crossing = passable[row-1, :] & passable[row, :]
+        for col in _transitions(crossing, k):
+            src.append((row - 1) * ncols + col)
+            dst.append(row * ncols + col)
+    nodes = np.unique(np.array(src + dst, dtype=np.int64))
+    edge_src = list(np.searchsorted(nodes, src))    # Inter-cluster edges
+    edge_dst = list(np.searchsorted(nodes, dst))
+    edge_weights = [1] * len(src)
+    hierarchy = Hierarchy(passable.shape, k, nodes, None, None, None, digest)
+    order = np.argsort(hierarchy._node_clusters, kind='stable')
+    splits = np.flatnonzero(np.diff(hierarchy._node_clusters[order])) + 1
+    for members in np.split(order, splits):         # Intra-cluster edges
+        if len(members) < 2:
+            continue
+        rows, cols = np.divmod(nodes[members], ncols)
+        bounds = hierarchy.cluster_bounds((rows[0], cols[0]))
+        rows -= bounds[0]               # Coordinates within cluster block
+        cols -= bounds[2]
+        block = passable[bounds[0]:bounds[1], bounds[2]:bounds[3]]
+        dist = _cluster_distances(block, rows, cols)[:, rows, cols]
+        i, j = np.nonzero(np.triu(dist >= 0, k=1))  # Each pair once
+        edge_src.extend(members[i])
+        edge_dst.extend(members[j])
+        edge_weights.extend(dist[i, j])
+    indptr, indices, weights = _to_csr(len(nodes), edge_src, edge_dst,
+                                       edge_weights)
+    hierarchy.indptr = indptr
+    hierarchy.indices = indices
+    hierarchy.weights = weights
+    return hierarchy
+
+
+def load_hierarchy(filename):
+    """Load a Hierarchy saved to disk by Hierarchy.save()."""
+    with np.load(filename) as data:
+        return Hierarchy._from_arrays(data)
+
+
+def hierarchy_filename(filename):
+    """Return filename of the Hierarchy cached beside a map file."""
+    return cache_filename(filename, CACHE_SUFFIX)
+
+
+def cached_hierarchy(filename, cluster_size=DEFAULT_CLUSTER_SIZE, grid=None):
+    """Return the Hierarchy of a map, building it only if necessary.
+
+    A Hierarchy cached beside the map file is loaded if it was built from the
+    same map contents with the same cluster size.  Otherwise the Hierarchy is
+    built and saved beside the map file.  If the grid returned by read_grid is
+    given the map is not read in again.
+    """
+    if grid is None:
+        grid = read_grid(filename)
+    digest = grid_digest(grid, cluster_size)
+
+    def build():
+        """Return the arrays of the hierarchy of the map."""
+        return build_hierarchy(grid != OBSTACLE, cluster_size,
+                               digest)._arrays()
+
+    arrays = cached_npz(filename, CACHE_SUFFIX, digest, build)
+    return Hierarchy._from_arrays(arrays)
+
+
+def hpa_search(hierarchy, passable, start, goal, stats=None):
+    """Find a path from start to goal using the abstract graph.
+
+    The start and goal arguments are (row, column) tuples.  If start and goal
+    share a cluster, the direct path within the cluster is also considered.
+
+    Return a tuple of the path length and a list of (row, column) tuples along
+    the path, ordered from goal to start and excluding both endpoints.  If the
+    goal is unreachable return (np.inf, []).  If a stats dict is given, the
+    number of abstract nodes removed from the queue is stored under
+    'expansions'.
+    """
+    ncols = passable.shape[1]
+    nodes = hierarchy.nodes
+    n = hierarchy.node_count()
+    source, target = n, n + 1           # IDs of virtual start and goal nodes
+    start_bounds = hierarchy.cluster_bounds(start)
+    goal_bounds = hierarchy.cluster_bounds(goal)
+    start_dist, _ = _cluster_bfs(passable, start_bounds,
+                                 _local_index(start, start_bounds))
+    goal_dist, _ = _cluster_bfs(passable, goal_bounds,
+                                _local_index(goal, goal_bounds))
+    best = np.inf                       # Length of direct path, if any
+    if start_bounds == goal_bounds:
+        direct = start_dist[_local_index(goal, goal_bounds)]
+        if direct >= 0:
+            best = direct
+
+    def links(cell, bounds, dist):
+        """Return (node, distance) tuples linking a cell to its cluster."""
+        result = []
+        for node in hierarchy.cluster_nodes(cell):
+            d = dist[_local_index(divmod(int(nodes[node]), ncols), bounds)]
+            if d >= 0:
+                result.append((int(node), int(d)))
+        return result
+
+    start_links = links(start, start_bounds, start_dist)
+    goal_links = dict(links(goal, goal_bounds, goal_dist))
+
+    def heuristic(node):
+        """Return Manhattan distance from node to the goal."""
+        if node >= n:
+            return 0 if node == target else \
+                abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+        row, col = divmod(int(nodes[node]), ncols)
+        return abs(row - goal[0]) + abs(col - goal[1])
+
+    def neighbors(u):
+        """Generate (node, weight) tuples of the neighbors of node u."""
+        if u == source:
+            yield from start_links
+            return
+        for i in range(hierarchy.indptr[u], hierarchy.indptr[u+1]):
+            yield int(hierarchy.indices[i]), int(hierarchy.weights[i])
+        if u in goal_links:
+            yield target, goal_links[u]
+
+    dist = np.full(n + 2, np.inf)
+    parent = np.full(n + 2, -1, dtype=np.intp)
+    closed = np.zeros(n + 2, dtype=bool)
+    pqlocator = np.empty(n + 2, dtype=object)
+    queue = AdaptablePriorityQueue()
+    expansions = 0
+    dist[source] = 0
+    pqlocator[source] = queue.enqueue(heuristic(source), source)
+    while not queue.is_empty():
+        if queue.min()[0] >= best:
+            break                       # Direct path cannot be improved upon
+        _, u = queue.dequeue()
+        closed[u] = True
+        expansions += 1
+        if u == target:
+            break
+        for v, weight in neighbors(u):
+            if closed[v]:
+                continue
+            d = dist[u] + weight
+            if d < dist[v]:
+                dist[v] = d             # Relaxation step
+                parent[v] = u
+                if pqlocator[v] is None:
+                    pqlocator[v] = queue.enqueue(d + heuristic(v), v)
+                else:
+                    queue.update(pqlocator[v], d + heuristic(v), v)
+    if stats is not None:
+        stats['expansions'] = expansions
+    if dist[target] < best:             # Refine the abstract path
+        waypoints = [goal]
+        u = parent[target]
+        while u != source:
+            waypoints.append(divmod(int(nodes[u]), ncols))
+            u = parent[u]
+        waypoints.append(start)
+        waypoints.reverse()
+        length = int(dist[target])
+    elif best < np.inf:                 # Direct path within one cluster
+        waypoints = [start, goal]
+        length = int(best)
+    else:
+        return np.inf, []
+    cells = [start]
+    for a, b in zip(waypoints, waypoints[1:]):
+        cells.extend(_refine(passable, hierarchy, a, b))
+    coords = cells[-2:0:-1]             # Goal to start, without endpoints
+    return length, coords
+
+
+def hpa_solution(filename, cluster_size=DEFAULT_CLUSTER_SIZE):
+    """Solve a map file using its cached Hierarchy and write the solution.
+
+    Return a tuple of the solution filename and the path length, as returned
+    by robot_path.solve_map.
+    """
+    filename = Path(filename)
+    grid = read_grid(filename)
+    hierarchy = cached_hierarchy(filename, cluster_size, grid)
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    length, coords = hpa_search(hierarchy, grid != OBSTACLE, start, goal)
+    out_fn = write_map(filename, coords, grid)
+    return out_fn, length
+
+
+def _transitions(crossing, k):
+    """Generate the transitions along a cluster border.
+
+    The crossing argument is a boolean array that is True where the cells on
+    both sides of the border are open.  Runs of crossings are split where the
+    border passes from one cluster to the next.
+    """
+    for offset in range(0, len(crossing), k):
+        segment = crossing[offset:offset+k].astype(np.int8)
+        edges = np.diff(np.concatenate(([0], segment, [0])))
+        starts = np.flatnonzero(edges == 1)         # First cell of each run
+        ends = np.flatnonzero(edges == -1) - 1      # Last cell of each run
+        for first, last in zip(starts, ends):
+            if last - first + 1 < MAX_ENTRANCE_WIDTH:
+                yield int(offset + (first + last) // 2)
+            else:
+                yield int(offset + first)
+                yield int(offset + last)
+
+
+def _local_index(cell, bounds):
+    """Return index of a cell within the flattened cluster block."""
+    row0, _, col0, col1 = bounds
+    return (cell[0] - row0) * (col1 - col0) + cell[1] - col0
+
+
+def _cluster_distances(block, rows, cols):
+    """Return distances within a cluster block from several source cells.
+
+    All sources are searched at once, one breadth-first frontier per source.
+    Each step shifts every frontier one cell in all four directions using
+    NumPy array operations.  Return an array of shape (sources, block rows,
+    block columns) holding the distances, or -1 for unreached cells.
+    """
+    count = len(rows)
+    dist = np.full((count,) + block.shape, -1, dtype=np.int64)
+    frontier = np.zeros((count,) + block.shape, dtype=bool)
+    frontier[np.arange(count), rows, cols] = True
+    visited = frontier.copy()
+    dist[frontier] = 0
+    step = 0
+    while frontier.any():
+        step += 1
+        expanded = np.zeros_like(frontier)
+        expanded[:, 1:, :] |= frontier[:, :-1, :]   # Move down
+        expanded[:, :-1, :] |= frontier[:, 1:, :]   # Move up
+        expanded[:, :, 1:] |= frontier[:, :, :-1]   # Move right
+        expanded[:, :, :-1] |= frontier[:, :, 1:]   # Move left
+        frontier = expanded & block & ~visited
+        visited |= frontier
+        dist[frontier] = step
+    return dist
+
+
+def _cluster_bfs(passable, bounds, source):
+    """Breadth-first search from source restricted to a single cluster.
+
+    The source is an index within the flattened cluster block.  Return arrays
+    of the distance (-1 if unreached) and parent index of each block cell.
+    """
+    row0, row1, col0, col1 = bounds
+    block = passable[row0:row1, col0:col1].ravel()
+    nrows, ncols = row1 - row0, col1 - col0
+    dist = np.full(len(block), -1, dtype=np.int64)
+    parent = np.full(len(block), -1, dtype=np.intp)
+    dist[source] = 0
+    queue = Queue()
+    queue.enqueue(source)
+    while not queue.is_empty():
+        u = queue.dequeue()
+        row, col = divmod(u, ncols)
+        for v, valid in ((u - ncols, row > 0), (u + ncols, row < nrows - 1),
+                         (u - 1, col > 0), (u + 1, col < ncols - 1)):
+            if valid and block[v] and dist[v] < 0:
+                dist[v] = dist[u] + 1
+                parent[v] = u
+                queue.enqueue(v)
+    return dist, parent
+
+
+def _refine(passable, hierarchy, a, b):
+    """Return the cells after a up to and including b along the path.
+
+    Cells a and b are either adjacent cells in neighboring clusters, or cells
+    in the same cluster joined by a path within that cluster.
+    """
+    if a == b:
+        return []
+    bounds = hierarchy.cluster_bounds(a)
+    if bounds != hierarchy.cluster_bounds(b):
+        return [b]                      # Transition between clusters
+    row0, _, col0, col1 = bounds
+    _, parent = _cluster_bfs(passable, bounds, _local_index(a, bounds))
+    cells = []
+    u = _local_index(b, bounds)
+    while u >= 0:
+        row, col = divmod(int(u), col1 - col0)
+        cells.append((row0 + row, col0 + col))
+        u = parent[u]
+    cells.pop()                         # Remove cell a
+    cells.reverse()
+    return cells
+
+
+def _to_csr(n, src, dst, weights):
+    """Return CSR arrays of an undirected graph with n nodes."""
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    heads = np.concatenate((src, dst))  # Store each edge in both directions
+    tails = np.concatenate((dst, src))
+    order = np.argsort(heads, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=n), out=indptr[1:])
+    return indptr, tails[order], np.concatenate((weights, weights))[order]
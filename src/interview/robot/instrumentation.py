@@ -0,0 +1,213 @@
+"""Per-stage timing and operation counts of the robot path solution.
+
+###############################################################################
+# instrumentation.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Find where the time goes when a map is slow to solve, without
+#               slowing down the solution when it is not being measured.
+#
+# Contents:
+#
+#   PipelineReport: Wall time of each stage and counts of each operation.
+#
+#   instrument: Context manager recording a PipelineReport.
+#
+###############################################################################
+
+While the instrument context manager is active, the functions of the
+solution named in STAGES are replaced by wrappers that time each call, and the
+data structures count their operations into the counters of the report.  The
+report being recorded is held in a context variable, ACTIVE_REPORT, and its
+counters in a second one, COUNTERS, so only code running in the same context
+as the instrument block is measured: a search run by another thread at the
+same time is neither timed nor counted, whether it runs instrumented or not.
+Whenever no report is being recorded, the data structures pay only for
+checking that COUNTERS is None.
+
+The wrappers of the functions are placed in the namespace given to
+instrument when the first instrument block using it is entered, and the
+originals are restored when the last one exits.  The wrappers look up the
+report at call time, and call the original straight away if there is none.
+
+The times of the stages are inclusive: the time of grid_to_graph includes the
+time spent in the grid_edges call it makes.  A stage that was never called,
+such as astar when the Dijkstra engine solves the map, is absent from the
+report, rather than reported as taking no time.  The counters are:
+
+'enqueue', 'dequeue', 'update':     Operations on an AdaptablePriorityQueue
+'map_lookups':                      Keys looked up in a Map, including get()
+'edges_relaxed':                    Edge weights read from a Graph or
+                                    FrozenGraph while relaxing edges
+
+The report is not thread-safe.  Work done by threads started inside the
+instrument block is not recorded, since they do not inherit its context, and a
+report passed to instrument blocks in several threads at once may lose counts.
+
+The report is returned by robot_path.robot_solution(filename, instrument=True)
+and can be exported as JSON:
+
+out_fn, report = robot_solution(filename, instrument=True)
+report.save('report.json')
+"""
+
+# %% Imports
+# Standard system imports
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import json
+import threading
+import time
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+
+
+# %% Constants
+STAGES = ('read_grid',                  # Functions of robot_path to time
+          'cached_components',
+          'map_to_graph',
+          'grid_to_graph',
+          'grid_edges',
+          'shortest_path_length',
+          'bidirectional_shortest_path',
+          'shortest_path_tree',
+          'calculate_shortest_path_coords',
+          'astar',
+          'jump_point_search',
+          'breadth_first_search',
+          'write_map')
+COUNTED = ('enqueue',                   # Counters of the data structures
+           'dequeue',
+           'update',
+           'map_lookups',
+           'edges_relaxed')
+ACTIVE_REPORT = ContextVar('ACTIVE_REPORT', default=None)
+COUNTERS = ContextVar('COUNTERS', default=None)  # Counters of ACTIVE_REPORT
+
+
+# %% Installed wrappers
+_installed = {}                         # id(namespace): [users, originals]
+_installed_lock = threading.Lock()
+
+
+# %% Classes
+class PipelineReport:
+    """Wall time of each stage and counts of each operation.
+
+    The stages attribute maps the name of each stage in STAGES that was
+    called to a dict of the number of calls and the total seconds spent in
+    them, and the counters attribute maps each name in COUNTED to the number
+    of operations.  The summary
+    attribute holds the map filename, engine, path length, and solution
+    filename, as filled in by robot_path.robot_solution, and the seconds
+    attribute the total wall time.
+    """
+
+    def __init__(self):
+        """Create an empty report."""
+        self.stages = {}                # Only stages that were called
+        self.counters = dict.fromkeys(COUNTED, 0)
+        self.summary = {}
+        self.seconds = 0.0              # Wall time inside instrument()
+
+    def as_dict(self):
+        """Return the report as a dict of JSON-compatible values."""
+        summary = {}
+        for key, value in self.summary.items():
+            if isinstance(value, (float, np.floating)) and np.isinf(value):
+                value = None            # Unreachable goal, no JSON Infinity
+            elif isinstance(value, np.generic):
+                value = value.item()
+            elif not isinstance(value, (int, float, str, type(None))):
+                value = str(value)      # Path objects
+            summary[key] = value
+        return {'summary': summary, 'seconds': self.seconds,
+                'stages': {name: dict(record)
+                           for name, record in self.stages.items()},
+                'counters': dict(self.counters)}
+
+    def to_json(self, indent=2):
+        """Return the report as a JSON string."""
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def save(self, filename):
+        """Write the report to a JSON file."""
+        with open(filename, 'w') as fout:
+            fout.write(self.to_json())
+
+
+# %% Functions
+def _timed(function, name):
+    """Return wrapper of function adding its calls and time to the report."""
+
+    @wraps(function)
+    def timed(*args, **kwargs):
+        report = ACTIVE_REPORT.get()
+        if report is None:              # Called outside of instrument()
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record = report.stages.setdefault(name,
+                                              {'calls': 0, 'seconds': 0.0})
+            record['calls'] += 1
+            record['seconds'] += time.perf_counter() - start
+
+    return timed
+
+
+def _install(namespace):
+    """Place wrappers of the functions named in STAGES in namespace."""
+    with _installed_lock:
+        users = _installed.setdefault(id(namespace), [0, {}])
+        if users[0] == 0:
+            for name in STAGES:
+                if name in namespace:
+                    users[1][name] = namespace[name]
+                    namespace[name] = _timed(namespace[name], name)
+        users[0] += 1
+
+
+def _uninstall(namespace):
+    """Restore the original functions once namespace has no more users."""
+    with _installed_lock:
+        users = _installed[id(namespace)]
+        users[0] -= 1
+        if users[0] == 0:
+            namespace.update(users[1])
+            del _installed[id(namespace)]
+
+
+@contextmanager
+def instrument(namespace, report=None):
+    """Record a PipelineReport of the code run inside the context.
+
+    The namespace is the dict of globals, such as globals() of robot_path,
+    holding the functions named in STAGES.  Functions are looked up in it at
+    call time, so the wrappers placed in it are called by the solution.
+    Stages missing from the namespace are never recorded.
+
+    Yield the report, creating a new PipelineReport if none is given.  The
+    report records only code run in the context of the with statement.
+    """
+    if report is None:
+        report = PipelineReport()
+    _install(namespace)
+    report_token = ACTIVE_REPORT.set(report)
+    counters_token = COUNTERS.set(report.counters)
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.seconds += time.perf_counter() - start
+        COUNTERS.reset(counters_token)
+        ACTIVE_REPORT.reset(report_token)
+        _uninstall(namespace)
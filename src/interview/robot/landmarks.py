@@ -0,0 +1,242 @@
+"""Landmark (ALT) index for repeated queries on a single robot map.
+
+###############################################################################
+# landmarks.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Precompute exact distances from a few landmark cells so that
+#               many robot-to-goal queries on one map search fewer cells.
+#
+# Contents:
+#
+#   LandmarkIndex: Distances from each landmark stored as NumPy arrays.
+#
+#   build_landmarks: Select landmarks and compute their distance arrays.
+#
+#   load_landmarks: Load a LandmarkIndex saved to disk.
+#
+#   cached_landmarks: Load the LandmarkIndex cached beside a map, or build it.
+#
+#   alt_search: A* search using landmark lower bounds.
+#
+#   alt_solution: Solve a map file using a cached LandmarkIndex.
+#
+###############################################################################
+
+ALT stands for A*, landmarks, and the triangle inequality.  If d(L, v) is the
+exact distance from landmark L to cell v, then for any cells v and t the
+triangle inequality gives
+
+    d(v, t) >= |d(L, v) - d(L, t)|
+
+The largest of these bounds over all landmarks is a consistent heuristic that
+is usually far tighter than the Manhattan distance on maps with walls, so A*
+settles fewer cells.  The distances from each landmark are computed once per
+map by Djikstra's algorithm on the graph of the map, frozen into a FrozenGraph
+since the same graph is searched from every landmark.
+
+Landmarks are chosen by farthest-point selection: each new landmark is the
+open cell farthest from the landmarks already chosen.  Cells unreachable from
+every chosen landmark count as infinitely far, so each connected region of the
+map receives a landmark before any region receives a second one.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar
+from interview.robot.map_io import read_grid, find_cell, grid_digest
+from interview.robot.map_io import cache_filename, cached_npz
+from interview.robot.map_io import OBSTACLE, ROBOT, GOAL
+from interview.robot.robot_path import grid_to_graph, shortest_path_length
+from interview.robot.robot_path import write_map
+
+
+# %% Constants
+DEFAULT_LANDMARKS = 8           # Number of landmarks in an index
+UNREACHABLE = -1                # Distance stored for unreachable cells
+CACHE_SUFFIX = '_LANDMARKS.npz'  # Name of cached index after map stem
+
+
+# %% Classes
+class LandmarkIndex:
+    """Distances from each landmark stored as NumPy arrays.
+
+    The landmarks array holds the flat index row * ncols + col of each
+    landmark cell.  Row i of the distances array holds the distance from each
+    landmark to the cell with flat index i, or UNREACHABLE.  Storing the
+    distances of a cell contiguously keeps each heuristic evaluation to a
+    single read.
+    """
+
+    def __init__(self, shape, landmarks, distances, digest=''):
+        """Store the landmark distances and the map they were built from."""
+        self.shape = tuple(int(x) for x in shape)
+        self.landmarks = landmarks
+        self.distances = distances
+        self.digest = digest            # Of map grid and landmarks requested
+
+    def landmark_count(self):
+        """Return number of landmarks in the index."""
+        return len(self.landmarks)
+
+    def heuristic(self, goal):
+        """Return a heuristic function for A* searches toward goal.
+
+        The function takes the row and column of a cell and returns the
+        largest lower bound on its distance to the goal given by either the
+        landmarks or the Manhattan distance.  Only landmarks that reach the
+        goal give a bound.
+        """
+        ncols = self.shape[1]
+        goal_row, goal_col = goal
+        goal_dist = self.distances[goal_row * ncols + goal_col]
+        columns = np.flatnonzero(goal_dist != UNREACHABLE)
+        goal_dist = goal_dist[columns]
+        distances = self.distances
+
+        def heuristic(row, col):
+            """Return lower bound on distance from (row, col) to the goal."""
+            bound = abs(row - goal_row) + abs(col - goal_col)
+            if len(columns):
+                dist = distances[row * ncols + col, columns]
+                bound = max(bound, int(np.abs(dist - goal_dist).max()))
+            return bound
+
+        return heuristic
+
+    def separated(self, start, goal):
+        """Return True if the index proves goal is unreachable from start.
+
+        A landmark that reaches exactly one of the two cells shows that they
+        lie in different connected regions of the map.
+        """
+        ncols = self.shape[1]
+        start_dist = self.distances[start[0] * ncols + start[1]]
+        goal_dist = self.distances[goal[0] * ncols + goal[1]]
+        return bool(np.any((start_dist == UNREACHABLE) !=
+                           (goal_dist == UNREACHABLE)))
+
+    def save(self, filename):
+        """Save the index to a .npz file."""
+        np.savez(filename, **self._arrays())
+
+    def _arrays(self):
+        """Return dict of the arrays saved to disk."""
+        return {'shape': np.array(self.shape), 'landmarks': self.landmarks,
+                'distances': self.distances, 'digest': np.array(self.digest)}
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        """Return an index of the arrays returned by _arrays()."""
+        return cls(arrays['shape'], arrays['landmarks'], arrays['distances'],
+                   str(arrays['digest']))
+
+
+# %% Functions
+def build_landmarks(grid, count=DEFAULT_LANDMARKS, digest=''):
+    """Build a LandmarkIndex of a map read in by read_grid.
+
+    Fewer than count landmarks are chosen if the map has fewer open cells.
+    The optional digest identifies the map the index was built from.
+    """
+    nrows, ncols = grid.shape
+    graph, _, _, vert_map = grid_to_graph(grid, prune_obstacles=True)
+    frozen = graph.freeze()             # Searched once for each landmark
+    cells = np.empty(frozen.vertex_count(), dtype=np.int64)  # Of each vertex
+    vertices = np.full(nrows * ncols, -1, dtype=np.int64)  # Of each cell
+    for idx, vertex in enumerate(graph.vertices()):
+        row, col = vert_map[vertex]
+        cells[idx] = row * ncols + col
+        vertices[row * ncols + col] = idx
+
+    def distances_from(cell):
+        """Return array of distances from a cell using Djikstra's algorithm."""
+        cloud, _ = shortest_path_length(frozen, int(vertices[cell]))
+        dist = np.full(nrows * ncols, UNREACHABLE, dtype=np.int32)
+        for vertex, distance in cloud:
+            dist[cells[vertex]] = distance
+        return dist
+
+    open_cells = (grid != OBSTACLE).ravel()
+    # The first landmark is the cell farthest from the first open cell
+    cell = int(np.argmax(distances_from(int(np.argmax(open_cells)))))
+    nearest = np.where(open_cells, np.inf, -np.inf)  # To nearest landmark
+    landmarks, columns = [], []
+    while len(landmarks) < count and nearest[cell] > 0:
+        landmarks.append(cell)
+        dist = distances_from(cell)
+        columns.append(dist)
+        reached = dist != UNREACHABLE
+        nearest[reached] = np.minimum(nearest[reached], dist[reached])
+        cell = int(np.argmax(nearest))  # Farthest cell from all landmarks
+    return LandmarkIndex(grid.shape, np.array(landmarks, dtype=np.int64),
+                         np.column_stack(columns), digest)
+
+
+def load_landmarks(filename):
+    """Load a LandmarkIndex saved to disk by LandmarkIndex.save()."""
+    with np.load(filename) as data:
+        return LandmarkIndex._from_arrays(data)
+
+
+def landmark_filename(filename):
+    """Return filename of the LandmarkIndex cached beside a map file."""
+    return cache_filename(filename, CACHE_SUFFIX)
+
+
+def cached_landmarks(filename, count=DEFAULT_LANDMARKS, grid=None):
+    """Return the LandmarkIndex of a map, building it only if necessary.
+
+    An index cached beside the map file is loaded if it was built from the
+    same map contents with the same number of landmarks requested.  Otherwise
+    the index is built and saved beside the map file.  If the grid returned by
+    read_grid is given the map is not read in again.
+    """
+    if grid is None:
+        grid = read_grid(filename)
+    digest = grid_digest(grid, count)
+
+    def build():
+        """Return the arrays of the index of the map."""
+        return build_landmarks(grid, count, digest)._arrays()
+
+    arrays = cached_npz(filename, CACHE_SUFFIX, digest, build)
+    return LandmarkIndex._from_arrays(arrays)
+
+
+def alt_search(index, passable, start, goal, stats=None):
+    """Find the shortest path from start to goal using landmark bounds.
+
+    Takes the same arguments and returns the same tuple as grid_search.astar,
+    with the LandmarkIndex of the map as the first argument.  If the landmarks
+    show that the goal is unreachable no search is performed.
+    """
+    if index.separated(start, goal):
+        if stats is not None:
+            stats['expansions'] = 0
+        return np.inf, []
+    return astar(passable, start, goal, stats, index.heuristic(goal))
+
+
+def alt_solution(filename, count=DEFAULT_LANDMARKS):
+    """Solve a map file using its cached LandmarkIndex and write the solution.
+
+    Return a tuple of the solution filename and the path length, as returned
+    by robot_path.solve_map.
+    """
+    filename = Path(filename)
+    grid = read_grid(filename)
+    index = cached_landmarks(filename, count, grid)
+    start, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    length, coords = alt_search(index, grid != OBSTACLE, start, goal)
+    out_fn = write_map(filename, coords, grid)
+    return out_fn, length
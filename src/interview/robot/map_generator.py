@@ -0,0 +1,205 @@
+"""Seeded generator of synthetic robot maps.
+
+###############################################################################
+# map_generator.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Generate maps of any size to measure how the search engines
+#               scale beyond the small "Programming Test A" data files.
+#
+# Contents:
+#
+#   generate_map: Return a grid of the given size, style, and density.
+#
+#   place_robot_goal: Place a robot and a goal it can reach on a grid.
+#
+#   write_generated_map: Generate a map and write it to disk.
+#
+###############################################################################
+
+Each map is built with NumPy array operations rather than cell by cell, so
+maps of several million cells take well under a second to generate.  The same
+seed always gives the same map.  The styles in MAP_STYLES are:
+
+'open':     Obstacles scattered at random, each cell an obstacle with the
+            given density
+'rooms':    Square rooms separated by walls, with a door between each pair of
+            neighboring rooms, and clutter scattered in the rooms with the
+            given density
+'maze':     A perfect maze carved by the binary tree algorithm, one random
+            passage north or west from each cell, with random walls then
+            knocked out to bring the obstacle fraction down to the density
+
+Every map holds exactly one robot and one goal, and the goal is always
+reachable from the robot.  The goal is placed at least half as far from the
+robot as the farthest reachable cell, so the search has to cross the map.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import distance_transform
+from interview.robot.map_io import write_grid, OBSTACLE, OPEN, ROBOT, GOAL
+
+
+# %% Constants
+MAP_STYLES = ('open', 'rooms', 'maze')  # Styles of generated map
+DEFAULT_DENSITY = 0.3                   # Fraction of cells that are obstacles
+ROOM_SIZE = 10                          # Rooms and their wall, in cells
+PLACEMENT_TRIES = 8                     # Robot cells tried by each map
+
+
+# %% Functions
+def _open_field(rng, nrows, ncols, density):
+    """Return grid with obstacles scattered at random."""
+    grid = np.full((nrows, ncols), OPEN, dtype=np.uint8)
+    grid[rng.random((nrows, ncols)) < density] = OBSTACLE
+    return grid
+
+
+def _rooms(rng, nrows, ncols, density):
+    """Return grid of rooms joined by doors and scattered with clutter."""
+    grid = _open_field(rng, nrows, ncols, density)
+    # One door in each room-wide segment of each wall row and wall column
+    wall_rows = np.arange(ROOM_SIZE - 1, nrows, ROOM_SIZE)
+    wall_cols = np.arange(ROOM_SIZE - 1, ncols, ROOM_SIZE)
+    door_cols = (np.arange(0, ncols, ROOM_SIZE) +
+                 rng.integers(0, ROOM_SIZE - 1,
+                              size=(len(wall_rows), (ncols - 1) //
+                                    ROOM_SIZE + 1)))
+    door_rows = (np.arange(0, nrows, ROOM_SIZE)[:, None] +
+                 rng.integers(0, ROOM_SIZE - 1,
+                              size=((nrows - 1) // ROOM_SIZE + 1,
+                                    len(wall_cols))))
+    rows = np.broadcast_to(wall_rows[:, None], door_cols.shape)
+    inside = door_cols < ncols
+    rows, door_cols = rows[inside], door_cols[inside]
+    cols = np.broadcast_to(wall_cols[None, :], door_rows.shape)
+    inside = door_rows < nrows
+    cols, door_rows = cols[inside], door_rows[inside]
+    grid[wall_rows, :] = OBSTACLE
+    grid[:, wall_cols] = OBSTACLE
+    # Doors never fall on a wall crossing, and clutter never blocks them
+    for offset in (-1, 0, 1):
+        grid[np.clip(rows + offset, 0, nrows - 1), door_cols] = OPEN
+        grid[door_rows, np.clip(cols + offset, 0, ncols - 1)] = OPEN
+    return grid
+
+
+def _maze(rng, nrows, ncols, density):
+    """Return grid of a binary tree maze with walls knocked out."""
+    grid = np.full((nrows, ncols), OBSTACLE, dtype=np.uint8)
+    grid[::2, ::2] = OPEN               # Maze cells at even rows and columns
+    cells = grid[::2, ::2].shape
+    north = rng.random(cells) < 0.5     # Else carve a passage west
+    north[0, :] = False                 # Top row can only carve west
+    north[:, 0] = True                  # Left column can only carve north
+    north[0, 0] = False                 # First cell is the root of the tree
+    west = ~north
+    west[0, 0] = False
+    rows, cols = np.nonzero(north)
+    grid[2 * rows - 1, 2 * cols] = OPEN
+    rows, cols = np.nonzero(west)
+    grid[2 * rows, 2 * cols - 1] = OPEN
+    walls = np.flatnonzero(grid == OBSTACLE)
+    excess = len(walls) - int(density * grid.size)
+    if excess > 0:                      # Knock out walls, adding loops
+        knocked = rng.choice(walls, size=excess, replace=False)
+        grid.ravel()[knocked] = OPEN
+    return grid
+
+
+GENERATORS = {'open': _open_field,      # Generator of each map style
+              'rooms': _rooms,
+              'maze': _maze}
+
+
+def place_robot_goal(grid, rng):
+    """Place a robot and a goal it can reach on the grid, in place.
+
+    The robot is placed on a random open cell, opening a cell if none are
+    open.  Up to PLACEMENT_TRIES cells are tried until the robot reaches at
+    least half of the open cells, keeping the cell reaching the most, so the
+    robot is rarely boxed into a small pocket of the map.  The goal is placed
+    on a random cell reachable from the robot whose distance from it is at
+    least half the greatest distance of any reachable cell.  If no other cell
+    is reachable a corridor is carved from the robot to a random goal.
+
+    Return a tuple of the (row, column) tuples of the robot and the goal.
+    """
+    ncols = grid.shape[1]
+    passable = grid != OBSTACLE
+    open_cells = np.flatnonzero(passable)
+    if len(open_cells) == 0:
+        open_cells = np.array([rng.integers(grid.size)])
+        passable.ravel()[open_cells] = True
+    best = -1                           # Cells reached from best robot cell
+    for cell in rng.choice(open_cells, size=min(PLACEMENT_TRIES,
+                                                len(open_cells)),
+                           replace=False):
+        start = np.unravel_index(cell, grid.shape)
+        start_dist, _ = distance_transform(passable, start)
+        reached = np.count_nonzero(start_dist >= 0)
+        if reached > best:
+            best, robot, dist = reached, start, start_dist
+        if 2 * reached >= len(open_cells):
+            break
+    robot = tuple(int(x) for x in robot)
+    grid[robot] = ROBOT
+    farthest = dist.max()
+    if farthest > 0:
+        far_cells = np.flatnonzero(dist.ravel() >= (farthest + 1) // 2)
+        goal = np.unravel_index(rng.choice(far_cells), grid.shape)
+    else:                               # Robot walled in, carve a corridor
+        cell = rng.choice(np.delete(np.arange(grid.size),
+                                    robot[0] * ncols + robot[1]))
+        goal = np.unravel_index(cell, grid.shape)
+        low, high = sorted((robot[0], int(goal[0])))
+        grid[low:high + 1, robot[1]] = OPEN
+        low, high = sorted((robot[1], int(goal[1])))
+        grid[goal[0], low:high + 1] = OPEN
+        grid[robot] = ROBOT
+    goal = tuple(int(x) for x in goal)
+    grid[goal] = GOAL
+    return robot, goal
+
+
+def generate_map(nrows, ncols, style='open', density=DEFAULT_DENSITY,
+                 seed=None):
+    """Return a generated map in the format returned by map_io.read_grid.
+
+    The style is one of MAP_STYLES, and density is the fraction of cells
+    that are obstacles, as described for each style above.  The map holds a
+    robot and a goal reachable from it.  Maps generated with the same
+    arguments and an integer seed are identical.
+
+    Raise ValueError if the style is unknown or the map has fewer than two
+    cells.
+    """
+    if style not in GENERATORS:
+        raise ValueError(f'Unknown map style: {style}!')
+    if nrows < 1 or ncols < 1 or nrows * ncols < 2:
+        raise ValueError('Map must have at least two cells!')
+    rng = np.random.default_rng(seed)
+    grid = GENERATORS[style](rng, nrows, ncols, density)
+    place_robot_goal(grid, rng)
+    return grid
+
+
+def write_generated_map(filename, nrows, ncols, style='open',
+                        density=DEFAULT_DENSITY, seed=None):
+    """Generate a map with generate_map and write it to disk.
+
+    Return the filename of the map as a Path object.
+    """
+    filename = Path(filename)
+    write_grid(filename, generate_map(nrows, ncols, style, density, seed))
+    return filename
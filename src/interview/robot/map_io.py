@@ -0,0 +1,214 @@
+"""Reading ASCII robot maps into compact character grids.
+
+###############################################################################
+# map_io.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Map input/output layer for the robot programming exercise.
+#
+# Contents:
+#
+#   read_grid: Read an ASCII map into a 2D uint8 array in one bulk read.
+#
+#   find_cells: Return the coordinates of every cell holding a character.
+#
+#   find_cell: Return the coordinates of the cell holding a character.
+#
+#   write_grid: Write a grid to disk with path cells marked in a single write.
+#
+#   grid_digest: Return a hash of the contents of a grid.
+#
+#   cache_filename: Return the filename of a file cached beside a map.
+#
+#   cached_npz: Load the arrays cached beside a map, or build them.
+#
+#   terrain_costs: Return the traversal cost of every cell of a grid.
+#
+#   move_cost: Return the cost of moving between two adjacent cells.
+#
+###############################################################################
+
+The map is read with a single call to np.fromfile, and stored as a 2D array of
+the ASCII codes of its characters.  The same array can then be used to build a
+graph, to run a grid search, and to write the solution file, so the map file
+only has to be parsed once.
+
+Maps may contain terrain characters besides the four of the programming test.
+A terrain legend is a dict mapping characters to the cost of traversing a cell,
+where np.inf marks impassable cells.  The legend given by the caller is merged
+with DEFAULT_LEGEND, so it only needs to list the extra terrain.  Moving
+between two cells costs the mean of their traversal costs, multiplied by
+sqrt(2) for a diagonal move, so that the cost is the same in both directions.
+"""
+
+# %% Imports
+# Standard system imports
+import hashlib
+import math
+import os
+from pathlib import Path
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+
+
+# %% Map characters
+OBSTACLE = ord('#')     # Obstacle
+OPEN = ord('.')         # Open space
+ROBOT = ord('R')        # Location of robot
+GOAL = ord('G')         # Goal location
+PATH = ord('O')         # Robot's path in the solution file
+NEWLINE = ord('\n')
+RETURN = ord('\r')
+
+
+# %% Terrain
+DEFAULT_LEGEND = {'#': np.inf,  # Traversal cost of each map character
+                  '.': 1,
+                  'R': 1,
+                  'G': 1}
+SQRT2 = math.sqrt(2)    # Length of a diagonal move
+
+
+# %% Functions
+def read_grid(filename):
+    """Read ASCII map and return a 2D uint8 array of its character codes.
+
+    The file is read in a single bulk read.  Carriage returns and blank lines,
+    such as the trailing newlines of the map files, are ignored.
+
+    Raise ValueError if the map is empty or if its rows differ in length.
+    """
+    data = np.fromfile(filename, dtype=np.uint8)
+    data = data[data != RETURN]                 # Accept Windows line endings
+    breaks = np.flatnonzero(data == NEWLINE)    # Index of every newline
+    starts = np.concatenate(([0], breaks + 1))  # First index of each line
+    ends = np.concatenate((breaks, [len(data)]))  # One past end of each line
+    lengths = ends - starts
+    lengths = lengths[lengths > 0]              # Skip blank lines
+    if len(lengths) == 0:
+        raise ValueError('Map is empty!')
+    ncols = lengths[0]
+    if np.any(lengths != ncols):
+        raise ValueError('Rows of map differ in length!')
+    return data[data != NEWLINE].reshape(len(lengths), ncols)
+
+
+def find_cells(grid, char):
+    """Return an array of the (row, column) coordinates of char in the grid.
+
+    The char argument may be either a one-character string or a character code.
+    Coordinates are listed in row-major order.
+    """
+    if isinstance(char, str):
+        char = ord(char)
+    return np.argwhere(grid == char)
+
+
+def find_cell(grid, char):
+    """Return the (row, column) tuple of the cell containing char.
+
+    If char appears more than once the last occurrence in row-major order is
+    returned.  Raise ValueError if char does not appear in the grid.
+    """
+    cells = find_cells(grid, char)
+    if len(cells) == 0:
+        raise ValueError('Character not found in map!')
+    row, col = cells[-1]
+    return int(row), int(col)
+
+
+def write_grid(filename, grid, coords=(), newline=os.linesep):
+    """Write grid to disk as ASCII text, marking coords with 'O' characters.
+
+    The grid is copied once into an output buffer with a line ending appended
+    to every row, and each path cell is set by its offset in that buffer.  The
+    buffer is written in a single call without a newline after the last row.
+    """
+    nrows, ncols = grid.shape
+    sep = np.frombuffer(newline.encode('ascii'), dtype=np.uint8)
+    buffer = np.empty((nrows, ncols + len(sep)), dtype=np.uint8)
+    buffer[:, :ncols] = grid                    # Copy map characters
+    buffer[:, ncols:] = sep                     # Line ending of every row
+    coords = np.asarray(coords, dtype=np.intp).reshape(-1, 2)
+    buffer[coords[:, 0], coords[:, 1]] = PATH   # Mark robot's path with 'O'
+    with open(filename, 'wb') as fout:
+        fout.write(buffer.ravel()[:-len(sep)].tobytes())
+
+
+def grid_digest(grid, *options):
+    """Return a hex digest of the shape and characters of the grid.
+
+    Files derived from a map, such as precomputed search data cached beside
+    the map file, store this digest so that they can be recognized as stale
+    once the contents of the map change.  The repr of any options the data
+    was built with, such as a cluster size, is hashed as well, so that data
+    built with other options is also recognized as stale.
+    """
+    digest = hashlib.sha256(np.asarray(grid.shape, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(grid).tobytes())
+    for option in options:
+        digest.update(repr(option).encode())
+    return digest.hexdigest()
+
+
+def cache_filename(filename, suffix):
+    """Return filename of a file cached beside a map file.
+
+    The name of the cached file is the stem of the map file with the suffix
+    appended, such as '_COMPONENTS.npz'.
+    """
+    filename = Path(filename)
+    return filename.parent / (filename.stem + suffix)
+
+
+def cached_npz(filename, suffix, digest, build):
+    """Return a dict of the arrays cached in a .npz file beside a map file.
+
+    The cached file, named by cache_filename, is loaded if its 'digest' array
+    equals the digest given, as returned by grid_digest.  Otherwise build()
+    is called to return a dict of arrays, which is saved to the cached file
+    together with the digest.  Either way the dict holds the digest as a 0-d
+    string array, as np.load would return it.
+    """
+    cache_fn = cache_filename(filename, suffix)
+    if cache_fn.exists():
+        with np.load(cache_fn) as data:
+            if str(data['digest']) == digest:
+                return dict(data)
+    arrays = {**build(), 'digest': np.array(digest)}
+    np.savez(cache_fn, **arrays)
+    return arrays
+
+
+def terrain_costs(grid, legend=None):
+    """Return a float array of the traversal cost of every cell of the grid.
+
+    The legend is merged with DEFAULT_LEGEND.  As in the original map format,
+    characters missing from the legend are open space with a cost of 1.  Raise
+    ValueError if a cost in the legend is not positive.
+    """
+    legend = {**DEFAULT_LEGEND, **(legend or {})}
+    table = np.ones(256)                        # Cost of each character code
+    for char, cost in legend.items():
+        if not cost > 0:
+            raise ValueError(f'Cost of terrain {char!r} must be positive!')
+        table[ord(char)] = cost
+    return table[grid]
+
+
+def move_cost(cost_u, cost_v, diagonal=False):
+    """Return the cost of moving between adjacent cells of the given costs.
+
+    Whole number costs are returned as an int, so that maps of unit cost keep
+    integer path lengths.
+    """
+    cost = float(cost_u + cost_v) / 2
+    if diagonal:
+        return cost * SQRT2
+    return int(cost) if cost.is_integer() else cost
@@ -0,0 +1,123 @@
+"""Paths for every robot of a map to its nearest goal.
+
+###############################################################################
+# multi_robot.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Solve maps holding many robots and many goals, such as a
+#               facility with a fleet of robots and several charging stations.
+#
+# Contents:
+#
+#   assign_robots: Find the nearest goal and path of every robot of a map.
+#
+#   multi_robot_solution: Solve a map file with many robots and goals.
+#
+###############################################################################
+
+robot_path.robot_solution solves a map with a single robot and goal, keeping
+only the last 'R' and 'G' characters of the map.  Here the graph of the map is
+built once, and a single search of Dijkstra's algorithm is seeded with every
+goal at distance zero, by passing the list of goals to
+robot_path.shortest_path_length.  The search grows outwards from all goals at
+once, so each vertex is settled at its distance to the nearest goal, and the
+shortest-path tree leads from every robot back to that goal.  One search
+therefore serves every robot, however many there are.
+
+In the solution file the path of each robot is marked with its own character,
+taken from PATH_MARKS and skipping any character already present in the map.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+import string
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.array_data_structures import Map
+from interview.robot.map_io import read_grid, find_cells, ROBOT, GOAL
+from interview.robot.robot_path import grid_to_graph, shortest_path_length
+from interview.robot.robot_path import write_map
+
+
+# %% Assignments table
+PATH_MARKS = string.digits + string.ascii_lowercase + string.ascii_uppercase
+ASSIGNMENT_DTYPE = np.dtype([('robot', np.int64, (2,)),     # (row, col)
+                             ('goal', np.int64, (2,)),      # (-1, -1) if none
+                             ('length', np.float64),        # np.inf if none
+                             ('mark', 'U1')])               # Path character
+
+
+# %% Functions
+def assign_robots(grid, legend=None, diagonal=False):
+    """Find the nearest goal of every robot of a map read in by read_grid.
+
+    The legend and diagonal arguments are passed to robot_path.grid_to_graph.
+    Robots are listed in row-major order.
+
+    Return a tuple of a structured array with the robot, nearest goal, path
+    length, and path character of each robot, and a list of the path of each
+    robot.  Each path is a list of (row, column) tuples ordered from the robot
+    to its goal and excluding both.  A robot that cannot reach any goal has a
+    goal of (-1, -1), an infinite length, and an empty path.
+    """
+    ncols = grid.shape[1]
+    graph, _, _, vert_map = grid_to_graph(grid, True, legend, diagonal)
+    vertices = Map()                    # Map flat cell index to its vertex
+    for vertex, (row, col) in vert_map:
+        vertices[row * ncols + col] = vertex
+    robots = [tuple(int(x) for x in cell) for cell in find_cells(grid, ROBOT)]
+    starts = [vertices[row * ncols + col] for row, col in robots]
+    goals = [vertices[row * ncols + col]
+             for row, col in find_cells(grid, GOAL)]
+    cloud, tree = shortest_path_length(graph, goals, starts)
+    present = np.unique(grid)           # Characters already in the map
+    marks = [x for x in PATH_MARKS if ord(x) not in present]
+    if len(robots) > len(marks):
+        raise ValueError('Too many robots to mark each path distinctly!')
+    assignments = np.zeros(len(robots), dtype=ASSIGNMENT_DTYPE)
+    paths = []
+    for i, (robot, start) in enumerate(zip(robots, starts)):
+        assignments[i]['robot'] = robot
+        assignments[i]['mark'] = marks[i]
+        length = cloud.get(start, np.inf)
+        assignments[i]['length'] = length
+        coords = []
+        if length == np.inf:
+            assignments[i]['goal'] = (-1, -1)
+        else:
+            vertex = start
+            while tree.get(vertex, None) is not None:
+                vertex = tree[vertex].opposite(vertex)  # Step toward goal
+                coords.append(vert_map[vertex])
+            assignments[i]['goal'] = coords.pop()   # Last step is the goal
+        paths.append(coords)
+    return assignments, paths
+
+
+def multi_robot_solution(filename, legend=None, diagonal=False):
+    """Solve a map with many robots and goals and write the solution file.
+
+    Each robot's path is marked with the character in the mark field of its
+    assignment.  Where paths overlap the cell shows the last robot's mark, and
+    robot and goal cells are never overwritten.
+
+    Return a tuple of the solution filename and the assignments returned by
+    assign_robots.
+    """
+    filename = Path(filename)
+    grid = read_grid(filename)
+    assignments, paths = assign_robots(grid, legend, diagonal)
+    marked = grid.copy()
+    for mark, coords in zip(assignments['mark'], paths):
+        for row, col in coords:
+            if grid[row, col] != ROBOT and grid[row, col] != GOAL:
+                marked[row, col] = ord(mark)
+    out_fn = write_map(filename, [], marked)
+    return out_fn, assignments
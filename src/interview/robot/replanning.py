@@ -0,0 +1,285 @@
+"""Incremental replanning for robot maps whose obstacles change.
+
+###############################################################################
+# replanning.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Repair the shortest path of a solved robot map after cells
+#               change, without solving the map again from scratch.
+#
+# Contents:
+#
+#   DStarLite: Incremental planner implementing the D* Lite algorithm.
+#
+###############################################################################
+
+D* Lite searches backwards from the goal to the robot, keeping two estimates of
+the distance from every vertex to the goal: g, the distance found by the last
+search, and rhs, a one-step lookahead computed from the g values of the
+vertex's neighbors.  A vertex is consistent if g == rhs.  Only inconsistent
+vertices are placed in the priority queue, so when a cell changes only the
+vertices whose distances are affected by the change are searched again.
+
+The priority queue keys include km, which accumulates the heuristic distance
+moved by the robot.  This allows the keys already in the queue to remain valid
+lower bounds after the robot moves, rather than recomputing every key.
+"""
+
+# %% Imports
+# Standard system imports
+import math
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.map_io import terrain_costs, move_cost, SQRT2
+
+
+# %% Constants
+KEY_TOLERANCE = 1e-9            # Relative difference of keys treated as equal
+
+
+# %% Classes
+class DStarLite:
+    """Incremental planner implementing the D* Lite algorithm.
+
+    The planner is built from the output of map_to_graph, and searches that
+    graph: the moves from a cell are the edges incident to its vertex.  The
+    graph must be built with prune_obstacles=False, so that every cell has a
+    vertex and every move has an edge, which can later become open or
+    blocked.  As cells change, the weights of the edges are not used.  The
+    traversal cost of each cell is stored in a flat NumPy array indexed by
+    row * ncols + col, along with the search state of each cell, and the cost
+    of each move is found from the costs of its cells as described in map_io.
+    Diagonal moves may not cut the corner of a blocked cell, so they are
+    opened and closed as the cells beside them change.
+    """
+
+    def __init__(self, graph, robot, goal, vert_map, legend=None,
+                 diagonal=False):
+        """Initialize the search state of the planner.
+
+        The legend and diagonal arguments must be those the graph was built
+        with, as they cannot be told from the graph: obstacles may leave out
+        every diagonal edge of a graph built with diagonal=True.  Cells are
+        blocked if their traversal cost under the legend is infinite.  No
+        search is performed until plan() is called.
+
+        Raise ValueError if the graph was built with prune_obstacles=True.
+        """
+        nrows = max(coord[0] for _, coord in vert_map) + 1
+        ncols = max(coord[1] for _, coord in vert_map) + 1
+        if len(vert_map) != nrows * ncols:
+            raise ValueError('Graph must hold a vertex for every cell!')
+        self._graph = graph
+        self._vert_map = vert_map       # Map each vertex to its cell
+        self._ncols = ncols
+        self._vertices = np.empty(nrows * ncols, dtype=object)  # Of cells
+        chars = np.zeros(nrows * ncols, dtype=np.uint8)
+        for vertex, (row, col) in vert_map:
+            self._vertices[row * ncols + col] = vertex
+            chars[row * ncols + col] = ord(vertex.element())
+        self._costs = terrain_costs(chars, legend)  # Cost of each cell
+        # Cost of each cell once opened by update_cells, obstacles as floor
+        self._open_costs = np.where(self._costs == np.inf, 1, self._costs)
+        self._scale = self._open_costs.min()    # Scale of heuristic
+        self._diagonal = diagonal
+        row, col = vert_map[robot]
+        self._start = row * ncols + col     # Current cell of the robot
+        self._last = self._start        # Robot cell when km last updated
+        row, col = vert_map[goal]
+        self._goal = row * ncols + col
+        self._g = np.full(nrows * ncols, np.inf)  # Distance from last search
+        self._rhs = np.full(nrows * ncols, np.inf)  # One-step lookahead
+        self._pqlocator = np.empty(nrows * ncols, dtype=object)  # In queue
+        self._queue = AdaptablePriorityQueue()  # Inconsistent cells
+        self._km = 0                    # Key modifier for robot movement
+        self.expansions = 0             # Cells expanded by last plan()
+        self._rhs[self._goal] = 0
+        self._pqlocator[self._goal] = self._queue.enqueue(
+            self._key(self._goal), self._goal)
+
+    def plan(self):
+        """Repair the shortest-path tree and return the robot's path.
+
+        Return a tuple of the path length and a list of (row, column) tuples
+        along the path, ordered from goal to robot and excluding both.  As
+        for the other engines, whole number lengths are returned as an int.
+        If the goal is unreachable return (np.inf, []).
+        """
+        self._compute_shortest_path()
+        length = float(self._g[self._start])
+        if length == np.inf:
+            return np.inf, []
+        coords = []
+        u = self._start
+        for _ in range(len(self._g)):   # A path visits each cell at most once
+            # Step to the neighbor along the shortest path to the goal
+            _, u = min((self._cost(u, v, corners) + self._g[v], v)
+                       for v, corners in self._moves(u))
+            if u == self._goal:
+                break
+            coords.append(divmod(u, self._ncols))
+        else:
+            raise RuntimeError('Distances of planner are inconsistent!')
+        coords.reverse()
+        return int(length) if length.is_integer() else length, coords
+
+    def move_robot(self, coord):
+        """Move the robot to the (row, column) coordinates of an open cell.
+
+        Raise ValueError if the cell is blocked.
+        """
+        u = coord[0] * self._ncols + coord[1]
+        if self._costs[u] == np.inf:
+            raise ValueError('Robot cannot move into an obstacle!')
+        self._start = u
+        self._km += self._heuristic(self._last, u)
+        self._last = u
+
+    def update_cells(self, cells):
+        """Change the state of cells and update the affected vertices.
+
+        The cells argument is an iteration of ((row, column), state) tuples.
+        The state is either the new traversal cost of the cell, np.inf for an
+        obstacle, or True if an obstacle was added to the cell and False if
+        an obstacle was removed.  A cell opened with False takes back the
+        last finite cost it had, and a cell that has only been an obstacle
+        counts as plain floor of cost 1.
+
+        Raise ValueError if a cost is less than the smallest cost of an open
+        cell when the planner was built, which would make the heuristic
+        overestimate distances.
+        """
+        for (row, col), state in cells:
+            u = row * self._ncols + col
+            if isinstance(state, (bool, np.bool_)):
+                cost = np.inf if state else self._open_costs[u]
+            elif state < self._scale:
+                raise ValueError(f'Cost of cell must be at least '
+                                 f'{self._scale}!')
+            else:
+                cost = state
+                if cost != np.inf:
+                    self._open_costs[u] = cost  # Cost when opened again
+            if self._costs[u] == cost:
+                continue                # No change to cost of moves
+            self._costs[u] = cost
+            self._update_vertex(u)
+            # Includes the diagonal moves cutting the corner of the cell
+            for v, _ in self._moves(u):
+                self._update_vertex(v)
+
+    def _moves(self, u):
+        """Generate (v, corners) tuples of the moves from cell u.
+
+        The moves are the edges incident to the vertex of cell u.  The corners
+        are the cells beside a diagonal move, which must both be open, and an
+        empty tuple for other moves.  Raise ValueError if the graph holds a
+        diagonal move but the planner was built with diagonal=False, as the
+        heuristic would then overestimate distances.
+        """
+        ncols = self._ncols
+        row, col = divmod(u, ncols)
+        vertex = self._vertices[u]
+        for edge in self._graph.incident_edges(vertex):
+            r, c = self._vert_map[edge.opposite(vertex)]
+            if r == row or c == col:
+                yield r * ncols + c, ()
+            elif self._diagonal:
+                yield r * ncols + c, (row * ncols + c, r * ncols + col)
+            else:
+                raise ValueError('Graph has diagonal moves, but diagonal '
+                                 'is False!')
+
+    def _compute_shortest_path(self):
+        """Expand inconsistent cells until the robot's cell is settled."""
+        self.expansions = 0
+        queue = self._queue
+        start = self._start
+        while not queue.is_empty():
+            k_old, u = queue.min()
+            if not (_key_less(k_old, self._key(start)) or
+                    self._rhs[start] != self._g[start]):
+                break                   # Robot's cell is consistent
+            queue.dequeue()
+            self._pqlocator[u] = None
+            self.expansions += 1
+            k_new = self._key(u)
+            if _key_less(k_old, k_new):     # Out of date since robot moved
+                self._pqlocator[u] = queue.enqueue(k_new, u)
+            elif self._g[u] > self._rhs[u]:
+                self._g[u] = self._rhs[u]   # Overconsistent, lower distance
+                for v, _ in self._moves(u):
+                    self._update_vertex(v)
+            else:
+                self._g[u] = np.inf     # Underconsistent, raise distance
+                self._update_vertex(u)
+                for v, _ in self._moves(u):
+                    self._update_vertex(v)
+
+    def _update_vertex(self, u):
+        """Recompute rhs of cell u and update its place in the queue."""
+        if u != self._goal:
+            self._rhs[u] = min((self._cost(u, v, corners) + self._g[v]
+                                for v, corners in self._moves(u)),
+                               default=np.inf)
+        locator = self._pqlocator[u]
+        consistent = self._g[u] == self._rhs[u]
+        if locator is not None:
+            if consistent:
+                self._queue.remove(locator)
+                self._pqlocator[u] = None
+            else:
+                self._queue.update(locator, self._key(u), u)
+        elif not consistent:
+            self._pqlocator[u] = self._queue.enqueue(self._key(u), u)
+
+    def _key(self, u):
+        """Return the priority queue key of cell u."""
+        distance = min(self._g[u], self._rhs[u])
+        return (distance + self._heuristic(self._start, u) + self._km,
+                distance)
+
+    def _heuristic(self, u, v):
+        """Return distance between cells u and v if every cost were least.
+
+        This is the Manhattan distance, or the octile distance if the robot
+        moves diagonally, scaled by the smallest cost of an open cell.
+        """
+        u_row, u_col = divmod(u, self._ncols)
+        v_row, v_col = divmod(v, self._ncols)
+        d_row, d_col = abs(u_row - v_row), abs(u_col - v_col)
+        if self._diagonal:
+            return self._scale * (max(d_row, d_col) +
+                                  (SQRT2 - 1) * min(d_row, d_col))
+        return self._scale * (d_row + d_col)
+
+    def _cost(self, u, v, corners):
+        """Return cost of moving from cell u to adjacent cell v."""
+        costs = self._costs
+        if costs[u] == np.inf or costs[v] == np.inf or \
+                any(costs[corner] == np.inf for corner in corners):
+            return np.inf
+        return move_cost(costs[u], costs[v], bool(corners))
+
+
+# %% Functions
+def _key_less(key, other):
+    """Return True if key is less than other key beyond rounding error.
+
+    Keys are compared element by element, and elements within KEY_TOLERANCE
+    of each other are equal.  The costs of diagonal moves are multiples of
+    sqrt(2), so the same distance summed in another order may differ in its
+    last bit, which must not decide whether the search has finished.
+    """
+    for a, b in zip(key, other):
+        if not math.isclose(a, b, rel_tol=KEY_TOLERANCE,
+                            abs_tol=KEY_TOLERANCE):
+            return a < b
+    return False
@@ -53,7 +53,7 @@ The steps to the solution of this problem are as follows:
 1.  Read in the ASCII map
 2.  Assign the characters of the map to vertices in a weighted graph G
 3.  Run Djikstra's algorithm on G for the vertex containing the robot
-4.  Compute the shortest-path tree from the resulting distance map
+4.  Record the shortest-path tree while relaxing edges in Djikstra's algorithm
 5.  Modify the ASCII map to show the robot's path to the goal and write to disk
 
 The solution will require writing classes to implement the following:
@@ -72,15 +72,36 @@ The solution will require writing classes to implement the following:
 The solution will require writing functions to implement the following:
 1. Reading in the ASCII map and converting it into a graph
 2. Djikstra's algorithm to compute shortest distances to each vertex
-3. Computing the shortest-path tree for each vertex (other than start)
+3. Recording the shortest-path tree for each vertex (other than start)
 4. Converting the shortest-path tree to the goal to ASCII coordinates
 5. Modifying the ASCII map to show the shortest path and writing it to disk
+
+Alternate search engines can be selected with the engine argument of
+robot_solution, for example robot_solution(filename, 'astar').  The available
+engines are listed in the ENGINES map:
+
+'dijkstra':         Djikstra's algorithm on a graph of the map (default)
+'bidirectional':    Djikstra's algorithm run from both the robot and the goal
+'astar':            A* search directly on the character grid, without a graph
+'jps':              Jump Point Search directly on the character grid
+'bfs':              Vectorized breadth-first search on the character grid
+
+Maps may also contain weighted terrain such as ramps or carpet, described by a
+legend mapping characters to traversal costs, and robots may be allowed to move
+diagonally.  These options are accepted by the engines in TERRAIN_ENGINES:
+
+robot_solution(filename, legend={'~': 3}, diagonal=True)
+
+To find where the time goes on a slow map, robot_solution can also return a
+report of the time spent in each stage and the number of priority queue
+operations, Map lookups, and edges relaxed, as described in instrumentation:
+
+out_fn, report = robot_solution(filename, instrument=True)
 """
 
 # %% Imports
 # Standard system imports
 from pathlib import Path
-import os
 
 # Related third party imports
 import numpy as np
@@ -89,91 +110,284 @@ import numpy as np
 from interview.robot.graph_data_structures import Graph
 from interview.robot.array_data_structures import Map
 from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.grid_search import astar, jump_point_search
+from interview.robot.grid_search import breadth_first_search
+from interview.robot.map_io import read_grid, write_grid, find_cell
+from interview.robot.map_io import terrain_costs, SQRT2
+from interview.robot.map_io import OBSTACLE, ROBOT, GOAL
+from interview.robot.solution_cache import solution_key
+from interview.robot.components import cached_components
+from interview.robot import instrumentation
 
 
 # %% Solution
-def map_to_graph(filename):
+def map_to_graph(filename, prune_obstacles=False, legend=None,
+                 diagonal=False):
     """Read in ASCII map and return a graph representation of the map.
 
     Also return starting vertex of robot and goal vertex.  Return a map with
     vertex keys to (row, column) tuples of the vertex coordinates in the map.
+
+    By default every character becomes a vertex, and edges touching obstacles
+    have infinite weight.  If prune_obstacles is True, no vertices are created
+    for obstacles, so the graph contains only edges that can be traversed.
+    Vertices keep their (row, column) coordinates in either case.
+
+    The legend maps terrain characters to traversal costs, as described in
+    map_io.  If diagonal is True each vertex is also joined to its diagonal
+    neighbors, giving 8-connected movement.
+    """
+    return grid_to_graph(read_grid(filename), prune_obstacles, legend,
+                         diagonal)
+
+
+def grid_to_graph(grid, prune_obstacles=False, legend=None, diagonal=False):
+    """Return a graph representation of a map read in by read_grid.
+
+    Return the same tuple as map_to_graph.  The vertices and edges are
+    inserted in bulk by Graph.insert_vertices and Graph.insert_edges, with the
+    edges found by grid_edges, which converts large maps over ten times
+    faster than adding the edges of each cell with add_edges.
     """
-    arr = np.loadtxt(filename, dtype=object, comments=None, delimiter='\n')
-    nrows = len(arr)                            # Number rows in map
-    ncols = len(arr[0])                         # Number columns in map
+    costs = terrain_costs(grid, legend)         # Traversal cost of each cell
+    if prune_obstacles:                         # Leave obstacles out of graph
+        cells = np.flatnonzero(costs != np.inf)
+    else:
+        cells = np.arange(grid.size)
+    index = np.full(grid.size, -1)              # Vertex index of each cell
+    index[cells] = np.arange(len(cells))
     g = Graph()                                 # Undirected graph
-    vert_arr = np.empty(shape=(nrows, ncols), dtype=object)
+    vertices = g.insert_vertices(map(chr, grid.ravel()[cells].tolist()))
     vert_map = Map()                            # Map each vert to its coord
-    for row in range(nrows):                    # Add vertices to graph
-        for col in range(ncols):                # And to vertex array
-            vertex = g.insert_vertex(arr[row][col])
-            vert_arr[row, col] = vertex
-            if arr[row][col] == 'R':
-                robot = vertex                  # Start vertex of robot
-            elif arr[row][col] == 'G':
-                goal = vertex                   # Goal vertex
-            vert_map[vertex] = (row, col)       # Map vertex to coordinates
-    for row in range(nrows):
-        for col in range(ncols):
-            add_edges(row, col, g, vert_arr)    # Add weighted edges to graph
+    rows, cols = np.divmod(cells, grid.shape[1])
+    vert_map.insert_new(vertices, zip(rows.tolist(), cols.tolist()))
+    origins, destinations, weights = grid_edges(costs, prune_obstacles,
+                                                diagonal)
+    g.insert_edges(zip(index[origins].tolist(),
+                       index[destinations].tolist(), weights), vertices)
+
+    def vertex(cell):
+        """Return vertex of (row, column) cell, or None if pruned."""
+        idx = index[np.ravel_multi_index(cell, grid.shape)]
+        return vertices[idx] if idx >= 0 else None
+
+    robot = vertex(find_cell(grid, ROBOT))      # Start vertex of robot
+    goal = vertex(find_cell(grid, GOAL))        # Goal vertex
     return g, robot, goal, vert_map
 
 
-def add_edges(row, col, g, vert_arr):
-    """Add weighted edges between adjacent vertices.
+def grid_edges(costs, prune_obstacles=False, diagonal=False):
+    """Return the edges between adjacent cells of an array of costs.
 
-    Do not add an edge if it already exists.
+    Return a tuple of arrays of the origin and destination of each edge, as
+    indices of cells in row-major order, and a list of the edge weights.  The
+    weight of each edge is the cost of moving between its two cells, as
+    returned by map_io.move_cost.  Each pair of adjacent cells is joined by
+    one edge, from the earlier to the later cell.  Diagonal edges are only
+    included if diagonal is True, and may not cut the corner of an obstacle.
+    If prune_obstacles is True, edges to cells of infinite cost and edges
+    cutting their corners are left out.  Otherwise every move has an edge,
+    of weight np.inf if it is blocked, so that a planner can open it later.
+    """
+    nrows, ncols = costs.shape
+    idx = np.arange(costs.size).reshape(costs.shape)
+    keep = costs != np.inf if prune_obstacles else np.ones(costs.shape, bool)
+    origins, destinations, weights = [], [], []
+    steps = ((0, 1), (1, 0)) + (((1, 1), (1, -1)) if diagonal else ())
+    for d_row, d_col in steps:
+        # Cells with a neighbor in direction (d_row, d_col), and neighbors
+        rows = slice(0, nrows - d_row)
+        cols = slice(max(0, -d_col), ncols - max(0, d_col))
+        next_rows = slice(d_row, nrows)
+        next_cols = slice(max(0, d_col), ncols - max(0, -d_col))
+        valid = keep[rows, cols] & keep[next_rows, next_cols]
+        if d_row and d_col:                     # Do not cut obstacle corners
+            corners = ((costs[rows, next_cols] != np.inf) &
+                       (costs[next_rows, cols] != np.inf))
+            if prune_obstacles:
+                valid &= corners
+        origins.append(idx[rows, cols][valid])
+        destinations.append(idx[next_rows, next_cols][valid])
+        cost = (costs[rows, cols][valid] +
+                costs[next_rows, next_cols][valid]) / 2
+        if d_row and d_col:
+            cost = np.where(corners[valid], cost * SQRT2, np.inf)
+            weights += cost.tolist()
+        else:                                   # Whole numbers as ints
+            weights += [int(w) if w.is_integer() else w
+                        for w in cost.tolist()]
+    return np.concatenate(origins), np.concatenate(destinations), weights
+
+
+def add_edges(row, col, g, vert_arr, costs=None, diagonal=False):
+    """Add weighted edges between a vertex and its adjacent vertices.
+
+    The vertex of the cell at (row, col) in the array of vertices is joined to
+    each adjacent vertex by the edges that grid_edges finds in the block of
+    costs around the cell.  Do not add an edge if it already exists, or if the
+    adjacent vertex was pruned from the graph (its entry in the vertex array
+    is None).  If any cell of the block was pruned, diagonal edges cutting
+    the corner of an obstacle are left out, as by grid_to_graph.  Used to add
+    the edges of a few cells, such as cells added to a graph built by
+    grid_to_graph, which adds every edge at once.
+
+    If the array of traversal costs is not given, the costs of the block are
+    found from the map characters stored as vertex elements, under the
+    default legend of map_io, with pruned cells treated as obstacles.
+    """
+    row0, col0 = max(row - 1, 0), max(col - 1, 0)   # Corner of 3x3 block
+    block_verts = vert_arr[row0:row+2, col0:col+2]
+    if costs is None:
+        chars = [[OBSTACLE if v is None else ord(v.element()) for v in line]
+                 for line in block_verts]
+        block = terrain_costs(np.array(chars, dtype=np.uint8))
+    else:
+        block = costs[row0:row+2, col0:col+2]
+    width = block.shape[1]
+    center = (row - row0) * width + col - col0      # Index of cell in block
+    pruned = any(v is None for v in block_verts.ravel())
+    origins, destinations, weights = grid_edges(block, pruned, diagonal)
+    u = vert_arr[row, col]
+    new_edges = []
+    for a, b, weight in zip(origins.tolist(), destinations.tolist(), weights):
+        if center not in (a, b):
+            continue                                # Edge of two neighbors
+        r, c = divmod(b if a == center else a, width)
+        v = vert_arr[row0 + r, col0 + c]
+        if v is not None and g.get_edge(u, v) is None:
+            new_edges.append((u, v, weight))
+    g.insert_edges(new_edges)
+
+
+def shortest_path_length(graph, start, goal=None):
+    """Calculate the length of the shortest path using Djikstra's algorithm.
+
+    Vertices are inserted into the priority queue when they are first
+    discovered, rather than enqueuing every vertex at an infinite distance, so
+    vertices that are unreachable from start never appear in the cloud.
+
+    If a goal vertex is given the search stops as soon as the goal is removed
+    from the queue, so the cost of the search scales with the region explored
+    rather than with the size of the graph.
+
+    The start and goal may also be lists or tuples of vertices.  Every start
+    vertex is placed in the queue at distance 0, so each vertex is relaxed at
+    its distance from the nearest start vertex, and the search stops once
+    every goal vertex has been removed from the queue.
+
+    The predecessor edge of each vertex is recorded during relaxation.  Return
+    a tuple of the cloud, mapping relaxed vertices to their distances, and the
+    shortest-path tree, mapping vertices v (excluding start) to edges e=(u, v).
     """
-
-    def insert_edge(u, v, g):
-        """Add edge of appropriate weight if edge does not exist."""
-        if g.get_edge(u, v) is None:
-            if u.element() == '#' or v.element() == '#':
-                weight = np.inf     # Obstacle
-            else:
-                weight = 1          # Open space, robot, goal
-            g.insert_edge(u, v, weight)
-
-    nrows = len(vert_arr)                       # Number rows in map
-    ncols = len(vert_arr[0])                    # Number columns in map
-    u = vert_arr[row, col]                      # Current vertex in map
-    if row > 0:
-        v = vert_arr[row-1, col]                # Vertex above u
-        insert_edge(u, v, g)
-    if row < nrows-1:
-        v = vert_arr[row+1, col]                # Vertex below u
-        insert_edge(u, v, g)
-    if col > 0:
-        v = vert_arr[row, col-1]                # Vertex left of u
-        insert_edge(u, v, g)
-    if col < ncols-1:
-        v = vert_arr[row, col+1]                # Vertex right of u
-        insert_edge(u, v, g)
-
-
-def shortest_path_length(graph, start):
-    """Calculate the length of the shortest path using Djikstra's algorithm."""
     dist = Map()                        # Distance map
     queue = AdaptablePriorityQueue()    # Priority queue with distance keys
     cloud = Map()                       # Keep track of relaxed vertices
     pqlocator = Map()                   # Keep track of vertices in queue
-    for vertex in graph.vertices():     # Initialize distances of vertices
-        if vertex is start:
-            dist[vertex] = 0            # Start vertex 0 distance to itself
-        else:
-            dist[vertex] = np.inf       # Infinite distance for all other verts
-        pqlocator[vertex] = queue.enqueue(dist[vertex], vertex)
+    tree = Map()                        # Map vertices to parent edges
+    remaining = Map()                   # Goals not yet relaxed, if many
+    if isinstance(goal, (list, tuple)):
+        for target in goal:
+            remaining[target] = True
+        goal = None
+    sources = start if isinstance(start, (list, tuple)) else [start]
+    for source in sources:
+        if pqlocator.get(source, None) is None:
+            dist[source] = 0            # Start vertex 0 distance to itself
+            pqlocator[source] = queue.enqueue(0, source)
     while not queue.is_empty():
         min_dist, u = queue.dequeue()
         cloud[u] = min_dist             # Add vertex to cloud with minimum dist
+        if u == goal:
+            break                       # Goal settled, stop search
+        if remaining and remaining.get(u, None) is not None:
+            del remaining[u]
+            if len(remaining) == 0:
+                break                   # Every goal settled, stop search
         for edge in graph.incident_edges(u):
             vertex = edge.opposite(u)
-            if cloud.get(vertex, None) is None:  # Vertex is in queue
-                weight = graph.get_edge(u, vertex).element()
-                if dist[u] + weight < dist[vertex]:
+            if cloud.get(vertex, None) is None:  # Vertex is not yet relaxed
+                weight = edge.element()
+                if dist[u] + weight < dist.get(vertex, np.inf):
                     dist[vertex] = dist[u] + weight  # Relaxation step
-                    queue.update(pqlocator[vertex], dist[vertex], vertex)
-    return cloud
+                    tree[vertex] = edge  # Edge along shortest path to vertex
+                    locator = pqlocator.get(vertex, None)
+                    if locator is None:  # Vertex discovered for first time
+                        pqlocator[vertex] = queue.enqueue(dist[vertex], vertex)
+                    else:
+                        queue.update(locator, dist[vertex], vertex)
+    return cloud, tree
+
+
+def bidirectional_shortest_path(graph, start, goal, stats=None):
+    """Calculate the shortest path using a bidirectional Djikstra's algorithm.
+
+    A forward search from start and a backward search from goal (along
+    incoming edges for a directed graph) are run in turn, expanding whichever
+    frontier has the smaller minimum distance.  Whenever an edge joins the two
+    searches, the length of the path through that edge is a candidate for the
+    shortest path length mu.  The search stops once the sum of the minimum
+    distances in the two queues is at least mu, since no path found after
+    that point could be shorter.
+
+    Return a tuple of the shortest path length and a tree mapping each vertex
+    on the path (excluding start) to its edge e=(u, v), as in the tree returned
+    by shortest_path_length.  If goal is unreachable return (np.inf, Map()).
+    If a stats dict is given, the number of vertices removed from both queues
+    is stored under 'expansions'.
+    """
+    dist = (Map(), Map())               # Distance maps, forward and backward
+    cloud = (Map(), Map())              # Keep track of relaxed vertices
+    tree = (Map(), Map())               # Map vertices to parent edges
+    pqlocator = (Map(), Map())          # Keep track of vertices in queues
+    queue = (AdaptablePriorityQueue(), AdaptablePriorityQueue())
+    for side, source in enumerate((start, goal)):
+        dist[side][source] = 0          # Source vertex 0 distance to itself
+        pqlocator[side][source] = queue[side].enqueue(0, source)
+    mu = np.inf                         # Length of best path found so far
+    meeting = None                      # Edge joining the two searches
+    while not queue[0].is_empty() and not queue[1].is_empty():
+        forward_key, backward_key = queue[0].min()[0], queue[1].min()[0]
+        if forward_key + backward_key >= mu:
+            break                       # No shorter path can be found
+        side = 0 if forward_key <= backward_key else 1
+        min_dist, u = queue[side].dequeue()
+        cloud[side][u] = min_dist       # Add vertex to cloud with minimum dist
+        for edge in graph.incident_edges(u, out=side == 0):
+            vertex = edge.opposite(u)
+            weight = edge.element()
+            if cloud[side].get(vertex, None) is None:  # Vertex not relaxed
+                if dist[side][u] + weight < dist[side].get(vertex, np.inf):
+                    dist[side][vertex] = dist[side][u] + weight  # Relax
+                    tree[side][vertex] = edge
+                    locator = pqlocator[side].get(vertex, None)
+                    if locator is None:  # Vertex discovered for first time
+                        pqlocator[side][vertex] = queue[side].enqueue(
+                            dist[side][vertex], vertex)
+                    else:
+                        queue[side].update(locator, dist[side][vertex], vertex)
+            other = dist[1 - side].get(vertex, None)
+            if other is not None and dist[side][u] + weight + other < mu:
+                mu = dist[side][u] + weight + other  # Shorter joined path
+                meeting = (u, vertex, edge) if side == 0 else (vertex, u, edge)
+    if stats is not None:
+        stats['expansions'] = len(cloud[0]) + len(cloud[1])
+    if meeting is None:
+        return np.inf, Map()
+    # Reverse the backward search's edges so the path leads back to start
+    u, vertex, edge = meeting
+    path_tree = Map()
+    while vertex != start:              # Edges of forward search to start
+        path_tree[vertex] = edge
+        vertex = u
+        edge = tree[0].get(vertex, None)
+        u = edge.opposite(vertex) if edge is not None else None
+    vertex = meeting[1]
+    while vertex != goal:               # Edges of backward search to goal
+        edge = tree[1][vertex]
+        successor = edge.opposite(vertex)
+        path_tree[successor] = edge
+        vertex = successor
+    return mu, path_tree
 
 
 def shortest_path_tree(graph, start, cloud):
@@ -184,14 +398,19 @@ def shortest_path_tree(graph, start, cloud):
 
     The edge is specified as an incoming edge in the case of a directed graph.
     The cloud map from Djikstra's algorithm is used to determine the shortest
-    path from the start vertex to every other vertex.
+    path from the start vertex to every vertex in the cloud.
+
+    This second pass over the cloud is not needed by the solution, since
+    shortest_path_length records the same tree while relaxing edges.
     """
     tree = Map()                         # Map vertices to parent edges
     for vertex, _ in cloud:
-        if vertex is not start:
+        if vertex != start:
             for edge in graph.incident_edges(vertex, out=False):
                 u = edge.opposite(vertex)
                 weight = edge.element()
+                if cloud.get(u, None) is None:
+                    continue     # Neighbor was never relaxed by the search
                 if cloud[vertex] == cloud[u] + weight:
                     tree[vertex] = edge  # Edge along shortest path to vertex
     return tree
@@ -205,7 +424,7 @@ def calculate_shortest_path_coords(start, goal, tree, vert_map):
     """
     coords = []
     vertex = tree[goal].opposite(goal)  # Vertex directly preceding goal
-    while vertex is not start:
+    while vertex != start:
         coord = vert_map[vertex]  # (row, column) tuple of vertex in ASCII map
         coords.append(coord)
         edge = tree[vertex]             # Edge along shortest path to vertex
@@ -213,54 +432,190 @@ def calculate_shortest_path_coords(start, goal, tree, vert_map):
     return coords
 
 
-def write_map(filename, coords):
+def write_map(filename, coords, grid=None):
     """Iterate through shortest path coordinates and write ASCII path.
 
     Read in ASCII map and mark the shortest path with 'O' characters.
-    Write the modified ASCII to a new file appended with _SOLUTION.
+    Write the modified ASCII to a new file appended with _SOLUTION.  If the
+    grid returned by read_grid is given the map is not read in again.
 
     Return the filename of the file written to disk.
     """
     out_fn = filename.parent / (filename.stem + '_SOLUTION.txt')
-    arr = np.loadtxt(filename, dtype=object, comments=None, delimiter='\n')
-    for coord in coords:
-        row, col = coord
-        str_list = list(arr[row])
-        str_list[col] = 'O'     # Mark robot's path with 'O'
-        arr[row] = ''.join(str_list)
-    # Annoying hack to remove the final newline created by np.savetxt()
-    with open(out_fn, 'w') as fout:
-        newline_size_in_bytes = len(os.linesep)
-        np.savetxt(fout, arr, fmt="%s")  # Use np.savetxt.
-        fout.seek(0, os.SEEK_END)  # Go to the end of the file.
-        # Go backwards appropriate number of bytes from the end of the file.
-        fout.seek(fout.tell() - newline_size_in_bytes, os.SEEK_SET)
-        fout.truncate()  # Truncate the file to this point.
+    if grid is None:
+        grid = read_grid(filename)
+    write_grid(out_fn, grid, coords)
     return out_fn
 
 
-def robot_solution(filename):
-    """Solution to shortest path from the robot location to goal location.
+def dijkstra_path(grid, legend=None, diagonal=False):
+    """Solve the map using Djikstra's algorithm on a graph of the map.
 
-    Return filename of solution file written to disk.
+    Return a tuple of the path length and the list of path coordinates.  If the
+    goal is unreachable return (np.inf, []).
     """
+    # Return graph representation of ASCII map without obstacles
+    graph, start, goal, vert_map = grid_to_graph(grid, True, legend, diagonal)
+    # Run Djikstra's algorithm to calculate the shortest path length and the
+    # tree representing the shortest path to the goal
+    cloud, tree = shortest_path_length(graph, start, goal)
+    if cloud.get(goal, np.inf) == np.inf:   # Check if goal is reachable
+        return np.inf, []
+    # Calculate the coordinates in the ASCII map of the shortest path
+    coords = calculate_shortest_path_coords(start, goal, tree, vert_map)
+    return cloud[goal], coords
+
+
+def bidirectional_path(grid, legend=None, diagonal=False):
+    """Solve the map using bidirectional Djikstra's algorithm on a graph.
+
+    Return a tuple of the path length and the list of path coordinates.  If the
+    goal is unreachable return (np.inf, []).
+    """
+    graph, start, goal, vert_map = grid_to_graph(grid, True, legend, diagonal)
+    length, tree = bidirectional_shortest_path(graph, start, goal)
+    if length == np.inf:        # Check if goal is reachable
+        return np.inf, []
+    coords = calculate_shortest_path_coords(start, goal, tree, vert_map)
+    return length, coords
+
+
+def astar_path(grid, legend=None, diagonal=False):
+    """Solve the map using A* search directly on the character grid.
+
+    Return a tuple of the path length and the list of path coordinates.  If the
+    goal is unreachable return (np.inf, []).
+    """
+    start = find_cell(grid, ROBOT)
+    goal = find_cell(grid, GOAL)
+    if legend is None:
+        return astar(grid != OBSTACLE, start, goal, diagonal=diagonal)
+    costs = terrain_costs(grid, legend)     # Traversal cost of each cell
+    return astar(costs != np.inf, start, goal, costs=costs, diagonal=diagonal)
+
+
+def jps_path(grid):
+    """Solve the map using Jump Point Search directly on the character grid.
+
+    Return a tuple of the path length and the list of path coordinates.  If the
+    goal is unreachable return (np.inf, []).
+    """
+    start = find_cell(grid, ROBOT)
+    goal = find_cell(grid, GOAL)
+    return jump_point_search(grid != OBSTACLE, start, goal)
+
+
+def bfs_path(grid):
+    """Solve the map using vectorized breadth-first search on the grid.
+
+    Return a tuple of the path length and the list of path coordinates.  If the
+    goal is unreachable return (np.inf, []).
+    """
+    start = find_cell(grid, ROBOT)
+    goal = find_cell(grid, GOAL)
+    return breadth_first_search(grid != OBSTACLE, start, goal)
+
+
+ENGINES = {'dijkstra': dijkstra_path,   # Search engines for robot_solution
+           'bidirectional': bidirectional_path,
+           'astar': astar_path,
+           'jps': jps_path,
+           'bfs': bfs_path}
+TERRAIN_ENGINES = ('dijkstra',          # Engines accepting legend, diagonal
+                   'bidirectional',
+                   'astar')
+
+
+def solve_map(filename, engine='dijkstra', legend=None, diagonal=False,
+              cache=None, precheck=False):
+    """Solve the map and write the solution file to disk without printing.
+
+    The engine argument selects the search algorithm from the ENGINES map.
+    The map is read in once, and the same grid is passed to the engine and
+    used to write the solution file.
+
+    The legend maps terrain characters to traversal costs, and diagonal
+    allows 8-connected movement.  Only the engines in TERRAIN_ENGINES accept
+    these options; the other engines assume unit costs and 4-connected
+    movement, and raise ValueError if they are given.
+
+    If a SolutionCache is given, a map solved before with the same options
+    skips the search and goes straight to writing the solution file.
+
+    If precheck is True the connected components of the map, cached beside
+    the map file by components.cached_components, are checked first.  A goal
+    outside the robot's component is reported as unreachable without any
+    search, and otherwise cells outside the robot's component are treated as
+    obstacles, so the graph engines never build vertices the robot cannot
+    reach.  The pre-check is off by default, since labelling the map costs a
+    pass over every cell and writes a file beside the map, which only pays
+    off for maps that are solved repeatedly or whose goal may be unreachable.
+
+    Return a tuple of the solution filename and the path length, which is
+    np.inf if the goal is unreachable.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f'Unknown engine: {engine}!')
+    terrain = legend is not None or diagonal
+    if terrain and engine not in TERRAIN_ENGINES:
+        raise ValueError(f'Engine {engine} requires unit costs and '
+                         f'4-connected movement!')
     filename = Path(filename)  # Ensure filename is a Path object
-    # Read in ASCII map and return graph representation
-    graph, start, goal, vert_map = map_to_graph(filename)
-    # Run Djikstra's algorithm to calculate the shortest path length
-    cloud = shortest_path_length(graph, start)
-    if cloud[goal] == np.inf:   # Check if goal is reachable
+    grid = read_grid(filename)  # Read in ASCII map
+    if cache is not None:
+        key = solution_key(grid, engine, legend, diagonal)
+        cached = cache.get(key)
+        if cached is not None:  # Solved before, skip the search
+            length, coords = cached
+            return write_map(filename, coords, grid), length
+    search_grid = grid  # Grid passed to the search engine
+    reachable = True
+    if precheck:
+        components = cached_components(filename, grid, legend)
+        robot = find_cell(grid, ROBOT)
+        reachable = components.reachable(robot, find_cell(grid, GOAL))
+        if reachable:   # Confine search to the robot's component
+            search_grid = components.restrict(grid, robot)
+    if not reachable:
+        length, coords = np.inf, []     # Goal in another component
+    elif terrain:
+        length, coords = ENGINES[engine](search_grid, legend, diagonal)
+    else:
+        length, coords = ENGINES[engine](search_grid)
+    if cache is not None:
+        cache.put(key, length, coords)
+    # Write an ASCII map to disk showing the shortest path, if any
+    out_fn = write_map(filename, coords, grid)
+    return out_fn, length
+
+
+def robot_solution(filename, engine='dijkstra', legend=None, diagonal=False,
+                   cache=None, instrument=False, precheck=False):
+    """Solution to shortest path from the robot location to goal location.
+
+    The engine argument selects the search algorithm from the ENGINES map.
+    The default engine runs Djikstra's algorithm on a graph of the map.  The
+    legend, diagonal, cache, and precheck arguments are passed to solve_map.
+
+    Return filename of solution file written to disk.  If instrument is True
+    return a tuple of the filename and an instrumentation.PipelineReport of
+    the solution.
+    """
+    if instrument:
+        with instrumentation.instrument(globals()) as report:
+            out_fn, length = solve_map(filename, engine, legend, diagonal,
+                                       cache, precheck)
+        report.summary.update(filename=filename, engine=engine,
+                              length=length, solution=out_fn)
+    else:
+        out_fn, length = solve_map(filename, engine, legend, diagonal, cache,
+                                   precheck)
+    if length == np.inf:        # Check if goal is reachable
         print('\nGoal is unreachable from start!\n')
-        # Write unmodified ASCII map to disk as solution
-        out_fn = write_map(filename, [])
     else:
-        print(f'\nThe shortest path to the goal is: {cloud[goal]}\n')
-        # Calculate tree representing shortest path to goal
-        tree = shortest_path_tree(graph, start, cloud)
-        # Calculate the coordinates in the ASCII map of the shortest path
-        coords = calculate_shortest_path_coords(start, goal, tree, vert_map)
-        # Write an ASCII map to disk showing the shortest path
-        out_fn = write_map(filename, coords)
+        print(f'\nThe shortest path to the goal is: {length}\n')
     print('File written to:')
     print(f'{out_fn}\n')
+    if instrument:
+        return out_fn, report
     return out_fn
@@ -0,0 +1,221 @@
+"""Content-addressed cache of robot map solutions.
+
+###############################################################################
+# solution_cache.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Skip the search when a map already solved with the same
+#               options is submitted again.
+#
+# Contents:
+#
+#   SolutionCache: Size-bounded on-disk cache of path lengths and coordinates.
+#
+#   solution_key: Return the cache key of a map and the solver options.
+#
+###############################################################################
+
+Entries are keyed on the contents of the map rather than its filename, so a
+map copied or renamed is still found in the cache, while a map edited in place
+is not.  The key is a SHA-256 digest of map_io.grid_digest of the map and the
+solver options (engine, terrain legend, and diagonal movement).
+
+Each entry is a small binary file named after its key, holding the path length
+as a float64, the (row, column) of the first cell of the path as two int64s
+(-1 if the path is empty), and then one uint8 per step along the path.  Every
+step moves to one of the eight neighboring cells, so it is stored as the code
+3 * (d_row + 1) + (d_col + 1) rather than as a pair of coordinates.
+
+The cache is bounded in total bytes.  Reading an entry touches its
+modification time, and once the bound is exceeded the entries least recently
+used are deleted first.  The total is tracked in memory as entries are
+written, so the directory is only scanned when it is opened and when entries
+must be evicted.  Entries may be deleted by another process sharing the
+directory at any time, and are then simply treated as missing.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+import hashlib
+import os
+import tempfile
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.map_io import grid_digest
+
+
+# %% Constants
+DEFAULT_MAX_BYTES = 64 * 2**20  # Bound on total size of cache entries
+ENTRY_SUFFIX = '.path'          # Suffix of cache entry files
+HEADER_DTYPE = np.dtype([('length', '<f8'),     # np.inf if unreachable
+                         ('row', '<i8'),        # First cell, -1 if none
+                         ('col', '<i8')])
+
+
+# %% Classes
+class SolutionCache:
+    """Size-bounded on-disk cache of path lengths and coordinates.
+
+    The hits, misses, and evictions attributes count the lookups answered
+    from the cache, the lookups that were not, and the entries deleted to keep
+    the cache within max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        """Open the cache directory, creating it if it does not exist."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0                   # Lookups found in the cache
+        self.misses = 0                 # Lookups not found in the cache
+        self.evictions = 0              # Entries deleted to bound size
+        self._bytes = sum(size for _, size, _ in self._entries())
+
+    def get(self, key):
+        """Return the (length, coords) tuple stored under key, or None.
+
+        The coords are a list of (row, column) tuples, as returned by the
+        search engines of robot_path.  An entry that is truncated or corrupt
+        counts as a miss, and is deleted.
+        """
+        filename = self._filename(key)
+        try:
+            data = filename.read_bytes()
+            os.utime(filename)          # Mark entry as recently used
+        except FileNotFoundError:       # Missing, or evicted by others
+            self.misses += 1
+            return None
+        try:
+            entry = _decode_entry(data)
+        except ValueError:
+            try:
+                filename.unlink()
+                self._bytes -= len(data)
+            except FileNotFoundError:
+                pass                    # Deleted by another process
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key, length, coords):
+        """Store the path length and coordinates under key.
+
+        Entries least recently used are then evicted until the cache is
+        within max_bytes.
+        """
+        header = np.array([(length, -1, -1)], dtype=HEADER_DTYPE)
+        cells = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+        if len(cells):
+            header['row'], header['col'] = cells[0]
+        moves = np.diff(cells, axis=0) + 1
+        steps = (3 * moves[:, 0] + moves[:, 1]).astype(np.uint8)
+        data = header.tobytes() + steps.tobytes()
+        filename = self._filename(key)
+        try:
+            replaced = filename.stat().st_size  # Entry overwritten
+        except FileNotFoundError:
+            replaced = 0
+        # Unique name, so concurrent writers of a key never share a file
+        fd, temp_fn = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                fout.write(data)
+            os.replace(temp_fn, filename)   # Readers never see partial entry
+        except BaseException:
+            os.unlink(temp_fn)
+            raise
+        self._bytes += len(data) - replaced
+        if self._bytes > self.max_bytes:
+            self._evict()
+
+    def stats(self):
+        """Return dict of the counters, number of entries, and total bytes."""
+        entries = self._entries()
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'entries': len(entries),
+                'bytes': sum(size for _, size, _ in entries)}
+
+    def clear(self):
+        """Delete every entry of the cache."""
+        for filename, _, _ in self._entries():
+            try:
+                filename.unlink()
+            except FileNotFoundError:
+                pass                    # Deleted by another process
+        self._bytes = 0
+
+    def _filename(self, key):
+        """Return filename of the entry stored under key."""
+        return self.directory / (key + ENTRY_SUFFIX)
+
+    def _entries(self):
+        """Return list of (filename, bytes, last used) tuples of entries."""
+        entries = []
+        for filename in self.directory.glob('*' + ENTRY_SUFFIX):
+            try:
+                stat = filename.stat()
+            except FileNotFoundError:
+                continue                # Deleted by another process
+            entries.append((filename, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self):
+        """Delete least recently used entries until within max_bytes.
+
+        The directory is scanned again, since other processes may have added
+        or deleted entries, and the total tracked in memory is corrected.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        entries.sort(key=lambda entry: entry[2])    # Least recent first
+        for filename, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                filename.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass                    # Deleted by another process
+            total -= size
+        self._bytes = total
+
+
+# %% Functions
+def _decode_entry(data):
+    """Return the (length, coords) tuple of the bytes of a cache entry.
+
+    Raise ValueError if the entry is truncated or holds an invalid step.
+    """
+    if len(data) < HEADER_DTYPE.itemsize:
+        raise ValueError('Cache entry is truncated!')
+    header = np.frombuffer(data, dtype=HEADER_DTYPE, count=1)[0]
+    length = float(header['length'])
+    if length.is_integer():
+        length = int(length)            # Keep integer lengths of unit costs
+    steps = np.frombuffer(data, dtype=np.uint8, offset=HEADER_DTYPE.itemsize)
+    if header['row'] < 0:
+        if len(steps):
+            raise ValueError('Cache entry has steps but no cells!')
+        return length, []               # Unreachable, or no cells on path
+    if np.any((steps > 8) | (steps == 4)):  # Step 4 would not move
+        raise ValueError('Cache entry holds an invalid step!')
+    moves = np.column_stack(np.divmod(steps.astype(np.int64), 3)) - 1
+    cells = np.cumsum(np.vstack(([header['row'], header['col']], moves)),
+                      axis=0)
+    return length, [(int(row), int(col)) for row, col in cells]
+
+
+def solution_key(grid, engine, legend=None, diagonal=False):
+    """Return the cache key of a map read in by read_grid and its options."""
+    digest = hashlib.sha256(grid_digest(grid).encode())
+    options = (engine, sorted((legend or {}).items()), bool(diagonal))
+    digest.update(repr(options).encode())
+    return digest.hexdigest()
@@ -0,0 +1,333 @@
+"""Out-of-core search of robot maps too large to hold in memory.
+
+###############################################################################
+# tiled.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Search maps larger than RAM by memory-mapping the map file and
+#               paging fixed-size tiles of the map in and out on demand.
+#
+# Contents:
+#
+#   MappedGrid: Character grid of a map file accessed through a memory map.
+#
+#   TileCache: Bounded least-recently-used cache of map tiles.
+#
+#   tiled_search: A* search that touches the map only through a TileCache.
+#
+#   tiled_solution: Solve a map file in tiled mode and write the solution.
+#
+###############################################################################
+
+The map file is never read into memory as a whole.  MappedGrid views the file
+through np.memmap, so the operating system reads in only the pages touched.
+The search state of each cell (its distance from the robot, the direction it
+was reached from, and whether it is settled) is kept in square tiles together
+with the passability of the tile's cells.  Tiles are loaded into a TileCache
+when the search first touches them, and the least recently used tile is
+evicted once the memory budget is reached.  The state of an evicted tile is
+written to a scratch file, and read back if the tile is loaded again.
+
+The tile_loads and tile_evictions counters of the cache show how well the tile
+size suits a map: A* on a map with long detours revisits old tiles, and a cache
+too small for the search frontier thrashes.  Only the priority queue of the
+search, which holds the frontier, is kept outside of the tiles.
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+from shutil import copyfile
+import tempfile
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.linked_list_data_structures import PositionalList
+from interview.robot.grid_search import NO_PARENT, FROM_ABOVE, FROM_BELOW
+from interview.robot.grid_search import FROM_LEFT, FROM_RIGHT
+from interview.robot.map_io import OBSTACLE, ROBOT, GOAL, PATH
+from interview.robot.map_io import NEWLINE, RETURN
+
+
+# %% Constants
+DEFAULT_TILE_SIZE = 256             # Width and height of tiles in cells
+DEFAULT_MEMORY_BUDGET = 64 * 2**20  # Bytes of tile data kept in memory
+BYTES_PER_CELL = 6                  # Passable, distance, and flags of a cell
+CLOSED_FLAG = 0x80                  # Flag bit set once a cell is settled
+DIRECTION_MASK = 0x7F               # Flag bits of the parent direction
+SCAN_ROWS = 4096                    # Rows scanned at a time by MappedGrid.find
+
+
+# %% Classes
+class MappedGrid:
+    """Character grid of a map file accessed through a memory map.
+
+    The grid attribute is a read-only 2D uint8 array, as returned by
+    map_io.read_grid, but its rows are views into the memory-mapped file
+    rather than a copy of it.  Rows must be equal in length and may end in
+    either LF or CRLF line endings.
+    """
+
+    def __init__(self, filename):
+        """Memory-map the map file and locate its rows."""
+        self.filename = Path(filename)
+        raw = np.memmap(self.filename, dtype=np.uint8, mode='r')
+        size = len(raw)
+        while size and raw[size-1] in (NEWLINE, RETURN):
+            size -= 1                   # Ignore trailing line endings
+        if size == 0:
+            raise ValueError('Map is empty!')
+        newline = _first_index(raw, NEWLINE, size)  # End of first row
+        if newline == size:             # Map of a single row
+            ncols, nrows = size, 1
+            self.stride = ncols + 1
+        else:
+            ncols = newline - (raw[newline-1] == RETURN)    # LF or CRLF
+            self.stride = newline + 1   # Bytes from one row to the next
+            # Rows are only checked through the total size of the file
+            if (size - ncols) % self.stride:
+                raise ValueError('Rows of map differ in length!')
+            nrows = (size - ncols) // self.stride + 1
+        self.shape = (nrows, ncols)
+        self.grid = np.lib.stride_tricks.as_strided(
+            raw, shape=self.shape, strides=(self.stride, 1), writeable=False)
+
+    def find(self, char):
+        """Return (row, column) of the last cell holding char in the grid.
+
+        The grid is scanned SCAN_ROWS rows at a time.  Raise ValueError if the
+        character is not found.
+        """
+        code = ord(char) if isinstance(char, str) else char
+        for row0 in range((self.shape[0] - 1) // SCAN_ROWS * SCAN_ROWS,
+                          -1, -SCAN_ROWS):
+            cells = np.argwhere(self.grid[row0:row0+SCAN_ROWS] == code)
+            if len(cells):
+                return int(cells[-1][0]) + row0, int(cells[-1][1])
+        raise ValueError(f'Character {chr(code)!r} not found in map!')
+
+
+class TileCache:
+    """Bounded least-recently-used cache of map tiles.
+
+    Each tile holds the passability and search state of a square block of
+    tile_size cells.  At most memory_budget bytes of tiles are held in
+    memory, which must be enough for at least two tiles.  The loads and
+    evictions attributes count tiles read in and paged out.
+    """
+
+    class _Tile:
+        """Passability and search state of one block of the map."""
+
+        __slots__ = '_key', '_passable', '_dist', '_flags'
+
+        def __init__(self, key, passable, dist, flags):
+            self._key = key             # Tile number in row-major order
+            self._passable = passable   # Boolean array, False for obstacles
+            self._dist = dist           # Distance from start, -1 if unknown
+            self._flags = flags         # Parent direction and CLOSED_FLAG
+
+    def __init__(self, mapped, tile_size=DEFAULT_TILE_SIZE,
+                 memory_budget=DEFAULT_MEMORY_BUDGET):
+        """Create an empty cache and the scratch file for evicted state."""
+        self.tile_size = tile_size
+        self.capacity = memory_budget // (tile_size**2 * BYTES_PER_CELL)
+        if self.capacity < 2:
+            raise ValueError('Memory budget is too small for two tiles!')
+        self.loads = 0                  # Tiles read into the cache
+        self.evictions = 0              # Tiles paged out of the cache
+        self._grid = mapped.grid
+        nrows, ncols = mapped.shape
+        self._tiles_per_row = -(-ncols // tile_size)
+        ntiles = -(-nrows // tile_size) * self._tiles_per_row
+        self._positions = np.empty(ntiles, dtype=object)    # Cached tiles
+        self._saved = np.zeros(ntiles, dtype=bool)  # State in scratch file
+        self._lru = PositionalList()    # Most recently used tile first
+        self._recent = self._Tile(-1, None, None, None)     # Front of LRU
+        self._scratch = tempfile.TemporaryFile()
+        self._dist = np.memmap(self._scratch, dtype=np.int32, mode='w+',
+                               shape=(nrows, ncols))
+        self._flags = np.memmap(self._scratch, dtype=np.uint8, mode='r+',
+                                offset=self._dist.nbytes,
+                                shape=(nrows, ncols))
+
+    def close(self):
+        """Release the scratch file holding the state of evicted tiles."""
+        del self._dist, self._flags
+        self._scratch.close()
+
+    def tile(self, row, col):
+        """Return the tile holding cell (row, col), loading it if needed.
+
+        The tile's arrays are indexed by (row % tile_size, col % tile_size).
+        """
+        k = self.tile_size
+        key = (row // k) * self._tiles_per_row + col // k
+        if key == self._recent._key:
+            return self._recent         # Most recently used tile
+        position = self._positions[key]
+        if position is not None:
+            tile = self._lru.delete(position)   # Move to front of LRU order
+        else:
+            if len(self._lru) >= self.capacity:
+                self._evict(self._lru.last())
+            tile = self._load(key)
+        self._positions[key] = self._lru.add_first(tile)
+        self._recent = tile
+        return tile
+
+    def _bounds(self, key):
+        """Return (row0, row1, col0, col1) slice bounds of a tile."""
+        k = self.tile_size
+        row0 = (key // self._tiles_per_row) * k
+        col0 = (key % self._tiles_per_row) * k
+        return row0, row0 + k, col0, col0 + k
+
+    def _load(self, key):
+        """Read a tile in from the map file and the scratch file."""
+        self.loads += 1
+        row0, row1, col0, col1 = self._bounds(key)
+        passable = self._grid[row0:row1, col0:col1] != OBSTACLE
+        if self._saved[key]:
+            dist = np.array(self._dist[row0:row1, col0:col1])
+            flags = np.array(self._flags[row0:row1, col0:col1])
+        else:
+            dist = np.full(passable.shape, -1, dtype=np.int32)
+            flags = np.zeros(passable.shape, dtype=np.uint8)
+        return self._Tile(key, passable, dist, flags)
+
+    def _evict(self, position):
+        """Write the state of a tile to the scratch file and drop it."""
+        self.evictions += 1
+        tile = self._lru.delete(position)
+        row0, row1, col0, col1 = self._bounds(tile._key)
+        self._dist[row0:row1, col0:col1] = tile._dist
+        self._flags[row0:row1, col0:col1] = tile._flags
+        self._saved[tile._key] = True
+        self._positions[tile._key] = None
+
+
+# %% Functions
+def tiled_search(mapped, start, goal, tile_size=DEFAULT_TILE_SIZE,
+                 memory_budget=DEFAULT_MEMORY_BUDGET, stats=None):
+    """Find the shortest path from start to goal of a MappedGrid using A*.
+
+    The start and goal arguments are (row, column) tuples.  Cells are only
+    accessed through a TileCache built with the given tile size and memory
+    budget.  The priority queue holds a new entry each time the distance of a
+    cell improves, and stale entries are skipped once the cell is settled, so
+    no locator needs to be kept for each cell.
+
+    Return a tuple of the path length and a list of (row, column) tuples along
+    the path, ordered from goal to start and excluding both endpoints.  If the
+    goal is unreachable return (np.inf, []).  If a stats dict is given, the
+    number of cells settled and the tile loads and evictions are stored under
+    'expansions', 'tile_loads', and 'tile_evictions'.
+    """
+    nrows, ncols = mapped.shape
+    goal_row, goal_col = goal
+    k = tile_size
+    cache = TileCache(mapped, tile_size, memory_budget)
+    queue = AdaptablePriorityQueue()    # Priority queue with (f, h) keys
+    steps = ((-1, 0, FROM_BELOW), (1, 0, FROM_ABOVE),   # Neighbor offsets and
+             (0, -1, FROM_RIGHT), (0, 1, FROM_LEFT))    # direction entered
+    expansions = 0
+    length = np.inf
+    cache.tile(*start)._dist[start[0] % k, start[1] % k] = 0
+    h = abs(start[0] - goal_row) + abs(start[1] - goal_col)
+    queue.enqueue((h, h), start)
+    while not queue.is_empty():
+        _, (row, col) = queue.dequeue()
+        tile = cache.tile(row, col)
+        if tile._flags[row % k, col % k] & CLOSED_FLAG:
+            continue                    # Stale entry of a settled cell
+        tile._flags[row % k, col % k] |= CLOSED_FLAG
+        expansions += 1
+        d = int(tile._dist[row % k, col % k]) + 1
+        if (row, col) == (goal_row, goal_col):
+            length = d - 1
+            break                       # Goal settled, stop search
+        for d_row, d_col, direction in steps:
+            v_row, v_col = row + d_row, col + d_col
+            if not (0 <= v_row < nrows and 0 <= v_col < ncols):
+                continue
+            tile = cache.tile(v_row, v_col)
+            r, c = v_row % k, v_col % k
+            if not tile._passable[r, c] or tile._flags[r, c] & CLOSED_FLAG:
+                continue                # Obstacle or settled cell
+            if tile._dist[r, c] < 0 or d < tile._dist[r, c]:
+                tile._dist[r, c] = d    # Relaxation step
+                tile._flags[r, c] = direction
+                h = abs(v_row - goal_row) + abs(v_col - goal_col)
+                queue.enqueue((d + h, h), (v_row, v_col))
+    coords = []
+    if length < np.inf:                 # Follow directions back to start
+        offsets = {FROM_ABOVE: (-1, 0), FROM_BELOW: (1, 0),
+                   FROM_LEFT: (0, -1), FROM_RIGHT: (0, 1)}
+        row, col = goal
+        while True:
+            flags = cache.tile(row, col)._flags[row % k, col % k]
+            direction = flags & DIRECTION_MASK
+            if direction == NO_PARENT:
+                break                   # Reached start
+            d_row, d_col = offsets[direction]
+            row, col = row + d_row, col + d_col
+            coords.append((row, col))
+        coords.pop()                    # Remove start
+    if stats is not None:
+        stats['expansions'] = expansions
+        stats['tile_loads'] = cache.loads
+        stats['tile_evictions'] = cache.evictions
+    cache.close()
+    return length, coords
+
+
+def tiled_solution(filename, tile_size=DEFAULT_TILE_SIZE,
+                   memory_budget=DEFAULT_MEMORY_BUDGET, stats=None):
+    """Solve a map file in tiled mode and write the solution file.
+
+    The solution file is a copy of the map file, with the path cells patched
+    through a writable memory map, so line endings are kept as in the map.
+    The stats argument is passed to tiled_search.
+
+    Return a tuple of the solution filename and the path length, as returned
+    by robot_path.solve_map.
+    """
+    filename = Path(filename)
+    mapped = MappedGrid(filename)
+    start, goal = mapped.find(ROBOT), mapped.find(GOAL)
+    length, coords = tiled_search(mapped, start, goal, tile_size,
+                                  memory_budget, stats)
+    out_fn = filename.parent / (filename.stem + '_SOLUTION.txt')
+    copyfile(filename, out_fn)
+    if coords:
+        out = np.memmap(out_fn, dtype=np.uint8, mode='r+')
+        rows, cols = np.asarray(coords).T
+        out[rows * mapped.stride + cols] = PATH     # Mark path with 'O'
+        out.flush()
+        del out
+    return out_fn, length
+
+
+def _first_index(raw, code, size):
+    """Return index of the first byte equal to code, or size if none.
+
+    The memory-mapped bytes are searched in blocks of growing size, so a
+    small prefix of the file is read when the first row is short.
+    """
+    block = 4096
+    offset = 0
+    while offset < size:
+        hits = np.flatnonzero(raw[offset:min(offset + block, size)] == code)
+        if len(hits):
+            return offset + int(hits[0])
+        offset += block
+        block *= 2
+    return size
+
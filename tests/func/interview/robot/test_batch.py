@@ -0,0 +1,75 @@
+"""Test batch solver for the robot path programming test.
+
+###############################################################################
+# test_batch.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Functional testing of the batch solver.  A directory of ASCII
+#               maps is solved across a process pool.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+import filecmp
+from shutil import copyfile
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.batch import batch_solution, map_files
+
+
+# %% Functional tests
+# Define file paths to be used for functional testing.
+test_path = Path('./tests/func/interview/robot/test_robot_path/testpaths/')
+soln_path = Path('./tests/func/interview/robot/test_robot_path/solutions/')
+
+
+@pytest.mark.parametrize('engine', ['dijkstra', 'astar'])
+def test_batch_solution(tmp_path, capfd, engine):
+    """Test solving a directory of maps with two worker processes.
+
+    Every solution file must match its expected solution, and the workers must
+    not print anything to stdout.
+    """
+    for test_file in test_path.iterdir():
+        copyfile(test_file, tmp_path / test_file.name)
+    table = batch_solution(tmp_path, engine, max_workers=2)
+    assert capfd.readouterr().out == ''
+    assert len(table) == len(list(test_path.iterdir()))
+    for row in table:
+        soln_file = soln_path / (row['filename'].stem + '_soln.txt')
+        assert filecmp.cmp(soln_file, row['solution'], shallow=False)
+        assert row['reachable'] == (row['length'] != np.inf)
+        assert row['seconds'] > 0
+        assert row['error'] == ''
+    # Solution files written by the batch are not treated as maps
+    assert map_files(tmp_path) == sorted(table['filename'])
+    assert map_files(tmp_path / 'testpath[12].txt') == \
+        [tmp_path / 'testpath1.txt', tmp_path / 'testpath2.txt']
+
+
+def test_batch_solution_errors(tmp_path):
+    """Test a map that cannot be solved does not lose the other results."""
+    copyfile(test_path / 'testpath1.txt', tmp_path / 'testpath1.txt')
+    (tmp_path / 'bad.txt').write_text('....\n.#..\n...G')    # No robot
+    (tmp_path / 'ragged.txt').write_text('R...\n..\n...G')
+    table = batch_solution(tmp_path, max_workers=2)
+    assert [x.name for x in table['filename']] == ['bad.txt', 'ragged.txt',
+                                                   'testpath1.txt']
+    bad, ragged, good = table
+    for row in (bad, ragged):
+        assert row['solution'] is None
+        assert row['length'] == np.inf
+        assert not row['reachable']
+        assert row['error'].startswith('ValueError: ')
+    assert good['reachable'] and good['error'] == ''
+    assert good['solution'].exists()
@@ -21,9 +21,12 @@ from shutil import copyfile
 
 # Related third party imports
 import pytest
+import numpy as np
 
 # Local application/library specific imports
 import interview.robot.robot_path as rp
+from interview.robot.graph_data_structures import Graph
+from interview.robot.map_io import read_grid, terrain_costs, OBSTACLE
 
 
 # %% Functional tests
@@ -39,13 +42,14 @@ test_ids = [x.stem for x in test_files]
 indices = list(range(num_files))
 
 
+@pytest.mark.parametrize('engine', list(rp.ENGINES))
 @pytest.mark.parametrize('index', indices, ids=test_ids)
-def test_solution(tmp_path, index):
+def test_solution(tmp_path, index, engine):
     """Test solution to robot shortest path programming exercise.
 
     This test is parameterized and will test the solution against multiple
-    ASCII maps.  The resulting output file is compared to a solution file to
-    verify that the shortest path is correctly computed.
+    ASCII maps and every search engine.  The resulting output file is compared
+    to a solution file to verify that the shortest path is correctly computed.
 
     Uses pytest's tmp_path fixture to create a temporary directory that will be
     torn down and removed after the test completes.
@@ -59,6 +63,241 @@ def test_solution(tmp_path, index):
     copyfile(test_file, test_copy)
     copyfile(soln_file, soln_copy)
     # Pass the path of the copied test file to the solver
-    output_file = rp.robot_solution(test_copy)
+    output_file = rp.robot_solution(test_copy, engine)
     # Verify that the output file is the same as the solution file
     assert filecmp.cmp(soln_copy, output_file, shallow=False)
+
+
+def test_shortest_path_early_exit():
+    """Test that Djikstra's algorithm stops once the goal is settled.
+
+    The goal distance must match a search of the full graph, while fewer
+    vertices should be relaxed by the goal-directed search.
+    """
+    graph, start, goal, _ = rp.map_to_graph(test_files[0])
+    full_cloud, _ = rp.shortest_path_length(graph, start)
+    goal_cloud, _ = rp.shortest_path_length(graph, start, goal)
+    assert goal_cloud[goal] == full_cloud[goal]
+    assert len(goal_cloud) < len(full_cloud)
+    # Unreachable vertices are never discovered by the search
+    graph, start, goal, _ = rp.map_to_graph(test_files[2])
+    cloud, tree = rp.shortest_path_length(graph, start)
+    assert cloud.get(goal) is None
+    assert tree.get(goal) is None
+
+
+def test_shortest_path_many_sources():
+    """Test a search from several start vertices toward several goals.
+
+    Each vertex is relaxed at its distance from the nearest start vertex, and
+    the search stops once every goal vertex has been settled.
+    """
+    graph, start, goal, _ = rp.map_to_graph(test_files[0])
+    start_cloud, _ = rp.shortest_path_length(graph, start)
+    goal_cloud, _ = rp.shortest_path_length(graph, goal)
+    cloud, tree = rp.shortest_path_length(graph, [start, goal])
+    assert len(cloud) == len(start_cloud)
+    assert len(tree) == len(cloud) - 2
+    for vertex, distance in cloud:
+        assert distance == min(start_cloud[vertex], goal_cloud[vertex])
+    far = max(start_cloud, key=lambda item: item[1])[0]
+    targets = [goal, far]
+    cloud, _ = rp.shortest_path_length(graph, start, targets)
+    assert cloud[goal] == start_cloud[goal]
+    assert cloud[far] == start_cloud[far]
+    cloud, _ = rp.shortest_path_length(graph, start, (goal,))
+    assert cloud[goal] == start_cloud[goal]
+    assert len(cloud) < len(start_cloud)
+
+
+@pytest.mark.parametrize('index', indices, ids=test_ids)
+def test_shortest_path_tree(index):
+    """Test the tree recorded by Djikstra's algorithm against a second pass.
+
+    Both trees must give every vertex in the cloud a parent edge that lies on a
+    shortest path from the start vertex.
+    """
+    graph, start, _, _ = rp.map_to_graph(test_files[index])
+    cloud, tree = rp.shortest_path_length(graph, start)
+    post_hoc_tree = rp.shortest_path_tree(graph, start, cloud)
+    assert len(tree) == len(post_hoc_tree) == len(cloud) - 1
+    for vertex, edge in tree:
+        parent = edge.opposite(vertex)
+        assert cloud[vertex] == cloud[parent] + edge.element()
+
+
+@pytest.mark.parametrize('index', indices, ids=test_ids)
+def test_prune_obstacles(index):
+    """Test that pruning obstacles shrinks the graph but not the solution.
+
+    Obstacle vertices are left out of the pruned graph, while the remaining
+    vertices keep their coordinates and the goal distance is unchanged.
+    """
+    full = rp.map_to_graph(test_files[index])
+    pruned = rp.map_to_graph(test_files[index], prune_obstacles=True)
+    obstacles = sum(v.element() == '#' for v in full[0].vertices())
+    assert pruned[0].vertex_count() == full[0].vertex_count() - obstacles
+    for vertex in pruned[0].vertices():
+        assert vertex.element() != '#'
+        for edge in pruned[0].incident_edges(vertex):
+            assert edge.element() == 1
+    assert pruned[3][pruned[1]] == full[3][full[1]]     # Robot coordinates
+    assert pruned[3][pruned[2]] == full[3][full[2]]     # Goal coordinates
+    full_cloud, _ = rp.shortest_path_length(full[0], full[1], full[2])
+    pruned_cloud, _ = rp.shortest_path_length(pruned[0], pruned[1], pruned[2])
+    assert pruned_cloud.get(pruned[2], np.inf) == \
+        full_cloud.get(full[2], np.inf)
+
+
+@pytest.mark.parametrize('index', indices, ids=test_ids)
+def test_frozen_graph(index):
+    """Test searches of a frozen graph against the graph it was frozen from.
+
+    Both searches must settle the same vertices at the same distances, and
+    the bidirectional search must find the same path length.
+    """
+    graph, start, goal, _ = rp.map_to_graph(test_files[index],
+                                            prune_obstacles=True)
+    frozen = graph.freeze()
+    ids = {vertex: idx for idx, vertex in enumerate(graph.vertices())}
+    cloud, _ = rp.shortest_path_length(graph, start)
+    frozen_cloud, frozen_tree = rp.shortest_path_length(frozen, ids[start])
+    assert len(frozen_cloud) == len(cloud)
+    for vertex, distance in cloud:
+        assert frozen_cloud[ids[vertex]] == distance
+    for vertex, edge in frozen_tree:
+        parent = edge.opposite(vertex)
+        assert frozen_cloud[vertex] == frozen_cloud[parent] + edge.element()
+    length, _ = rp.bidirectional_shortest_path(graph, start, goal)
+    assert rp.bidirectional_shortest_path(frozen, ids[start],
+                                          ids[goal])[0] == length
+
+
+@pytest.mark.parametrize('directed', [True, False],
+                         ids=lambda x: f'directed={x}')
+def test_bidirectional_shortest_path(directed):
+    """Test bidirectional search against Djikstra's algorithm.
+
+    Random weighted graphs exercise the stopping rule, which must not stop when
+    the two searches first meet but only once no shorter path can be found.
+    """
+    rng = np.random.default_rng(29)             # Seeded random generator
+    for _ in range(20):
+        graph = Graph(directed)
+        verts = [graph.insert_vertex(x) for x in range(25)]
+        for _ in range(60):
+            u, v = rng.choice(verts, size=2, replace=False)
+            if graph.get_edge(u, v) is None and graph.get_edge(v, u) is None:
+                graph.insert_edge(u, v, int(rng.integers(1, 10)))
+        start, goal = verts[0], verts[-1]
+        cloud, _ = rp.shortest_path_length(graph, start, goal)
+        length, tree = rp.bidirectional_shortest_path(graph, start, goal)
+        assert length == cloud.get(goal, np.inf)
+        if length == np.inf:
+            continue
+        total = 0                               # Walk tree back to start
+        vertex = goal
+        while vertex is not start:
+            edge = tree[vertex]
+            if directed:
+                assert edge.endpoints()[1] is vertex
+            total += edge.element()
+            vertex = edge.opposite(vertex)
+        assert total == length
+
+
+@pytest.mark.parametrize('engine', rp.TERRAIN_ENGINES)
+def test_terrain(tmp_path, engine):
+    """Test weighted terrain and diagonal movement.
+
+    The straight path through the slow terrain costs more than the detour
+    around it.  Diagonal moves shorten the detour, but may not cut the corner
+    of an obstacle.
+    """
+    filename = tmp_path / 'map.txt'
+    filename.write_text('.....\n'
+                        'R~~~G\n'
+                        '##...')
+    legend = {'~': 5}
+    out_fn, length = rp.solve_map(filename, engine, legend)
+    assert length == 6
+    assert out_fn.read_text() == 'OOOOO\nR~~~G\n##...'
+    out_fn, length = rp.solve_map(filename, engine, legend, diagonal=True)
+    assert length == pytest.approx(2 + 2 * np.sqrt(2))
+    assert out_fn.read_text() == '.OOO.\nR~~~G\n##...'
+    out_fn, length = rp.solve_map(filename, engine, diagonal=True)
+    assert length == 4                      # Unit cost, straight path
+    assert out_fn.read_text() == '.....\nROOOG\n##...'
+
+
+@pytest.mark.parametrize('prune', [False, True], ids=['full', 'pruned'])
+@pytest.mark.parametrize('diagonal', [False, True], ids=['4-way', '8-way'])
+def test_add_edges(tmp_path, prune, diagonal):
+    """Test edges added one cell at a time match those of grid_to_graph."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..#.\n'
+                        '.~#..\n'
+                        '..~.G')
+    grid = read_grid(filename)
+    legend = {'~': 3}
+    costs = terrain_costs(grid, legend)
+    g = Graph()
+    vert_arr = np.empty(grid.shape, dtype=object)
+    for row, col in np.ndindex(grid.shape):
+        if not (prune and costs[row, col] == np.inf):
+            vert_arr[row, col] = g.insert_vertex((row, col))
+    for row, col in np.ndindex(grid.shape):
+        if vert_arr[row, col] is not None:
+            rp.add_edges(row, col, g, vert_arr, costs, diagonal)
+
+    def edge_set(graph, coords):
+        """Return set of (cells, weight) tuples of the edges of graph."""
+        return {(frozenset(coords(x) for x in edge.endpoints()),
+                 edge.element()) for edge in graph.edges()}
+
+    expected, _, _, vert_map = rp.grid_to_graph(grid, prune, legend,
+                                                diagonal)
+    assert g.edge_count() == expected.edge_count()
+    assert edge_set(g, lambda x: x.element()) == \
+        edge_set(expected, lambda x: vert_map[x])
+
+
+@pytest.mark.parametrize('prune', [False, True], ids=['full', 'pruned'])
+def test_add_edges_default_costs(tmp_path, prune):
+    """Test add_edges finds costs from the vertex elements if not given."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..#.\n'
+                        '..#..\n'
+                        '.#..G')
+    grid = read_grid(filename)
+    g = Graph()
+    vert_arr = np.empty(grid.shape, dtype=object)
+    coords = {}                         # Cell of each vertex
+    for row, col in np.ndindex(grid.shape):
+        if not (prune and grid[row, col] == OBSTACLE):
+            vertex = g.insert_vertex(chr(grid[row, col]))
+            vert_arr[row, col] = vertex
+            coords[vertex] = (row, col)
+    for row, col in np.ndindex(grid.shape):
+        if vert_arr[row, col] is not None:
+            rp.add_edges(row, col, g, vert_arr)
+    expected, _, _, vert_map = rp.grid_to_graph(grid, prune)
+    assert g.edge_count() == expected.edge_count()
+    assert {(frozenset(coords[x] for x in edge.endpoints()), edge.element())
+            for edge in g.edges()} == \
+        {(frozenset(vert_map[x] for x in edge.endpoints()), edge.element())
+         for edge in expected.edges()}
+
+
+def test_terrain_invalid(tmp_path):
+    """Test that invalid costs and unsupported engines are rejected."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R~G')
+    with pytest.raises(ValueError):
+        rp.solve_map(filename, 'dijkstra', {'~': 0})
+    with pytest.raises(ValueError):
+        rp.solve_map(filename, 'jps', {'~': 2})
+    with pytest.raises(ValueError):
+        rp.solve_map(filename, 'bfs', diagonal=True)
+    assert rp.solve_map(filename, 'astar', {'~': 2})[1] == 3
+    assert rp.solve_map(filename, 'jps')[1] == 2    # '~' is open space
@@ -20,7 +20,7 @@
 import pytest
 
 # Local application/library specific imports
-from interview.robot.array_data_structures import Map, Queue
+from interview.robot.array_data_structures import Map, Queue, hash_codes
 
 
 # %% Test Map class and nested _Item class
@@ -79,6 +79,47 @@ def test_map():
     assert a_map.get(3442, 7) == 7       # Test get() method w/ default value
 
 
+def test_map_insert_new():
+    """Test adding many new keys to a Map at once."""
+    keys = ['abc', '', 'z', 27, -4, 3.234, (1, 2), 'caf\u00e9']
+    a_map = Map()
+    codes = hash_codes(keys)
+    for key, code in zip(keys, codes):   # Same codes as each key hashed
+        assert a_map._compression_function(code) == a_map._hash_code(key)
+    assert hash_codes([]) == []
+    with pytest.raises(TypeError):
+        hash_codes([{}])                 # Unhashable key
+    a_map['x'] = -1
+    a_map.insert_new(keys, range(len(keys)))
+    assert len(a_map) == len(keys) + 1
+    for val, key in enumerate(keys):
+        assert a_map[key] == val         # New keys found by lookups
+    assert a_map['x'] == -1
+    a_map.reserve(100)
+    assert len(a_map._hash_table) == 201
+    a_map.reserve(10)                    # Never shrinks the table
+    assert len(a_map._hash_table) == 201
+    for val, key in enumerate(keys):
+        assert a_map[key] == val         # Keys kept by resizing
+    a_map.insert_new(range(100, 150), range(50),
+                     hash_codes(range(100, 150)))
+    assert len(a_map._hash_table) == 201     # Reserved, not resized
+    assert len(a_map) == len(keys) + 51
+    assert [a_map[key] for key in range(100, 150)] == list(range(50))
+
+
+def test_map_compact():
+    """Test Maps have no instance dict and share their empty buckets."""
+    a_map = Map()
+    assert not hasattr(a_map, '__dict__')
+    assert all(bucket is a_map._hash_table[0] for bucket in a_map._hash_table)
+    a_map['a'] = 1
+    assert sum(len(bucket) for bucket in a_map._hash_table) == 1
+    assert a_map._hash_table.count(()) == a_map._default_capacity - 1
+    del a_map['a']
+    assert list(a_map) == []
+
+
 # %% Test Queue class
 def test_queue():
     """Test methods of Queue class."""
@@ -0,0 +1,143 @@
+"""Test benchmarks of the robot path programming test search engines.
+
+###############################################################################
+# test_benchmark.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the benchmark comparing the search engines, and the
+#               scaling benchmark on generated maps.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.benchmark import compare_engines, print_results
+from interview.robot.benchmark import scaling_benchmark, find_regressions
+from interview.robot.benchmark import save_results, load_results
+from interview.robot.benchmark import memory_benchmark
+from interview.robot.benchmark import BENCHMARKS, MAX_CELLS, SIZE_TIERS
+from interview.robot.map_generator import MAP_STYLES
+
+
+# %% Test compare_engines()
+test_path = Path('./tests/func/interview/robot/test_robot_path/testpaths/')
+
+
+def check_lengths(rows):
+    """Check the optimal engines agree and HPA* is no shorter."""
+    optimal = rows[rows['engine'] != 'hpa']['length']
+    assert len(set(optimal)) == 1
+    assert np.all(rows[rows['engine'] == 'hpa']['length'] >= optimal[0])
+
+
+def test_compare_engines(capsys):
+    """Test that every engine agrees on path length for the test maps.
+
+    HPA* may find a longer path than the other engines.  Jump Point Search
+    should never expand more points than Djikstra's algorithm settles
+    vertices.
+    """
+    test_files = sorted(test_path.iterdir())
+    results = compare_engines(test_files, tuple(BENCHMARKS))
+    assert len(results) == len(test_files) * len(BENCHMARKS)
+    for filename in test_files:
+        rows = results[results['filename'] == filename]
+        check_lengths(rows)
+        dijkstra = rows[rows['engine'] == 'dijkstra'][0]
+        jps = rows[rows['engine'] == 'jps'][0]
+        assert jps['expansions'] <= dijkstra['expansions']
+    print_results(results)
+    assert 'testpath1.txt' in capsys.readouterr().out
+
+
+# %% Test scaling_benchmark()
+def test_scaling_benchmark():
+    """Test every engine agrees on path length for each generated map."""
+    results = scaling_benchmark((10, 20))
+    assert len(results) == 2 * len(MAP_STYLES) * len(BENCHMARKS)
+    for size in (10, 20):
+        for style in MAP_STYLES:
+            rows = results[(results['size'] == size) &
+                           (results['style'] == style)]
+            check_lengths(rows)
+            assert rows['length'][0] < np.inf
+    assert np.all(results['peak_bytes'] > 0)
+    assert np.all(results['seconds'] > 0)
+
+
+def test_scaling_max_cells():
+    """Test engines are skipped on maps larger than their limit."""
+    results = scaling_benchmark((510,), ('open',), ('dijkstra', 'bfs'),
+                                memory=False)
+    assert results['engine'].tolist() == ['bfs']
+    assert results['peak_bytes'].tolist() == [-1]
+
+
+def test_save_load(tmp_path):
+    """Test saved results load back unchanged and regressions are found."""
+    results = scaling_benchmark((10,), engines=('astar', 'bfs'))
+    save_results(results, tmp_path / 'results.csv')
+    loaded = load_results(tmp_path / 'results.csv')
+    assert loaded.dtype == results.dtype
+    for name in ('size', 'style', 'engine', 'length', 'expansions',
+                 'peak_bytes'):
+        assert np.array_equal(loaded[name], results[name])
+    assert np.allclose(loaded['seconds'], results['seconds'], rtol=1e-5)
+    assert len(find_regressions(loaded, results)) == 0
+    slower = results.copy()
+    slower['seconds'][0] *= 2
+    slower['length'][-1] += 1
+    assert np.array_equal(find_regressions(results, slower),
+                          slower[[0, -1]])
+    assert len(find_regressions(results[:0], slower)) == 0
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('size', [x for x in SIZE_TIERS if 100 < x < 1000])
+def test_scaling_graph_engines(size):
+    """Test the graph-based engines on the middle size tiers."""
+    engines = ('dijkstra', 'bidirectional', 'alt', 'astar')
+    results = scaling_benchmark((size,), engines=engines, memory=False)
+    assert len(results) == len(MAP_STYLES) * len(engines)
+    for style in MAP_STYLES:
+        rows = results[results['style'] == style]
+        check_lengths(rows)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('size', [x for x in SIZE_TIERS if x >= 1000])
+def test_scaling_large(size):
+    """Test the largest size tiers, running each engine within its limit."""
+    results = scaling_benchmark((size,))
+    engines = [x for x in BENCHMARKS if size * size <= MAX_CELLS[x]]
+    assert len(results) == len(MAP_STYLES) * len(engines)
+    for style in MAP_STYLES:
+        rows = results[results['style'] == style]
+        check_lengths(rows)
+
+
+# %% Test memory_benchmark()
+def test_memory_benchmark():
+    """Test bytes per vertex and edge of the graphs of open maps."""
+    results = memory_benchmark((10, 20), diagonal=True)
+    assert list(results['size']) == [10, 10, 20, 20]
+    assert list(results['graph']) == ['Graph', 'FrozenGraph'] * 2
+    assert list(results['vertices']) == [100, 100, 400, 400]
+    assert list(results['edges']) == [2 * 90 + 2 * 81] * 2 + \
+        [2 * 380 + 2 * 361] * 2
+    graph, frozen = results[::2], results[1::2]
+    assert np.all(graph['vertex_bytes'] > frozen['vertex_bytes'])
+    assert np.all(graph['edge_bytes'] > frozen['edge_bytes'])
+    # One object pointer and one indptr entry per vertex
+    assert np.allclose(frozen['vertex_bytes'], 16, atol=0.1)
@@ -0,0 +1,144 @@
+"""Test connected components used to solve robot path programming test.
+
+###############################################################################
+# test_components.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the component labels of a map, their on-disk cache,
+#               and the reachability pre-check of solve_map.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+import interview.robot.robot_path as rp
+from interview.robot.components import label_components, build_components
+from interview.robot.components import load_components, cached_components
+from interview.robot.components import component_filename, NO_COMPONENT
+from interview.robot.grid_search import distance_transform
+from interview.robot.instrumentation import instrument
+from interview.robot.map_io import OBSTACLE
+
+
+# %% Helper functions
+def read_grid_text(text):
+    """Return the grid of a map given as a string, as read by read_grid."""
+    rows = text.split('\n')
+    return np.array([[ord(x) for x in row] for row in rows], dtype=np.uint8)
+
+
+# %% Test label_components()
+def test_label_components():
+    """Test the labels of a small grid with three components."""
+    passable = np.array([[1, 1, 0, 1],
+                         [0, 1, 0, 1],
+                         [1, 0, 1, 1]], dtype=bool)
+    labels, count = label_components(passable)
+    assert count == 3
+    assert labels.dtype == np.int32
+    assert labels.tolist() == [[1, 1, 0, 2],
+                               [0, 1, 0, 2],
+                               [3, 0, 2, 2]]
+    labels, count = label_components(np.zeros((2, 3), dtype=bool))
+    assert count == 0
+    assert np.all(labels == NO_COMPONENT)
+
+
+def test_label_components_rng():
+    """Test labels against breadth-first search on random grids."""
+    rng = np.random.default_rng(20)             # Seeded random generator
+    for _ in range(100):
+        nrows, ncols = rng.integers(1, 40, size=2)
+        passable = rng.random((nrows, ncols)) > rng.random()
+        labels, count = label_components(passable)
+        assert np.array_equal(labels == NO_COMPONENT, ~passable)
+        assert set(np.unique(labels[passable])) == set(range(1, count + 1))
+        for cell in np.argwhere(passable)[:5]:
+            dist, _ = distance_transform(passable, tuple(cell))
+            assert np.array_equal(labels == labels[tuple(cell)], dist >= 0)
+
+
+# %% Test ComponentIndex
+def test_component_index():
+    """Test reachability queries and restricting a grid to a component."""
+    grid = read_grid_text('R.#.\n..#G\n###.')
+    index = build_components(grid)
+    assert index.count == 2
+    assert index.reachable((0, 0), (1, 1))
+    assert not index.reachable((0, 0), (1, 3))
+    assert not index.reachable((0, 2), (0, 2))  # Obstacle
+    assert index.label((2, 3)) == index.label((0, 3)) == 2
+    restricted = index.restrict(grid, (0, 0))
+    assert np.all(restricted[:, 3] == OBSTACLE)
+    assert np.array_equal(restricted[:2, :2], grid[:2, :2])
+    # A legend may make other characters impassable
+    assert build_components(grid, {'.': np.inf}).count == 2
+    index = build_components(read_grid_text('R~G'), {'~': np.inf})
+    assert not index.reachable((0, 0), (0, 2))
+
+
+def test_cached_components(tmp_path):
+    """Test the cache is reused, and rebuilt when the open cells change."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#.\n..#G')
+    cache_fn = component_filename(filename)
+    assert cache_fn == tmp_path / 'map_COMPONENTS.npz'
+    index = cached_components(filename)
+    assert cache_fn.exists()
+    mtime = cache_fn.stat().st_mtime_ns
+    loaded = load_components(cache_fn)
+    assert np.array_equal(loaded.labels, index.labels)
+    assert (loaded.count, loaded.digest) == (index.count, index.digest)
+    assert cached_components(filename).digest == index.digest
+    assert cache_fn.stat().st_mtime_ns == mtime     # Loaded, not rebuilt
+    blocked = cached_components(filename, legend={'.': np.inf})
+    assert blocked.digest != index.digest
+    assert not blocked.reachable((0, 0), (0, 1))
+    filename.write_text('R...\n..#G')
+    assert cached_components(filename).count == 1
+
+
+# %% Test solve_map() pre-check
+def test_solve_map_precheck(tmp_path):
+    """Test unreachable goals are found without running the search."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#.\n..#G\n..#.')
+    with instrument(vars(rp)) as report:
+        out_fn, length = rp.solve_map(filename, precheck=True)
+    assert length == np.inf
+    assert out_fn.read_text() == 'R.#.\n..#G\n..#.'
+    assert report.stages['cached_components']['calls'] == 1
+    assert 'grid_to_graph' not in report.stages
+    component_filename(filename).unlink()
+    with instrument(vars(rp)) as report:
+        assert rp.solve_map(filename)[1] == np.inf     # Off by default
+    assert report.stages['shortest_path_length']['calls'] == 1
+    assert 'cached_components' not in report.stages
+    assert not component_filename(filename).exists()
+
+
+def test_solve_map_restricted(tmp_path, monkeypatch):
+    """Test the graph holds only the robot's component."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..#...\n..G#...\n...#...')
+    grid_to_graph = rp.grid_to_graph
+    sizes = []                          # Vertices of each graph built
+
+    def recorded(*args, **kwargs):
+        graph, *rest = grid_to_graph(*args, **kwargs)
+        sizes.append(graph.vertex_count())
+        return (graph, *rest)
+
+    monkeypatch.setattr(rp, 'grid_to_graph', recorded)
+    assert rp.solve_map(filename, precheck=True)[1] == 3
+    assert rp.solve_map(filename)[1] == 3
+    assert sizes == [9, 18]
@@ -21,7 +21,7 @@ import pytest
 import numpy as np
 
 # Local application/library specific imports
-from interview.robot.graph_data_structures import Graph
+from interview.robot.graph_data_structures import Graph, load_graph
 from interview.robot.array_data_structures import Map
 
 
@@ -120,7 +120,8 @@ def test_graph_accessor_methods(g):
     verts = g.verts                             # List of vertices in graph
     assert graph.vertex_count() == n            # Test vertex_count()
     assert graph.edge_count() == m              # Test edge_count()
-    assert len(graph.edges()) == m              # Test set returned by edges()
+    assert len(list(graph.edges())) == m        # Test edges() iteration
+    assert set(graph.edges()) == set(edges)     # Each edge yielded once
     u, v = edges[0].endpoints()
     assert graph.get_edge(u, v) == edges[0]     # Test get_edge()
     in_deg_sum = 0
@@ -154,6 +155,7 @@ def test_graph_remove_vertex(g):
     graph = g.graph                             # Directed or undirected graph
     for vertex in list(graph.vertices()):
         graph.remove_vertex(vertex)
+        assert graph.edge_count() == len(list(graph.edges()))
     assert graph.vertex_count() == 0
     assert graph.edge_count() == 0
 
@@ -162,12 +164,160 @@ def test_graph_remove_edge(g):
     """Test remove_edge() method of the Graph class."""
     graph = g.graph                             # Directed or undirected graph
     n = g.n                                     # Number of vertices n
-    for edge in graph.edges():
+    for count, edge in enumerate(list(graph.edges()), 1):
         graph.remove_edge(edge)
+        assert graph.edge_count() == g.m - count
     assert graph.vertex_count() == n
     assert graph.edge_count() == 0
-    assert graph.edges() == set()
+    assert list(graph.edges()) == []
     for vertex in graph.vertices():
         assert graph.degree(vertex) == graph.degree(vertex, out=False) == 0
         assert len(list(graph.incident_edges(vertex))) == \
             len(list(graph.incident_edges(vertex, out=False))) == 0
+
+
+def test_graph_bulk_insert(g):
+    """Test insert_vertices() and insert_edges() of the Graph class."""
+    graph = Graph(g.graph.is_directed())
+    verts = graph.insert_vertices(range(g.n))
+    assert [vertex.element() for vertex in verts] == list(range(g.n))
+    index = {vertex: idx for idx, vertex in enumerate(g.verts)}
+    origins = np.array([index[edge._origin] for edge in g.edges])
+    destinations = np.array([index[edge._destination] for edge in g.edges])
+    half = g.m // 2                     # Indices, then vertices
+    edges = graph.insert_edges(zip(origins[:half], destinations[:half],
+                                   range(half)), verts)
+    edges += graph.insert_edges((verts[u], verts[v], x) for u, v, x in
+                                zip(origins[half:], destinations[half:],
+                                    range(half, g.m)))
+    assert graph.vertex_count() == g.n
+    assert graph.edge_count() == g.m
+    for edge, u, v in zip(edges, origins, destinations):
+        assert edge.endpoints() == (verts[u], verts[v])
+        assert graph.get_edge(verts[u], verts[v]) is edge
+        if not graph.is_directed():
+            assert graph.get_edge(verts[v], verts[u]) is edge
+    for vertex, old_vertex in zip(verts, g.verts):
+        for out in (True, False):
+            assert (graph.degree(vertex, out) ==
+                    g.graph.degree(old_vertex, out))
+    loop = graph.insert_edges([(0, 0, 'loop')], verts)[0]
+    assert graph.get_edge(verts[0], verts[0]) is loop
+    assert graph.degree(verts[0]) == g.graph.degree(g.verts[0]) + 1
+    assert graph.edge_count() == len(list(graph.edges())) == g.m + 1
+    graph.insert_edge(verts[0], verts[1], 'new')    # Maps still usable
+    assert graph.get_edge(verts[0], verts[1]).element() == 'new'
+
+
+def test_edge_count_self_loops():
+    """Test edge counts of replaced edges and self-loops."""
+    for directed in (True, False):
+        graph = Graph(directed)
+        vert_a = graph.insert_vertex('a')
+        vert_b = graph.insert_vertex('b')
+        graph.insert_edge(vert_a, vert_b, 1)
+        graph.insert_edge(vert_a, vert_b, 2)    # Replaces edge
+        assert graph.edge_count() == 1
+        graph.insert_edge(vert_b, vert_b, 3)
+        assert graph.edge_count() == len(list(graph.edges())) == 2
+        graph.remove_vertex(vert_b)
+        assert graph.edge_count() == len(list(graph.edges())) == 0
+
+
+# %% Test FrozenGraph class
+def test_freeze(g):
+    """Test the frozen graph keeps every vertex, edge, and element."""
+    graph = g.graph                             # Directed or undirected graph
+    frozen = graph.freeze()
+    ids = Map()                                 # Map vertices to frozen IDs
+    for idx, vertex in enumerate(graph.vertices()):
+        ids[vertex] = idx
+    assert frozen.is_directed() == graph.is_directed()
+    assert frozen.vertex_count() == g.n
+    assert frozen.edge_count() == g.m
+    assert list(frozen.vertices()) == list(range(g.n))
+    assert sorted(edge.element() for edge in frozen.edges()) == \
+        list(range(g.m))
+    for vertex in g.verts:
+        v = ids[vertex]
+        assert frozen.vertex_element(v) == vertex.element()
+        for out in (True, False):
+            assert frozen.degree(v, out) == graph.degree(vertex, out)
+            expected = sorted((ids[edge.opposite(vertex)], edge.element())
+                              for edge in graph.incident_edges(vertex, out))
+            actual = sorted((edge.opposite(v), edge.element())
+                            for edge in frozen.incident_edges(v, out))
+            assert actual == expected
+    for edge in g.edges:
+        origin, destination = edge.endpoints()
+        u, v = ids[origin], ids[destination]
+        frozen_edge = frozen.get_edge(u, v)
+        assert frozen_edge.endpoints() == (u, v)
+        assert frozen_edge.element() == edge.element()
+        assert isinstance(frozen_edge.element(), int)
+        assert frozen_edge == frozen.get_edge(u, v)
+        assert (frozen.get_edge(v, u) is None) == \
+            (graph.get_edge(destination, origin) is None)
+        with pytest.raises(ValueError):
+            frozen_edge.opposite(g.n)
+
+
+def test_freeze_elements():
+    """Test self-loops and edge elements that are not numbers."""
+    graph = Graph()
+    vert_a = graph.insert_vertex('a')
+    vert_b = graph.insert_vertex('b')
+    graph.insert_edge(vert_a, vert_b, 'x')
+    graph.insert_edge(vert_a, vert_a, None)
+    frozen = graph.freeze()
+    a = [v for v in frozen.vertices() if frozen.vertex_element(v) == 'a'][0]
+    b = 1 - a
+    assert frozen.degree(a) == 2
+    assert frozen.degree(b) == 1
+    assert frozen.get_edge(b, a).element() == 'x'
+    assert frozen.get_edge(a, a).element() is None
+    assert frozen.get_edge(b, b) is None
+    assert len(set(frozen.incident_edges(a))) == 2
+
+
+# %% Test saving and loading graphs
+def test_save_load(g, tmp_path):
+    """Test a saved graph is loaded with the same vertices and edges."""
+    filename = tmp_path / 'graph.bin'
+    g.graph.save(filename)
+    frozen = g.graph.freeze()
+    loaded = load_graph(filename)
+    assert isinstance(loaded.indices, np.memmap)    # Mapped, not read in
+    assert loaded.is_directed() == g.graph.is_directed()
+    assert loaded.vertex_count() == g.n
+    assert loaded.edge_count() == g.m
+    for v in frozen.vertices():
+        assert loaded.vertex_element(v) == frozen.vertex_element(v)
+        for out in (True, False):
+            assert ([(edge.endpoints(), edge.element())
+                     for edge in loaded.incident_edges(v, out)] ==
+                    [(edge.endpoints(), edge.element())
+                     for edge in frozen.incident_edges(v, out)])
+    u, v = next(frozen.edges()).endpoints()
+    assert loaded.get_edge(u, v).element() == frozen.get_edge(u, v).element()
+
+
+def test_save_load_errors(tmp_path):
+    """Test graphs that cannot be saved and files that are not graphs."""
+    graph = Graph()
+    vert_a = graph.insert_vertex('a')
+    vert_b = graph.insert_vertex('b')
+    graph.insert_edge(vert_a, vert_b, 2.5)
+    filename = tmp_path / 'graph.bin'
+    graph.save(filename)
+    loaded = load_graph(filename)
+    assert sorted(loaded.vertex_element(v) for v in loaded.vertices()) == \
+        ['a', 'b']
+    assert loaded.get_edge(1, 0).element() == 2.5
+    graph.insert_vertex(3)              # Mix of strings and numbers
+    with pytest.raises(ValueError):
+        graph.save(filename)
+    filename.write_bytes(b'Not a graph' * 100)
+    with pytest.raises(ValueError):
+        load_graph(filename)
+
@@ -0,0 +1,183 @@
+"""Test grid search engines used to solve robot path programming test.
+
+###############################################################################
+# test_grid_search.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the search engines that operate directly on the
+#               ASCII map grid.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar, jump_point_search
+from interview.robot.grid_search import breadth_first_search
+from interview.robot.grid_search import distance_transform
+from interview.robot.grid_search import NO_PARENT, FROM_ABOVE, FROM_LEFT
+
+
+# %% Helper functions
+def make_grid(rows):
+    """Return passability grid, robot, and goal coordinates of ASCII rows."""
+    grid = np.array([list(row) for row in rows])
+    robot = tuple(int(x) for x in np.argwhere(grid == 'R')[0])
+    goal = tuple(int(x) for x in np.argwhere(grid == 'G')[0])
+    return grid != '#', robot, goal
+
+
+# %% Test A* search
+def test_astar_open_grid():
+    """Test A* on an open grid where the shortest path is a straight line."""
+    passable, robot, goal = make_grid(['.....',
+                                       '.R.G.',
+                                       '.....'])
+    length, coords = astar(passable, robot, goal)
+    assert length == 2
+    assert coords == [(1, 2)]
+
+
+def test_astar_detour():
+    """Test A* finds the detour around an obstacle."""
+    passable, robot, goal = make_grid(['R#G',
+                                       '.#.',
+                                       '...'])
+    length, coords = astar(passable, robot, goal)
+    assert length == 6
+    assert coords == [(1, 2), (2, 2), (2, 1), (2, 0), (1, 0)]
+
+
+def test_astar_adjacent():
+    """Test A* when the goal is adjacent to the robot."""
+    passable, robot, goal = make_grid(['RG'])
+    assert astar(passable, robot, goal) == (1, [])
+
+
+def test_astar_unreachable():
+    """Test A* returns an infinite length when the goal is unreachable."""
+    passable, robot, goal = make_grid(['R.#G',
+                                       '..#.'])
+    assert astar(passable, robot, goal) == (np.inf, [])
+
+
+def test_astar_terrain():
+    """Test A* with traversal costs and diagonal moves."""
+    passable, robot, goal = make_grid(['R..',
+                                       '.#.',
+                                       '..G'])
+    costs = np.where(passable, 1.0, np.inf)
+    costs[0, 1] = 4.0                           # Slow cell on the top route
+    length, coords = astar(passable, robot, goal, costs=costs)
+    assert length == 4
+    assert coords == [(2, 1), (2, 0), (1, 0)]
+    # Diagonal moves may not cut the corner of the obstacle
+    length, coords = astar(passable, robot, goal, diagonal=True)
+    assert length == 4
+    passable[1, 1] = True
+    length, coords = astar(passable, robot, goal, diagonal=True)
+    assert length == pytest.approx(2 * np.sqrt(2))
+    assert coords == [(1, 1)]
+
+
+# %% Test Jump Point Search
+def test_jps_corridor():
+    """Test JPS expands few points along an open corridor."""
+    passable, robot, goal = make_grid(['#' * 42,
+                                       '#R' + '.' * 38 + 'G#',
+                                       '#' * 42])
+    stats = {}
+    length, coords = jump_point_search(passable, robot, goal, stats)
+    assert length == 39
+    assert coords == [(1, col) for col in range(39, 1, -1)]
+    assert stats['expansions'] <= 2
+
+
+def test_jps_unreachable():
+    """Test JPS returns an infinite length when the goal is unreachable."""
+    passable, robot, goal = make_grid(['R.#G',
+                                       '..#.'])
+    assert jump_point_search(passable, robot, goal) == (np.inf, [])
+
+
+def test_jps_rng():
+    """Test JPS against A* on randomly generated grids.
+
+    The path lengths must match, and the expanded path must be a sequence of
+    adjacent open cells leading from the goal back to the robot.
+    """
+    rng = np.random.default_rng(71)             # Seeded random generator
+    for _ in range(300):
+        nrows, ncols = rng.integers(2, 15, size=2)
+        passable = rng.random((nrows, ncols)) > rng.random() * 0.5
+        cells = np.argwhere(np.ones_like(passable))
+        robot, goal = (tuple(int(x) for x in cells[idx]) for idx in
+                       rng.choice(len(cells), size=2, replace=False))
+        passable[robot] = passable[goal] = True
+        stats = {}
+        length, coords = jump_point_search(passable, robot, goal, stats)
+        assert length == astar(passable, robot, goal)[0]
+        if length == np.inf:
+            continue
+        path = [goal] + coords + [robot]
+        assert len(path) == length + 1
+        assert all(passable[cell] for cell in path)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+# %% Test breadth-first search
+def test_distance_transform():
+    """Test the distance field and parent directions of a small grid."""
+    passable, robot, _ = make_grid(['R.#',
+                                    '..#',
+                                    '#.G'])
+    dist, parents = distance_transform(passable, robot)
+    assert dist.dtype == np.int32
+    assert parents.dtype == np.uint8
+    assert dist.tolist() == [[0, 1, -1],
+                             [1, 2, -1],
+                             [-1, 3, 4]]
+    assert parents[0, 0] == NO_PARENT           # Start cell
+    assert parents[0, 2] == NO_PARENT           # Obstacle
+    assert parents[1, 0] == FROM_ABOVE
+    assert parents[2, 2] == FROM_LEFT
+
+
+def test_distance_transform_goal():
+    """Test the search stops once the goal is reached."""
+    passable = np.ones((1, 10), dtype=bool)
+    dist, _ = distance_transform(passable, (0, 0), (0, 3))
+    assert dist[0, 3] == 3
+    assert dist[0, 5] == -1                     # Beyond the goal
+
+
+def test_bfs_rng():
+    """Test breadth-first search against A* on randomly generated grids."""
+    rng = np.random.default_rng(13)             # Seeded random generator
+    for _ in range(300):
+        nrows, ncols = rng.integers(2, 15, size=2)
+        passable = rng.random((nrows, ncols)) > rng.random() * 0.5
+        cells = np.argwhere(np.ones_like(passable))
+        robot, goal = (tuple(int(x) for x in cells[idx]) for idx in
+                       rng.choice(len(cells), size=2, replace=False))
+        passable[robot] = passable[goal] = True
+        length, coords = breadth_first_search(passable, robot, goal)
+        assert length == astar(passable, robot, goal)[0]
+        if length == np.inf:
+            assert coords == []
+            continue
+        path = [goal] + coords + [robot]
+        assert len(path) == length + 1
+        assert all(passable[cell] for cell in path)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
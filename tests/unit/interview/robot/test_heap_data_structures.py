@@ -187,3 +187,33 @@ def test_adp_rng():
         unsorted_list.append(q.dequeue()[1])    # Insert values into list
     sorted_list = sorted(unsorted_list)         # Use Python's sort function
     assert sorted_list == unsorted_list         # Ensure heap sorted elements
+
+
+def test_apq_remove():
+    """Test removing arbitrary nodes from the AdaptablePriorityQueue class."""
+    rng = np.random.default_rng(311)            # Seeded random generator
+    n = 100
+    rints = rng.integers(low=0, high=1000, size=n)
+    q = AdaptablePriorityQueue()
+    with pytest.raises(ValueError):
+        q.min()                                 # Should raise error if empty
+    node_list = [q.enqueue(x, idx) for idx, x in enumerate(rints)]
+    assert q.min() == (min(rints), q.first())   # Test min()
+    assert len(q) == n                          # min() does not remove item
+    removed = rng.choice(n, size=n//2, replace=False)
+    for idx in removed:
+        assert q.remove(node_list[idx]) == (rints[idx], idx)
+    assert len(q) == n - n//2
+    with pytest.raises(ValueError):
+        q.remove(node_list[removed[0]])         # Node already removed
+    remaining = sorted(rints[np.setdiff1d(np.arange(n), removed)])
+    unsorted_list = []
+    while not q.is_empty():
+        unsorted_list.append(q.dequeue()[0])
+    assert unsorted_list == remaining           # Heap order is maintained
+    for idx, x in enumerate(rints):
+        q.enqueue(x, idx)
+    capacity = q._N
+    while not q.is_empty():
+        q.remove(q.last_node())                 # Never bubbles
+    assert q._N < capacity                      # Array halved on removal
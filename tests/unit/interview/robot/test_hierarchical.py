@@ -0,0 +1,138 @@
+"""Test hierarchical pathfinding used to solve robot path programming test.
+
+###############################################################################
+# test_hierarchical.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the HPA* abstract graph, its on-disk cache, and the
+#               paths it finds.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar
+from interview.robot.hierarchical import build_hierarchy, load_hierarchy
+from interview.robot.hierarchical import cached_hierarchy, hierarchy_filename
+from interview.robot.hierarchical import hpa_search, hpa_solution
+
+
+# %% Helper functions
+def assert_valid_path(passable, robot, goal, length, coords):
+    """Assert coords are adjacent open cells leading from goal to robot."""
+    path = [goal] + coords + [robot]
+    assert len(path) == length + 1
+    assert all(passable[cell] for cell in path)
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+# %% Test build_hierarchy()
+def test_build_hierarchy():
+    """Test the abstract graph of an open grid with two clusters."""
+    passable = np.ones((4, 8), dtype=bool)
+    hierarchy = build_hierarchy(passable, 4)
+    # One entrance of width 4 gets a single transition in its middle
+    assert hierarchy.node_count() == 2
+    assert hierarchy.edge_count() == 1
+    assert hierarchy.nodes.tolist() == [1 * 8 + 3, 1 * 8 + 4]
+    assert hierarchy.weights.tolist() == [1, 1]
+    # A wide entrance gets a transition at each end
+    passable = np.ones((8, 16), dtype=bool)
+    hierarchy = build_hierarchy(passable, 8)
+    assert hierarchy.node_count() == 4
+    assert hierarchy.edge_count() == 2 + 2      # Inter- and intra-cluster
+    assert sorted(hierarchy.weights.tolist()) == [1, 1, 1, 1, 7, 7, 7, 7]
+
+
+# %% Test hpa_search()
+def test_hpa_search_same_cluster():
+    """Test a query whose robot and goal share a cluster."""
+    passable = np.ones((8, 8), dtype=bool)
+    hierarchy = build_hierarchy(passable, 8)
+    length, coords = hpa_search(hierarchy, passable, (0, 0), (0, 3))
+    assert length == 3
+    assert coords == [(0, 2), (0, 1)]
+
+
+def test_hpa_search_unreachable():
+    """Test hpa_search returns an infinite length when unreachable."""
+    passable = np.ones((6, 12), dtype=bool)
+    passable[:, 5] = False
+    hierarchy = build_hierarchy(passable, 4)
+    assert hpa_search(hierarchy, passable, (0, 0), (5, 11)) == (np.inf, [])
+
+
+def test_hpa_search_rng():
+    """Test hpa_search against A* on randomly generated grids.
+
+    HPA* is near-optimal, so its path may be longer than the shortest path,
+    but it must be a valid path and find the goal whenever A* does.
+    """
+    rng = np.random.default_rng(11)             # Seeded random generator
+    for _ in range(200):
+        nrows, ncols = rng.integers(2, 30, size=2)
+        passable = rng.random((nrows, ncols)) > rng.random() * 0.45
+        cells = np.argwhere(np.ones_like(passable))
+        robot, goal = (tuple(int(x) for x in cells[idx]) for idx in
+                       rng.choice(len(cells), size=2, replace=False))
+        passable[robot] = passable[goal] = True
+        hierarchy = build_hierarchy(passable, int(rng.integers(2, 10)))
+        length, coords = hpa_search(hierarchy, passable, robot, goal)
+        shortest = astar(passable, robot, goal)[0]
+        assert (length == np.inf) == (shortest == np.inf)
+        if length == np.inf:
+            continue
+        assert length >= shortest
+        assert_valid_path(passable, robot, goal, length, coords)
+
+
+# %% Test Hierarchy cache
+def test_save_load(tmp_path):
+    """Test that a saved Hierarchy loads back unchanged."""
+    passable = np.random.default_rng(3).random((20, 30)) > 0.3
+    hierarchy = build_hierarchy(passable, 5, 'abc')
+    hierarchy.save(tmp_path / 'h.npz')
+    loaded = load_hierarchy(tmp_path / 'h.npz')
+    assert loaded.shape == (20, 30)
+    assert loaded.cluster_size == 5
+    assert loaded.digest == 'abc'
+    for name in ('nodes', 'indptr', 'indices', 'weights'):
+        assert np.array_equal(getattr(loaded, name), getattr(hierarchy, name))
+
+
+def test_cached_hierarchy(tmp_path):
+    """Test the cache is reused, and rebuilt when the map or options change."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.......\n........\n.......G')
+    cache_fn = hierarchy_filename(filename)
+    assert cache_fn == tmp_path / 'map_HIERARCHY.npz'
+    hierarchy = cached_hierarchy(filename, 4)
+    assert cache_fn.exists()
+    mtime = cache_fn.stat().st_mtime_ns
+    assert cached_hierarchy(filename, 4).digest == hierarchy.digest
+    assert cache_fn.stat().st_mtime_ns == mtime     # Loaded, not rebuilt
+    assert cached_hierarchy(filename, 2).cluster_size == 2
+    assert load_hierarchy(cache_fn).cluster_size == 2
+    filename.write_text('R...#...\n....#...\n.......G')
+    assert cached_hierarchy(filename, 2).digest != hierarchy.digest
+
+
+def test_hpa_solution(tmp_path):
+    """Test solving a map file writes the solution beside it."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#.....\n..#.....\n.......G')
+    out_fn, length = hpa_solution(filename, 4)
+    assert out_fn == tmp_path / 'map_SOLUTION.txt'
+    assert length >= 9                          # Shortest path length
+    rows = out_fn.read_text().splitlines()
+    assert sum(row.count('O') for row in rows) == length - 1
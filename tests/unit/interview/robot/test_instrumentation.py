@@ -0,0 +1,143 @@
+"""Test instrumentation of robot path programming test solution.
+
+###############################################################################
+# test_instrumentation.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the per-stage timing and operation counts recorded
+#               while solving a map, and their export as JSON.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+import json
+import threading
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+import interview.robot.robot_path as rp
+from interview.robot.array_data_structures import Map
+from interview.robot.graph_data_structures import Graph
+from interview.robot.heap_data_structures import AdaptablePriorityQueue
+from interview.robot.instrumentation import instrument, PipelineReport
+from interview.robot.instrumentation import STAGES
+
+
+# %% Test instrument()
+def test_instrument_restores():
+    """Test the original functions are restored when the last user exits."""
+    functions = {name: getattr(rp, name) for name in STAGES
+                 if hasattr(rp, name)}
+    namespace = vars(rp)
+    try:
+        with instrument(namespace) as report:
+            wrapper = rp.grid_edges
+            assert wrapper is not functions['grid_edges']
+            with instrument(namespace):
+                assert rp.grid_edges is wrapper     # Wrapped only once
+            assert rp.grid_edges is wrapper
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    for name, function in functions.items():
+        assert getattr(rp, name) is function
+    assert report.seconds > 0
+
+
+def test_instrument_counts():
+    """Test counts of a search run directly inside the context."""
+    m = Map()
+    queue = AdaptablePriorityQueue()
+    with instrument({}) as report:
+        m['a'] = 1
+        assert m['a'] == 1
+        assert m.get('b') is None
+        node = queue.enqueue(2, 'x')
+        queue.update(node, 1, 'x')
+        queue.dequeue()
+    assert report.counters == {'enqueue': 1, 'dequeue': 1, 'update': 1,
+                               'map_lookups': 2, 'edges_relaxed': 0}
+    assert report.stages == {}          # No stage was called
+
+
+def test_instrument_frozen_graph():
+    """Test edges of a FrozenGraph are counted like those of a Graph."""
+    g = Graph()
+    u, v = g.insert_vertex('a'), g.insert_vertex('b')
+    g.insert_edge(u, v, 1)
+    frozen = g.freeze()
+    with instrument({}) as report:
+        assert next(g.incident_edges(u)).element() == 1
+        assert next(frozen.incident_edges(0)).element() == 1
+    assert report.counters['edges_relaxed'] == 2
+
+
+def test_instrument_other_threads(tmp_path):
+    """Test searches running in other threads are not recorded."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..\n..G')
+    g, robot, goal, _ = rp.map_to_graph(filename)
+    namespace = vars(rp)
+    started, finished = threading.Event(), threading.Event()
+
+    def uninstrumented():
+        started.wait()
+        rp.shortest_path_length(g, robot, goal)
+        finished.set()
+
+    thread = threading.Thread(target=uninstrumented)
+    thread.start()
+    with instrument(namespace) as report:
+        started.set()
+        finished.wait()
+    thread.join()
+    assert report.stages == {}
+    assert report.counters == dict.fromkeys(report.counters, 0)
+
+
+# %% Test robot_solution()
+def test_robot_solution_report(tmp_path):
+    """Test the report returned by robot_solution and its JSON export."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..#\n.#..\n...G')
+    out_fn, report = rp.robot_solution(filename, instrument=True)
+    assert out_fn == tmp_path / 'map_SOLUTION.txt'
+    assert isinstance(report, PipelineReport)
+    stages = report.stages
+    for name in ('read_grid', 'grid_to_graph', 'grid_edges',
+                 'shortest_path_length', 'calculate_shortest_path_coords',
+                 'write_map'):
+        assert stages[name]['calls'] == 1
+    assert 'astar' not in stages        # Not run by the Dijkstra engine
+    assert (stages['grid_to_graph']['seconds'] >=
+            stages['grid_edges']['seconds'])    # Times are inclusive
+    counters = report.counters
+    assert 0 < counters['dequeue'] <= counters['enqueue'] <= 10
+    assert counters['edges_relaxed'] > 0
+    assert counters['map_lookups'] > counters['edges_relaxed']
+    data = json.loads(report.to_json())
+    assert data['summary'] == {'filename': str(filename),
+                               'engine': 'dijkstra', 'length': 5,
+                               'solution': str(out_fn)}
+    assert data['counters'] == counters
+    report.save(tmp_path / 'report.json')
+    assert json.loads((tmp_path / 'report.json').read_text()) == data
+
+
+def test_robot_solution_unreachable(tmp_path):
+    """Test an unreachable goal is exported as a null length."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R#G')
+    _, report = rp.robot_solution(filename, 'astar', instrument=True,
+                                  precheck=True)
+    assert report.summary['length'] == np.inf
+    assert report.stages['cached_components']['calls'] == 1
+    assert 'astar' not in report.stages  # Answered by the pre-check
+    assert json.loads(report.to_json())['summary']['length'] is None
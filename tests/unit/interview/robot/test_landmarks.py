@@ -0,0 +1,135 @@
+"""Test landmark index used to solve robot path programming test.
+
+###############################################################################
+# test_landmarks.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the landmark (ALT) index, its on-disk cache, and the
+#               A* searches that use it.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar
+from interview.robot.landmarks import build_landmarks, load_landmarks
+from interview.robot.landmarks import cached_landmarks, landmark_filename
+from interview.robot.landmarks import alt_search, alt_solution, UNREACHABLE
+
+
+# %% Helper functions
+def make_grid(rows):
+    """Return character grid of ASCII rows, as returned by read_grid."""
+    return np.array([list(row.encode()) for row in rows], dtype=np.uint8)
+
+
+# %% Test build_landmarks()
+def test_build_landmarks():
+    """Test landmark selection and exact distances on a small map."""
+    grid = make_grid(['R..#',
+                      '.#.#',
+                      '...G'])
+    index = build_landmarks(grid, 2)
+    assert index.landmark_count() == 2
+    assert index.distances.shape == (12, 2)
+    # Farthest cell from the top left cell, then the farthest cell from it
+    assert index.landmarks.tolist() == [11, 0]
+    assert index.distances[:, 0].tolist() == [5, 4, 3, -1,
+                                              4, -1, 2, -1,
+                                              3, 2, 1, 0]
+    assert (index.distances[[3, 5, 7]] == UNREACHABLE).all()
+
+
+def test_build_landmarks_regions():
+    """Test every connected region receives a landmark."""
+    grid = make_grid(['R.#..',
+                      '..#.G'])
+    index = build_landmarks(grid, 8)
+    regions = index.distances != UNREACHABLE
+    assert regions[[0, 1, 5, 6]].any(axis=1).all()
+    assert regions[[3, 4, 8, 9]].any(axis=1).all()
+    assert index.landmark_count() == 8
+    assert build_landmarks(make_grid(['RG']), 8).landmark_count() == 2
+
+
+# %% Test alt_search()
+def test_alt_search_unreachable():
+    """Test unreachable goals are detected without a search."""
+    grid = make_grid(['R.#..',
+                      '..#.G'])
+    index = build_landmarks(grid, 2)
+    stats = {}
+    assert alt_search(index, grid != ord('#'), (0, 0), (1, 4), stats) == \
+        (np.inf, [])
+    assert stats['expansions'] == 0
+
+
+def test_alt_search_rng():
+    """Test alt_search against A* on randomly generated grids.
+
+    The path lengths must match, the landmarks must never expand more cells
+    than the Manhattan distance heuristic, and the path must be a sequence of
+    adjacent open cells leading from the goal back to the robot.
+    """
+    rng = np.random.default_rng(12)             # Seeded random generator
+    for _ in range(100):
+        nrows, ncols = rng.integers(2, 15, size=2)
+        passable = rng.random((nrows, ncols)) > rng.random() * 0.5
+        cells = np.argwhere(np.ones_like(passable))
+        robot, goal = (tuple(int(x) for x in cells[idx]) for idx in
+                       rng.choice(len(cells), size=2, replace=False))
+        passable[robot] = passable[goal] = True
+        grid = np.where(passable, ord('.'), ord('#')).astype(np.uint8)
+        grid[robot], grid[goal] = ord('R'), ord('G')
+        index = build_landmarks(grid, int(rng.integers(1, 5)))
+        alt_stats, astar_stats = {}, {}
+        length, coords = alt_search(index, passable, robot, goal, alt_stats)
+        assert length == astar(passable, robot, goal, astar_stats)[0]
+        if length == np.inf:
+            continue
+        assert alt_stats['expansions'] <= astar_stats['expansions']
+        path = [goal] + coords + [robot]
+        assert len(path) == length + 1
+        assert all(passable[cell] for cell in path)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+# %% Test LandmarkIndex cache
+def test_cached_landmarks(tmp_path):
+    """Test the cache is reused, and rebuilt when the map or options change."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R...\n.##.\n...G')
+    cache_fn = landmark_filename(filename)
+    assert cache_fn == tmp_path / 'map_LANDMARKS.npz'
+    index = cached_landmarks(filename, 3)
+    loaded = load_landmarks(cache_fn)
+    assert loaded.shape == (3, 4)
+    assert loaded.digest == index.digest
+    assert np.array_equal(loaded.landmarks, index.landmarks)
+    assert np.array_equal(loaded.distances, index.distances)
+    mtime = cache_fn.stat().st_mtime_ns
+    cached_landmarks(filename, 3)
+    assert cache_fn.stat().st_mtime_ns == mtime     # Loaded, not rebuilt
+    assert cached_landmarks(filename, 2).landmark_count() == 2
+    filename.write_text('R...\n.#..\n...G')
+    assert cached_landmarks(filename, 2).digest != index.digest
+
+
+def test_alt_solution(tmp_path):
+    """Test solving a map file writes the solution beside it."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#.\n..#.\n...G')
+    out_fn, length = alt_solution(filename, 2)
+    assert out_fn == tmp_path / 'map_SOLUTION.txt'
+    assert length == 5
+    assert out_fn.read_text() == 'R.#.\nO.#.\nOOOG'
@@ -0,0 +1,94 @@
+"""Test generator of synthetic maps for the robot path programming test.
+
+###############################################################################
+# test_map_generator.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the seeded generator of open-field, room, and maze
+#               maps.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import breadth_first_search
+from interview.robot.map_generator import generate_map, write_generated_map
+from interview.robot.map_generator import MAP_STYLES
+from interview.robot.map_io import read_grid, find_cells, find_cell
+from interview.robot.map_io import OBSTACLE, ROBOT, GOAL
+
+
+# %% Test generate_map()
+@pytest.mark.parametrize('style', MAP_STYLES)
+def test_generate_map(style):
+    """Test every map holds one robot and one goal it can reach."""
+    rng = np.random.default_rng(19)             # Seeded random generator
+    for _ in range(50):
+        nrows, ncols = (int(x) for x in rng.integers(1, 40, size=2))
+        if nrows * ncols < 2:
+            continue
+        density = float(rng.random())
+        seed = int(rng.integers(99))
+        grid = generate_map(nrows, ncols, style, density, seed)
+        assert grid.shape == (nrows, ncols)
+        assert grid.dtype == np.uint8
+        assert len(find_cells(grid, ROBOT)) == 1
+        assert len(find_cells(grid, GOAL)) == 1
+        robot, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+        assert breadth_first_search(grid != OBSTACLE, robot, goal)[0] > 0
+
+
+@pytest.mark.parametrize('style', MAP_STYLES)
+def test_seed(style):
+    """Test the same seed always generates the same map."""
+    grid = generate_map(30, 50, style, seed=7)
+    assert np.array_equal(grid, generate_map(30, 50, style, seed=7))
+    assert not np.array_equal(grid, generate_map(30, 50, style, seed=8))
+
+
+def test_density():
+    """Test the obstacle fraction of open-field and maze maps."""
+    grid = generate_map(200, 200, 'open', 0.25, seed=1)
+    assert np.mean(grid == OBSTACLE) == pytest.approx(0.25, abs=0.01)
+    grid = generate_map(201, 201, 'maze', 0.3, seed=1)
+    assert np.mean(grid == OBSTACLE) == pytest.approx(0.3, abs=0.01)
+    # A perfect maze has about half its cells as walls
+    grid = generate_map(201, 201, 'maze', 1.0, seed=1)
+    assert np.mean(grid == OBSTACLE) == pytest.approx(0.5, abs=0.01)
+    assert np.all(generate_map(5, 5, 'open', 0.0, seed=1)[1:-1, 1:-1] !=
+                  OBSTACLE)
+
+
+def test_walled_in():
+    """Test a corridor is carved when the robot cannot reach any cell."""
+    grid = generate_map(6, 9, 'open', 1.0, seed=3)
+    robot, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    length = abs(robot[0] - goal[0]) + abs(robot[1] - goal[1])
+    assert breadth_first_search(grid != OBSTACLE, robot, goal)[0] == length
+
+
+def test_generate_map_invalid():
+    """Test unknown styles and maps too small for a robot and goal."""
+    with pytest.raises(ValueError):
+        generate_map(10, 10, 'caves')
+    with pytest.raises(ValueError):
+        generate_map(1, 1)
+
+
+def test_write_generated_map(tmp_path):
+    """Test a generated map written to disk reads back unchanged."""
+    filename = write_generated_map(tmp_path / 'map.txt', 20, 30, 'rooms',
+                                   seed=5)
+    assert filename == tmp_path / 'map.txt'
+    assert np.array_equal(read_grid(filename),
+                          generate_map(20, 30, 'rooms', seed=5))
@@ -0,0 +1,144 @@
+"""Test map input/output layer used to solve robot path programming test.
+
+###############################################################################
+# test_map_io.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the functions that read ASCII maps into grids.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.map_io import read_grid, write_grid, find_cells, find_cell
+from interview.robot.map_io import grid_digest, ROBOT
+from interview.robot.map_io import cache_filename, cached_npz
+from interview.robot.map_io import terrain_costs, move_cost, SQRT2
+
+
+# %% Test read_grid()
+@pytest.mark.parametrize('newline', ['\n', '\r\n'], ids=['LF', 'CRLF'])
+def test_read_grid(tmp_path, newline):
+    """Test reading a map with trailing blank lines and either line ending."""
+    rows = ['#R..', '#..#', '..G#']
+    filename = tmp_path / 'map.txt'
+    filename.write_bytes((newline.join(rows) + newline * 3).encode())
+    grid = read_grid(filename)
+    assert grid.dtype == np.uint8
+    assert grid.shape == (3, 4)
+    assert [row.tobytes().decode() for row in grid] == rows
+
+
+def test_read_grid_invalid(tmp_path):
+    """Test that empty and ragged maps raise ValueError."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('\n\n')
+    with pytest.raises(ValueError):
+        read_grid(filename)
+    filename.write_text('#R..\n#..\n..G#')
+    with pytest.raises(ValueError):
+        read_grid(filename)
+
+
+# %% Test find_cells() and find_cell()
+def test_find_cell(tmp_path):
+    """Test locating characters in the grid."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R..R\n.G..')
+    grid = read_grid(filename)
+    assert find_cells(grid, 'R').tolist() == [[0, 0], [0, 3]]
+    assert find_cell(grid, ROBOT) == (0, 3)     # Last occurrence
+    assert find_cell(grid, 'G') == (1, 1)
+    with pytest.raises(ValueError):
+        find_cell(grid, '#')
+
+
+# %% Test write_grid()
+@pytest.mark.parametrize('newline', ['\n', '\r\n'], ids=['LF', 'CRLF'])
+def test_write_grid(tmp_path, newline):
+    """Test writing a grid with path cells marked and no trailing newline."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R...\n....\n...G\n')
+    grid = read_grid(filename)
+    out_fn = tmp_path / 'out.txt'
+    write_grid(out_fn, grid, [(1, 0), (1, 1)], newline=newline)
+    expected = newline.join(['R...', 'OO..', '...G'])
+    assert out_fn.read_bytes() == expected.encode()
+    write_grid(out_fn, grid, [], newline=newline)       # No path to mark
+    expected = newline.join(['R...', '....', '...G'])
+    assert out_fn.read_bytes() == expected.encode()
+
+
+# %% Test grid_digest()
+def test_grid_digest(tmp_path):
+    """Test the digest depends on the map contents and shape only."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R...\n...G\n')
+    digest = grid_digest(read_grid(filename))
+    filename.write_text('R...\r\n...G')     # Same map, other line endings
+    assert grid_digest(read_grid(filename)) == digest
+    filename.write_text('R.#.\n...G')
+    assert grid_digest(read_grid(filename)) != digest
+    filename.write_text('R...\n\n...G\n')
+    assert grid_digest(read_grid(filename)) == digest
+    filename.write_text('R.\n..\n..\n.G')    # Same bytes, other shape
+    grid = read_grid(filename)
+    assert grid_digest(grid) != grid_digest(grid.reshape(2, 4))
+    assert grid_digest(grid, 4) == grid_digest(grid, 4)
+    assert grid_digest(grid, 4) != grid_digest(grid)
+    assert grid_digest(grid, 4) != grid_digest(grid, 2)
+
+
+# %% Test cached_npz()
+def test_cached_npz(tmp_path):
+    """Test arrays are built once per digest and saved beside the map."""
+    filename = tmp_path / 'map.txt'
+    cache_fn = cache_filename(filename, '_TEST.npz')
+    assert cache_fn == tmp_path / 'map_TEST.npz'
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'values': np.arange(3)}
+
+    arrays = cached_npz(filename, '_TEST.npz', 'abc', build)
+    assert cache_fn.exists()
+    assert str(arrays['digest']) == 'abc'
+    loaded = cached_npz(filename, '_TEST.npz', 'abc', build)
+    assert np.array_equal(loaded['values'], arrays['values'])
+    assert str(loaded['digest']) == 'abc'
+    assert len(builds) == 1             # Loaded, not rebuilt
+    cached_npz(filename, '_TEST.npz', 'def', build)
+    assert len(builds) == 2             # Stale digest, rebuilt
+
+
+# %% Test terrain_costs() and move_cost()
+def test_terrain_costs(tmp_path):
+    """Test the legend is merged with the default legend."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R~#\n.xG')
+    grid = read_grid(filename)
+    costs = terrain_costs(grid, {'~': 2.5})
+    assert costs.tolist() == [[1, 2.5, np.inf], [1, 1, 1]]
+    assert terrain_costs(grid).tolist() == [[1, 1, np.inf], [1, 1, 1]]
+    with pytest.raises(ValueError):
+        terrain_costs(grid, {'~': -1})
+
+
+def test_move_cost():
+    """Test move costs are symmetric and keep integer unit costs."""
+    assert move_cost(1.0, 1.0) == 1
+    assert isinstance(move_cost(1.0, 1.0), int)
+    assert move_cost(1.0, 2.0) == move_cost(2.0, 1.0) == 1.5
+    assert move_cost(1.0, 1.0, diagonal=True) == SQRT2
+    assert move_cost(1.0, np.inf) == np.inf
@@ -0,0 +1,94 @@
+"""Test multi-robot solver used to solve robot path programming test.
+
+###############################################################################
+# test_multi_robot.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the assignment of many robots to their nearest
+#               goals by a single multi-source search.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import distance_transform
+from interview.robot.map_io import ROBOT, GOAL, OBSTACLE
+from interview.robot.multi_robot import assign_robots, multi_robot_solution
+
+
+# %% Test assign_robots()
+def test_multi_robot_solution(tmp_path):
+    """Test each robot is routed to its nearest goal with a distinct mark."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R...#...R\n'
+                        '..G.#....\n'
+                        '....#..G.\n'
+                        'R...#####\n'
+                        '####....R')
+    out_fn, assignments = multi_robot_solution(filename)
+    assert out_fn == tmp_path / 'map_SOLUTION.txt'
+    assert assignments['robot'].tolist() == [[0, 0], [0, 8], [3, 0], [4, 8]]
+    assert assignments['goal'].tolist() == [[1, 2], [2, 7], [1, 2], [-1, -1]]
+    assert assignments['length'].tolist() == [3, 3, 4, np.inf]
+    assert len(set(assignments['mark'])) == 4
+    marks = assignments['mark']
+    rows = out_fn.read_text().splitlines()
+    assert sum(row.count(marks[1]) for row in rows) == 2
+    assert sum(row.count(marks[3]) for row in rows) == 0    # Unreachable
+    assert rows[3].startswith('R')              # Robots never overwritten
+
+
+def test_assign_robots_rng():
+    """Test path lengths against a breadth-first search from every goal.
+
+    The length of each robot's path must equal its distance to the nearest
+    goal, and the path must be a sequence of adjacent open cells.
+    """
+    rng = np.random.default_rng(15)             # Seeded random generator
+    for _ in range(50):
+        nrows, ncols = rng.integers(3, 15, size=2)
+        grid = np.where(rng.random((nrows, ncols)) < 0.25, OBSTACLE,
+                        ord('.')).astype(np.uint8)
+        cells = np.argwhere(np.ones_like(grid))
+        picks = rng.choice(len(cells), size=6, replace=False)
+        for idx in picks[:4]:
+            grid[tuple(cells[idx])] = ROBOT
+        for idx in picks[4:]:
+            grid[tuple(cells[idx])] = GOAL
+        assignments, paths = assign_robots(grid)
+        field = np.min([np.where(dist < 0, np.inf, dist) for dist in
+                        (distance_transform(grid != OBSTACLE, tuple(goal))[0]
+                         for goal in np.argwhere(grid == GOAL))], axis=0)
+        for row, coords in zip(assignments, paths):
+            robot, goal = tuple(row['robot']), tuple(row['goal'])
+            assert row['length'] == field[robot]
+            if row['length'] == np.inf:
+                assert coords == []
+                continue
+            assert grid[goal] == GOAL
+            path = [robot] + coords + [goal]
+            assert len(path) == row['length'] + 1
+            assert all(grid[cell] != OBSTACLE for cell in path)
+            for (r1, c1), (r2, c2) in zip(path, path[1:]):
+                assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+def test_assign_robots_marks():
+    """Test marks skip characters in the map, and running out raises."""
+    grid = np.frombuffer(b'R0G1R', dtype=np.uint8).reshape(1, 5)
+    assignments, _ = assign_robots(grid)
+    assert assignments['mark'].tolist() == ['2', '3']
+    grid = np.full((1, 70), ROBOT, dtype=np.uint8)
+    grid[0, 0] = GOAL
+    with pytest.raises(ValueError):
+        assign_robots(grid)
@@ -0,0 +1,249 @@
+"""Test incremental replanning for the robot path programming test.
+
+###############################################################################
+# test_replanning.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the D* Lite planner against A* searches of the
+#               modified maps.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+from pathlib import Path
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.replanning import DStarLite
+from interview.robot.grid_search import astar
+from interview.robot.map_io import read_grid, find_cell, OBSTACLE, ROBOT, GOAL
+from interview.robot.map_io import terrain_costs, move_cost
+from interview.robot.robot_path import grid_to_graph, dijkstra_path
+
+
+# %% Test DStarLite class
+test_path = Path('./tests/func/interview/robot/test_robot_path/testpaths/')
+
+
+def check_path(passable, robot, goal, length, coords):
+    """Assert that the path is valid and matches the length found by A*."""
+    assert length == astar(passable, robot, goal)[0]
+    if length != np.inf:
+        assert len(coords) == length - 1
+        assert all(passable[coord] for coord in coords)
+
+
+def test_dstar_lite_replan():
+    """Test replanning after obstacles are added and removed.
+
+    Blocking the path near the robot should expand fewer cells than planning
+    on the modified map from scratch.
+    """
+    grid = read_grid(test_path / 'testpath5.txt')
+    passable = grid != OBSTACLE
+    robot, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    planner = DStarLite(*grid_to_graph(grid))
+    length, coords = planner.plan()
+    check_path(passable, robot, goal, length, coords)
+    assert length == 106
+    cell = coords[-5]                           # Path cell near the robot
+    planner.update_cells([(cell, True)])        # Block the path
+    passable[cell] = False
+    length, coords = planner.plan()
+    check_path(passable, robot, goal, length, coords)
+    assert length == 108
+    assert cell not in coords
+    grid[cell] = OBSTACLE
+    fresh_planner = DStarLite(*grid_to_graph(grid))
+    assert fresh_planner.plan()[0] == length
+    assert planner.expansions < fresh_planner.expansions
+    planner.update_cells([(cell, False)])       # Remove the obstacle again
+    length, coords = planner.plan()
+    assert length == 106
+    planner.move_robot(coords[-1])              # Robot moves toward goal
+    assert planner.plan()[0] == 105
+    planner.update_cells([((3, 14), True)])
+    with pytest.raises(ValueError):
+        planner.move_robot((3, 14))             # Cannot move into obstacle
+
+
+def test_dstar_lite_unreachable():
+    """Test that walls cutting off the goal make it unreachable."""
+    grid = read_grid(test_path / 'testpath3.txt')
+    planner = DStarLite(*grid_to_graph(grid))
+    assert planner.plan() == (np.inf, [])
+    planner.update_cells([((14, 0), False)])    # Open a gap in the wall
+    assert planner.plan()[0] == 22 + 2 * 13
+
+
+def test_dstar_lite_rng():
+    """Test a moving robot with randomly changing cells against A*."""
+    rng = np.random.default_rng(41)             # Seeded random generator
+    grid = read_grid(test_path / 'testpath5.txt')
+    passable = grid != OBSTACLE
+    robot, goal = find_cell(grid, ROBOT), find_cell(grid, GOAL)
+    planner = DStarLite(*grid_to_graph(grid))
+    for _ in range(10):
+        length, coords = planner.plan()
+        check_path(passable, robot, goal, length, coords)
+        if coords:                              # Move one step along path
+            robot = coords[-1]
+            planner.move_robot(robot)
+        changes = []
+        for _ in range(5):
+            cell = tuple(int(x) for x in rng.integers((0, 0), grid.shape))
+            if cell in (robot, goal):
+                continue
+            blocked = bool(rng.random() < 0.5)
+            passable[cell] = not blocked
+            changes.append((cell, blocked))
+        planner.update_cells(changes)
+
+
+def check_cost(grid, legend, diagonal, length, coords):
+    """Assert that the path is valid and matches the length of Djikstra's."""
+    expected = dijkstra_path(grid, legend, diagonal)[0]
+    assert length == pytest.approx(expected)
+    if length == np.inf:
+        return
+    costs = terrain_costs(grid, legend)
+    cells = [find_cell(grid, GOAL)] + coords + [find_cell(grid, ROBOT)]
+    total = 0
+    for (row, col), (r, c) in zip(cells, cells[1:]):
+        assert max(abs(r - row), abs(c - col)) == 1
+        corner = r != row and c != col
+        assert diagonal or not corner
+        if corner:                      # Does not cut an obstacle corner
+            assert costs[row, c] != np.inf and costs[r, col] != np.inf
+        total += move_cost(costs[row, col], costs[r, c], corner)
+    assert total == pytest.approx(length)
+
+
+def make_grid(text):
+    """Return grid of a map given as a string."""
+    return np.array([list(line.encode()) for line in text.split('\n')],
+                    dtype=np.uint8)
+
+
+@pytest.mark.parametrize('diagonal', [False, True],
+                         ids=lambda x: f'diagonal={x}')
+def test_dstar_lite_terrain(diagonal):
+    """Test diagonal moves and weighted terrain against Djikstra's."""
+    legend = {'~': 3, ',': 2}
+    for text in ('R...\n....\n...G', 'R.#.\n..#.\n...G', 'R~~G\n,,,,'):
+        grid = make_grid(text)
+        planner = DStarLite(*grid_to_graph(grid, False, legend, diagonal),
+                            legend, diagonal)
+        check_cost(grid, legend, diagonal, *planner.plan())
+    grid = make_grid('R...\n....\n...G')
+    planner = DStarLite(*grid_to_graph(grid, diagonal=diagonal),
+                        diagonal=diagonal)
+    assert planner.plan()[0] == pytest.approx(1 + 2 * np.sqrt(2)
+                                              if diagonal else 5)
+    rng = np.random.default_rng(17)             # Seeded random generator
+    for _ in range(20):
+        grid = rng.choice(np.frombuffer(b'...~,#', dtype=np.uint8), (6, 8))
+        cells = rng.choice(grid.size, 2, replace=False)
+        grid.ravel()[cells] = ROBOT, GOAL
+        original = grid.copy()
+        planner = DStarLite(*grid_to_graph(grid, False, legend, diagonal),
+                            legend, diagonal)
+        check_cost(grid, legend, diagonal, *planner.plan())
+        for _ in range(3):
+            changes = []
+            for cell in rng.choice(grid.size, 3, replace=False):
+                if cell in cells:
+                    continue
+                cell = divmod(int(cell), grid.shape[1])
+                blocked = bool(rng.random() < 0.5)
+                if blocked:
+                    grid[cell] = OBSTACLE
+                elif original[cell] == OBSTACLE:
+                    grid[cell] = ord('.')   # Reopened walls are floor
+                else:
+                    grid[cell] = original[cell]
+                changes.append((cell, blocked))
+            planner.update_cells(changes)
+            check_cost(grid, legend, diagonal, *planner.plan())
+
+
+def test_dstar_lite_costs():
+    """Test changing the traversal cost of cells."""
+    legend = {'~': 3, ',': 2}
+    grid = make_grid('R.#.\n..#.\n...G')
+    planner = DStarLite(*grid_to_graph(grid, False, legend), legend=legend)
+    check_cost(grid, legend, False, *planner.plan())
+    planner.update_cells([((0, 2), 2)])         # Wall becomes carpet
+    grid[0, 2] = ord(',')
+    check_cost(grid, legend, False, *planner.plan())
+    planner.update_cells([((0, 2), True), ((2, 1), 3)])
+    grid[0, 2], grid[2, 1] = OBSTACLE, ord('~')
+    check_cost(grid, legend, False, *planner.plan())
+    planner.update_cells([((0, 2), False)])     # Reopened with last cost
+    grid[0, 2] = ord(',')
+    check_cost(grid, legend, False, *planner.plan())
+    planner.update_cells([((1, 2), np.inf), ((0, 2), np.inf)])
+    grid[1, 2] = grid[0, 2] = OBSTACLE
+    check_cost(grid, legend, False, *planner.plan())
+    with pytest.raises(ValueError):
+        planner.update_cells([((0, 2), 0.5)])   # Cheaper than any cell
+
+
+def test_dstar_lite_rounding():
+    """Test keys differing by rounding error do not end the search early.
+
+    Blocking (2, 0) leaves the robot's key a bit below the least key in the
+    queue, although both are the same sum of diagonal move costs.
+    """
+    grid = make_grid('G#...\n....#\n..#..\n#...#\n.....\n#...R')
+    planner = DStarLite(*grid_to_graph(grid, diagonal=True), diagonal=True)
+    check_cost(grid, None, True, *planner.plan())
+    planner.update_cells([((2, 0), True)])
+    grid[2, 0] = OBSTACLE
+    length, coords = planner.plan()
+    check_cost(grid, None, True, length, coords)
+    assert length == pytest.approx(5 + 2 * np.sqrt(2))
+
+
+def test_dstar_lite_diagonal_walls():
+    """Test diagonal moves opened up on a graph without diagonal edges."""
+    grid = make_grid('R#.\n##G')
+    planner = DStarLite(*grid_to_graph(grid, diagonal=True), diagonal=True)
+    assert planner.plan()[0] == np.inf
+    planner.update_cells([((0, 1), False), ((1, 1), False)])
+    assert planner.plan()[0] == pytest.approx(1 + np.sqrt(2))
+
+
+def test_dstar_lite_inconsistent():
+    """Test inconsistent distances raise an error rather than looping."""
+    planner = DStarLite(*grid_to_graph(make_grid('R...\n....\n...G')))
+    planner.plan()
+    planner._g[:] = 0                   # No neighbor leads to the goal
+    planner._g[planner._goal] = np.inf
+    with pytest.raises(RuntimeError):
+        planner.plan()
+
+
+def test_dstar_lite_graph():
+    """Test the planner moves along the edges of the graph it is given."""
+    graph, robot, goal, vert_map = grid_to_graph(make_grid('R..\n...\n..G'))
+    planner = DStarLite(graph, robot, goal, vert_map)
+    assert planner.plan()[0] == 4
+    vertices = {coord: vertex for vertex, coord in vert_map}
+    for cell in ((0, 1), (1, 0)):               # Cut the robot off the map
+        graph.remove_edge(graph.get_edge(robot, vertices[cell]))
+    planner = DStarLite(graph, robot, goal, vert_map)
+    assert planner.plan() == (np.inf, [])
+    with pytest.raises(ValueError):             # Obstacles must have vertices
+        DStarLite(*grid_to_graph(make_grid('R#G'), prune_obstacles=True))
+    planner = DStarLite(*grid_to_graph(make_grid('R.\n.G'), diagonal=True))
+    with pytest.raises(ValueError):             # Diagonal moves in graph
+        planner.plan()
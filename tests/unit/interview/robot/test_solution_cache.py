@@ -0,0 +1,163 @@
+"""Test solution cache used to solve robot path programming test.
+
+###############################################################################
+# test_solution_cache.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the content-addressed, size-bounded cache of map
+#               solutions.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+import os
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.map_io import read_grid
+from interview.robot.robot_path import solve_map
+from interview.robot.solution_cache import SolutionCache, solution_key
+from interview.robot.solution_cache import HEADER_DTYPE
+
+
+# %% Test SolutionCache
+def test_round_trip(tmp_path):
+    """Test entries are stored compactly and read back unchanged."""
+    cache = SolutionCache(tmp_path / 'cache')
+    coords = [(3, 4), (3, 5), (2, 6), (1, 6), (1, 5)]   # Includes a diagonal
+    cache.put('a', 6, coords)
+    cache.put('b', 2.5, [])
+    cache.put('c', np.inf, [])
+    assert cache.get('a') == (6, coords)
+    assert isinstance(cache.get('a')[0], int)
+    assert cache.get('b') == (2.5, [])
+    assert cache.get('c') == (np.inf, [])
+    assert cache.get('d') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (4, 1, 3)
+    assert stats['bytes'] == 3 * HEADER_DTYPE.itemsize + len(coords) - 1
+    assert not list(cache.directory.glob('*.tmp'))  # Temporary files moved
+
+
+def test_tracked_bytes(tmp_path, monkeypatch):
+    """Test the directory is only scanned to evict, and deletes by others."""
+    entry_bytes = HEADER_DTYPE.itemsize + 1     # Path of two cells
+    cache = SolutionCache(tmp_path, max_bytes=2 * entry_bytes)
+    entries = cache._entries
+    scans = []
+
+    def scanned():
+        scans.append(1)
+        return entries()
+
+    monkeypatch.setattr(cache, '_entries', scanned)
+    cache.put('a', 3, [(0, 1), (0, 2)])
+    cache.put('b', 3, [(1, 1), (1, 2)])
+    cache.put('b', 3, [(1, 2), (1, 3)])         # Overwritten, same size
+    assert not scans
+    (tmp_path / 'a.path').unlink()              # Deleted by another process
+    cache.put('c', 3, [(2, 1), (2, 2)])
+    assert len(scans) == 1
+    assert cache.evictions == 0                 # Within bound after rescan
+    os.utime(tmp_path / 'b.path', ns=(1, 1))    # Least recently used
+    stale = entries()                           # Listed, then deleted
+    monkeypatch.setattr(cache, '_entries', lambda: stale)
+    (tmp_path / 'b.path').unlink()
+    cache.max_bytes = entry_bytes
+    cache.put('d', 3, [(3, 1), (3, 2)])
+    assert cache.evictions == 0                 # Entry b already gone
+    assert cache.get('c') is not None and cache.get('d') is not None
+
+
+def test_put_failure(tmp_path, monkeypatch):
+    """Test a failed write leaves neither an entry nor a temporary file."""
+    cache = SolutionCache(tmp_path)
+
+    def fail(src, dst):
+        raise OSError('Disk full!')
+
+    monkeypatch.setattr(os, 'replace', fail)
+    with pytest.raises(OSError):
+        cache.put('a', 3, [(0, 1), (0, 2)])
+    assert not list(tmp_path.iterdir())
+
+
+def test_eviction(tmp_path):
+    """Test the least recently used entries are evicted first."""
+    entry_bytes = HEADER_DTYPE.itemsize + 1     # Path of two cells
+    cache = SolutionCache(tmp_path, max_bytes=2 * entry_bytes)
+    cache.put('a', 3, [(0, 1), (0, 2)])
+    cache.put('b', 3, [(1, 1), (1, 2)])
+    # Make the order of use unambiguous despite the timestamp resolution
+    os.utime(tmp_path / 'a.path', ns=(1, 1))
+    os.utime(tmp_path / 'b.path', ns=(2, 2))
+    cache.get('a')                              # Entry a now most recent
+    cache.put('c', 3, [(2, 1), (2, 2)])
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.evictions == 1
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+
+
+def test_solution_key(tmp_path):
+    """Test keys depend on the map contents and options, not the filename."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#\n..G')
+    grid = read_grid(filename)
+    key = solution_key(grid, 'dijkstra')
+    (tmp_path / 'copy.txt').write_text('R.#\r\n..G\r\n')
+    assert solution_key(read_grid(tmp_path / 'copy.txt'), 'dijkstra') == key
+    assert solution_key(grid, 'astar') != key
+    assert solution_key(grid, 'dijkstra', {'~': 2}) != key
+    assert solution_key(grid, 'dijkstra', diagonal=True) != key
+    filename.write_text('R..\n..G')
+    assert solution_key(read_grid(filename), 'dijkstra') != key
+
+
+def test_solve_map_cache(tmp_path):
+    """Test a cache hit skips the search but writes the same solution."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('R.#.\n..#.\n...G')
+    cache = SolutionCache(tmp_path / 'cache')
+    out_fn, length = solve_map(filename, cache=cache)
+    expected = out_fn.read_bytes()
+    out_fn.unlink()
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert solve_map(filename, cache=cache) == (out_fn, length)
+    assert out_fn.read_bytes() == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    solve_map(filename, 'astar', cache=cache)   # Different options
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_corrupt_entries(tmp_path, monkeypatch):
+    """Test corrupt and vanishing entries count as misses."""
+    cache = SolutionCache(tmp_path)
+    cache.put('a', 3, [(0, 1), (0, 2), (1, 3)])
+    data = (tmp_path / 'a.path').read_bytes()
+    for corrupt in (data[:10], data[:-2] + bytes([4, 9])):
+        (tmp_path / 'a.path').write_bytes(corrupt)
+        assert cache.get('a') is None
+        assert not (tmp_path / 'a.path').exists()  # Bad entry deleted
+    assert cache.misses == 2 and cache.hits == 0
+    cache.put('a', 3, [(0, 1), (0, 2), (1, 3)])
+    assert cache.stats()['bytes'] == len(data)
+
+    def evicted(filename):
+        filename.unlink()               # Evicted by another process
+        raise FileNotFoundError(filename)
+
+    monkeypatch.setattr(os, 'utime', evicted)
+    assert cache.get('a') is None
+    assert cache.misses == 3
@@ -0,0 +1,136 @@
+"""Test tiled out-of-core search used to solve robot path programming test.
+
+###############################################################################
+# test_tiled.py
+#
+# Revision:     1.00
+# Date:         10/17/2026
+# Author:       Alex
+#
+# Purpose:      Unit test the memory-mapped grid, the bounded tile cache, and
+#               the A* search that pages tiles in and out.
+#
+###############################################################################
+"""
+
+# %% Imports
+# Standard system imports
+
+# Related third party imports
+import pytest
+import numpy as np
+
+# Local application/library specific imports
+from interview.robot.grid_search import astar
+from interview.robot.map_io import read_grid, OBSTACLE
+from interview.robot.tiled import MappedGrid, TileCache, BYTES_PER_CELL
+from interview.robot.tiled import tiled_search, tiled_solution
+
+
+# %% Helper functions
+def write_map(filename, grid, newline='\n', trailing=''):
+    """Write a character grid to a map file."""
+    text = newline.join(row.tobytes().decode() for row in grid) + trailing
+    filename.write_bytes(text.encode())
+
+
+def budget(tile_size, tiles):
+    """Return memory budget in bytes holding the given number of tiles."""
+    return tile_size**2 * BYTES_PER_CELL * tiles
+
+
+# %% Test MappedGrid
+@pytest.mark.parametrize('newline', ['\n', '\r\n'], ids=['LF', 'CRLF'])
+def test_mapped_grid(tmp_path, newline):
+    """Test the memory-mapped grid matches the grid read by read_grid."""
+    filename = tmp_path / 'map.txt'
+    filename.write_bytes(newline.join(['#R..', '#..#', '..G#', 'R...'])
+                         .encode() + newline.encode() * 2)
+    mapped = MappedGrid(filename)
+    assert mapped.shape == (4, 4)
+    assert np.array_equal(mapped.grid, read_grid(filename))
+    assert mapped.find('R') == (3, 0)           # Last occurrence
+    assert mapped.find('G') == (2, 2)
+    with pytest.raises(ValueError):
+        mapped.find('X')
+
+
+def test_mapped_grid_invalid(tmp_path):
+    """Test that empty and ragged maps raise ValueError."""
+    filename = tmp_path / 'map.txt'
+    filename.write_text('\n\n')
+    with pytest.raises(ValueError):
+        MappedGrid(filename)
+    filename.write_text('#R..\n#..\n..G#')
+    with pytest.raises(ValueError):
+        MappedGrid(filename)
+
+
+# %% Test TileCache
+def test_tile_cache(tmp_path):
+    """Test tiles are evicted in least-recently-used order."""
+    filename = tmp_path / 'map.txt'
+    write_map(filename, np.full((4, 6), ord('.'), dtype=np.uint8))
+    mapped = MappedGrid(filename)
+    with pytest.raises(ValueError):
+        TileCache(mapped, 2, budget(2, 1))      # Budget below two tiles
+    cache = TileCache(mapped, 2, budget(2, 2))
+    tile = cache.tile(0, 0)
+    tile._dist[1, 1] = 7                        # Search state of cell (1, 1)
+    cache.tile(0, 2)
+    assert cache.tile(1, 1) is tile             # Still cached
+    assert (cache.loads, cache.evictions) == (2, 0)
+    cache.tile(2, 4)                            # Evicts tile of cell (0, 2)
+    assert (cache.loads, cache.evictions) == (3, 1)
+    cache.tile(3, 5)
+    cache.tile(0, 3)                            # Evicts tile of cell (0, 0)
+    assert cache.tile(1, 1)._dist[1, 1] == 7    # Reloaded from scratch file
+    assert (cache.loads, cache.evictions) == (5, 3)
+    cache.close()
+
+
+# %% Test tiled_search()
+def test_tiled_search_rng(tmp_path):
+    """Test tiled_search against A* on randomly generated maps.
+
+    The path lengths must match whatever the tile size and memory budget, and
+    the path must be a sequence of adjacent open cells.
+    """
+    rng = np.random.default_rng(16)             # Seeded random generator
+    filename = tmp_path / 'map.txt'
+    for _ in range(50):
+        nrows, ncols = rng.integers(2, 30, size=2)
+        grid = np.where(rng.random((nrows, ncols)) < rng.random() * 0.45,
+                        OBSTACLE, ord('.')).astype(np.uint8)
+        cells = np.argwhere(np.ones_like(grid))
+        robot, goal = (tuple(int(x) for x in cells[idx]) for idx in
+                       rng.choice(len(cells), size=2, replace=False))
+        grid[robot], grid[goal] = ord('R'), ord('G')
+        write_map(filename, grid)
+        tile_size = int(rng.integers(2, 8))
+        stats = {}
+        length, coords = tiled_search(MappedGrid(filename), robot, goal,
+                                      tile_size, budget(tile_size, 2), stats)
+        assert length == astar(grid != OBSTACLE, robot, goal)[0]
+        assert stats['tile_loads'] - stats['tile_evictions'] <= 2
+        if length == np.inf:
+            assert coords == []
+            continue
+        path = [goal] + coords + [robot]
+        assert len(path) == length + 1
+        assert all(grid[cell] != OBSTACLE for cell in path)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+def test_tiled_solution(tmp_path):
+    """Test the solution file is the map with the path marked in place."""
+    filename = tmp_path / 'map.txt'
+    filename.write_bytes(b'R.#.\r\n..#.\r\n...G\r\n')
+    stats = {}
+    out_fn, length = tiled_solution(filename, 2, budget(2, 2), stats)
+    assert out_fn == tmp_path / 'map_SOLUTION.txt'
+    assert length == 5
+    assert out_fn.read_bytes() == b'R.#.\r\nO.#.\r\nOOOG\r\n'
+    assert stats['tile_loads'] >= 4             # Every tile touched
+    assert stats['tile_evictions'] >= 2